@@ -0,0 +1,32 @@
+"""뉴스 URL 유니크 인덱스 추가
+
+Revision ID: 20260830_01
+Revises:
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_01"       # 현재 revision ID (고유 값)
+down_revision = None  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    중복 판별 키를 제목에서 URL로 바꾸면서, INSERT ... ON CONFLICT (url)이
+    인덱스 탐색 한 번으로 끝나도록 유니크 인덱스를 추가한다.
+    """
+    op.create_index("ix_news_url", "news", ["url"], unique=True)
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.drop_index("ix_news_url", table_name="news")
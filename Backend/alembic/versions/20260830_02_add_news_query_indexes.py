@@ -0,0 +1,55 @@
+"""뉴스 조회용 인덱스 추가
+
+Revision ID: 20260830_02
+Revises: 20260830_01
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_02"       # 현재 revision ID (고유 값)
+down_revision = "20260830_01"  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    최신/카테고리별/트렌딩/미처리 뉴스 조회가 매번 필터 결과를
+    정렬하지 않고 인덱스 범위 스캔으로 끝나도록 한다.
+    """
+    # get_news_by_category / get_recent_news(category_id=...)
+    op.create_index(
+        "ix_news_cat_pub",
+        "news",
+        ["category_id", sa.text("published_at DESC")],
+    )
+    # get_recent_news (전체 최신순)
+    op.create_index("ix_news_pub", "news", [sa.text("published_at DESC")])
+    # get_trending_news (최근 N시간 + 조회수 정렬)
+    op.create_index(
+        "ix_news_trending",
+        "news",
+        [sa.text("published_at DESC"), sa.text("view_count DESC")],
+    )
+    # get_unprocessed_news - 처리 완료되면 인덱스에서 빠지는 부분 인덱스
+    op.create_index(
+        "ix_news_unprocessed",
+        "news",
+        ["created_at"],
+        postgresql_where=sa.text("is_processed = false"),
+    )
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.drop_index("ix_news_unprocessed", table_name="news")
+    op.drop_index("ix_news_trending", table_name="news")
+    op.drop_index("ix_news_pub", table_name="news")
+    op.drop_index("ix_news_cat_pub", table_name="news")
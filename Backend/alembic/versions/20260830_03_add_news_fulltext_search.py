@@ -0,0 +1,53 @@
+"""뉴스 전문 검색 인덱스 추가
+
+Revision ID: 20260830_03
+Revises: 20260830_02
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_03"       # 현재 revision ID (고유 값)
+down_revision = "20260830_02"  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    LIKE '%kw%' 3종 순차 스캔 대신 tsvector 생성 컬럼 + GIN 인덱스로
+    전문 검색을 처리한다. 짧은 검색어 폴백용으로 제목에 pg_trgm
+    트라이그램 인덱스도 함께 만든다.
+    """
+    op.execute(
+        """
+        ALTER TABLE news ADD COLUMN search tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector(
+                'simple',
+                coalesce(title, '') || ' ' ||
+                coalesce(summary, '') || ' ' ||
+                coalesce(content, '')
+            )
+        ) STORED
+        """
+    )
+    op.execute("CREATE INDEX ix_news_search ON news USING gin(search)")
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_news_title_trgm ON news USING gin(title gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.execute("DROP INDEX IF EXISTS ix_news_title_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_news_search")
+    op.execute("ALTER TABLE news DROP COLUMN IF EXISTS search")
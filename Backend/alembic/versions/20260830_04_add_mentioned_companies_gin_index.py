@@ -0,0 +1,36 @@
+"""언급 기업 배열 GIN 인덱스 추가
+
+Revision ID: 20260830_04
+Revises: 20260830_03
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_04"       # 현재 revision ID (고유 값)
+down_revision = "20260830_03"  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    맞춤 뉴스의 기업 필터가 배열 겹침(&&) 연산자를 쓰므로
+    mentioned_companies 컬럼에 GIN 인덱스를 만들어
+    기업 수와 무관하게 한 번의 인덱스 탐색으로 처리한다.
+    """
+    op.execute(
+        "CREATE INDEX ix_news_mentioned_companies "
+        "ON news USING gin(mentioned_companies)"
+    )
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.execute("DROP INDEX IF EXISTS ix_news_mentioned_companies")
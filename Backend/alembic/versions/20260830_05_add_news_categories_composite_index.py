@@ -0,0 +1,37 @@
+"""뉴스-카테고리 매핑 복합 인덱스 추가
+
+Revision ID: 20260830_05
+Revises: 20260830_04
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_05"       # 현재 revision ID (고유 값)
+down_revision = "20260830_04"  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    개인화 필터의 상관 EXISTS 서브쿼리
+    (news_id = news.id AND category_id IN (...))가
+    인덱스 전용 스캔으로 끝나도록 복합 인덱스를 만든다.
+    """
+    op.create_index(
+        "ix_news_categories_news_category",
+        "news_categories",
+        ["news_id", "category_id"],
+    )
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.drop_index("ix_news_categories_news_category", table_name="news_categories")
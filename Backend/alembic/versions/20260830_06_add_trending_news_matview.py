@@ -0,0 +1,49 @@
+"""트렌딩 뉴스 구체화 뷰 추가
+
+Revision ID: 20260830_06
+Revises: 20260830_05
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_06"       # 현재 revision ID (고유 값)
+down_revision = "20260830_05"  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    트렌딩 뉴스 조회(논쟁 우선 + 최신순)를 호출마다 필터/정렬하지 않고
+    최근 24시간 상위 200건을 구체화 뷰로 미리 계산해 둔다.
+    스케줄러가 10분마다 CONCURRENTLY 갱신하며, 이를 위해
+    고유 인덱스가 필요하다.
+    """
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_trending_news AS
+        SELECT id, title, summary, source_name, source_url, published_at,
+               sentiment_score, sentiment_label, is_controversial,
+               mentioned_companies
+        FROM news
+        WHERE is_active AND is_processed
+          AND published_at >= now() - interval '24 hours'
+        ORDER BY is_controversial DESC, published_at DESC
+        LIMIT 200
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_trending_news_id ON mv_trending_news(id)"
+    )
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_trending_news")
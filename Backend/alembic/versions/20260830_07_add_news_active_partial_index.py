@@ -0,0 +1,40 @@
+"""활성·처리 완료 뉴스 부분 커버링 인덱스 추가
+
+Revision ID: 20260830_07
+Revises: 20260830_06
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_07"       # 현재 revision ID (고유 값)
+down_revision = "20260830_06"  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    개인화/트렌딩 조회는 전부 is_active AND is_processed 필터에
+    published_at DESC 정렬이므로, 그 조건을 WHERE 절에 박은 부분
+    인덱스를 만들어 정렬 단계 없이 인덱스 스캔만으로 끝나게 한다.
+    INCLUDE로 자주 읽는 컬럼을 실어 인덱스 전용 스캔을 노린다.
+    """
+    op.execute(
+        """
+        CREATE INDEX ix_news_active_pub ON news (published_at DESC)
+        INCLUDE (id, title, summary, sentiment_score, is_controversial)
+        WHERE is_active AND is_processed
+        """
+    )
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.execute("DROP INDEX IF EXISTS ix_news_active_pub")
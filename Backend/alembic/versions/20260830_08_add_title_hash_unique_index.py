@@ -0,0 +1,54 @@
+"""제목 해시 생성 컬럼과 유니크 인덱스 추가
+
+Revision ID: 20260830_08
+Revises: 20260830_07
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_08"       # 현재 revision ID (고유 값)
+down_revision = "20260830_07"  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    제목 완전 중복 판별을 파이썬 집합 비교 대신 DB에 맡긴다.
+    정규화된 제목의 64비트 해시를 생성 컬럼으로 두고 유니크
+    인덱스를 걸면 INSERT ... ON CONFLICT DO NOTHING이 과거
+    실행분까지 포함해 같은 제목을 걸러낸다.
+    """
+    # 기존 데이터의 제목 중복은 가장 먼저 저장된 행만 남긴다
+    op.execute(
+        """
+        DELETE FROM news a
+        USING news b
+        WHERE a.id > b.id
+          AND lower(btrim(a.title)) = lower(btrim(b.title))
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE news ADD COLUMN title_hash BIGINT
+        GENERATED ALWAYS AS (
+            hashtextextended(lower(btrim(title)), 0)
+        ) STORED
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_news_title_hash ON news(title_hash)"
+    )
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.execute("DROP INDEX IF EXISTS ix_news_title_hash")
+    op.execute("ALTER TABLE news DROP COLUMN IF EXISTS title_hash")
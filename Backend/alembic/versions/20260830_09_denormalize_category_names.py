@@ -0,0 +1,85 @@
+"""뉴스 카테고리명 배열 비정규화
+
+Revision ID: 20260830_09
+Revises: 20260830_08
+Create Date: 2026-08-30
+
+"""
+from alembic import op   # Alembic에서 제공하는 마이그레이션 작업 함수들 (테이블 추가/삭제, 컬럼 변경 등)
+import sqlalchemy as sa  # SQLAlchemy (컬럼, 타입 정의 등에 사용)
+
+# revision identifiers, used by Alembic.
+revision = "20260830_09"       # 현재 revision ID (고유 값)
+down_revision = "20260830_08"  # 이전 revision ID
+branch_labels = None  # 브랜치 라벨 (특별한 경우에만 사용)
+depends_on = None        # 다른 마이그레이션에 의존성이 있을 경우 지정
+
+
+def upgrade() -> None:
+    """
+    upgrade(): 마이그레이션 '적용' 시 실행되는 함수
+
+    개인화 응답마다 news_categories 조인을 타지 않도록 카테고리명
+    배열을 news에 비정규화한다. 기존 데이터는 매핑 테이블과 직접
+    category_id 양쪽에서 채우고, 이후 매핑 변경은 트리거가 배열을
+    따라 갱신한다.
+    """
+    op.execute("ALTER TABLE news ADD COLUMN category_names TEXT[] DEFAULT '{}'")
+
+    # 기존 행 백필 (매핑 테이블 ∪ 직접 카테고리)
+    op.execute(
+        """
+        UPDATE news SET category_names = (
+            SELECT COALESCE(array_agg(DISTINCT name), '{}') FROM (
+                SELECT c.name
+                FROM news_categories nc
+                JOIN categories c ON c.id = nc.category_id
+                WHERE nc.news_id = news.id
+                UNION
+                SELECT c.name FROM categories c WHERE c.id = news.category_id
+            ) AS names(name)
+        )
+        """
+    )
+
+    op.execute(
+        "CREATE INDEX ix_news_category_names ON news USING gin(category_names)"
+    )
+
+    # 매핑 테이블 변경 시 배열을 따라 갱신하는 트리거
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION sync_news_category_names() RETURNS trigger AS $$
+        DECLARE
+            target_news_id INTEGER;
+        BEGIN
+            target_news_id := COALESCE(NEW.news_id, OLD.news_id);
+            UPDATE news SET category_names = (
+                SELECT COALESCE(array_agg(DISTINCT c.name), '{}')
+                FROM news_categories nc
+                JOIN categories c ON c.id = nc.category_id
+                WHERE nc.news_id = target_news_id
+            )
+            WHERE id = target_news_id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_news_category_names
+        AFTER INSERT OR UPDATE OR DELETE ON news_categories
+        FOR EACH ROW EXECUTE FUNCTION sync_news_category_names()
+        """
+    )
+
+
+def downgrade() -> None:
+    """
+    downgrade(): 마이그레이션 '롤백' 시 실행되는 함수
+    """
+    op.execute("DROP TRIGGER IF EXISTS trg_news_category_names ON news_categories")
+    op.execute("DROP FUNCTION IF EXISTS sync_news_category_names()")
+    op.execute("DROP INDEX IF EXISTS ix_news_category_names")
+    op.execute("ALTER TABLE news DROP COLUMN IF EXISTS category_names")
@@ -15,7 +15,9 @@ from app.schemas.auth import (
     UserResponse, TokenValidationRequest, TokenValidationResponse,
     UserUpdateRequest
 )
-from app.services.auth_service import AuthService
+from app.services.auth_service import (
+    AuthService, get_cached_user_response, cache_user_response
+)
 from app.utils.auth import AuthError
 import logging
 
@@ -56,6 +58,9 @@ async def google_login(
             last_login_at=user.last_login_at
         )
         
+        # 후속 토큰 검증에서 재사용하도록 캐시
+        cache_user_response(auth_result["access_token"], user_response)
+
         return LoginResponse(
             access_token=auth_result["access_token"],
             token_type=auth_result["token_type"],
@@ -156,8 +161,17 @@ async def validate_token(request: TokenValidationRequest) -> TokenValidationResp
     - 토큰이 유효한 경우 사용자 정보도 함께 반환
     """
     try:
+        # 최근 검증된 토큰이면 UserResponse 재구성 없이 바로 반환
+        cached_user = get_cached_user_response(request.token)
+        if cached_user:
+            return TokenValidationResponse(
+                valid=True,
+                user=cached_user,
+                message=None
+            )
+
         validation_result = await AuthService.validate_token(request.token)
-        
+
         if validation_result["valid"]:
             user_info = validation_result["user"]
             user_response = UserResponse(
@@ -170,7 +184,9 @@ async def validate_token(request: TokenValidationRequest) -> TokenValidationResp
                 email_notifications_enabled=True,
                 email_send_time="19:00"
             )
-            
+
+            cache_user_response(request.token, user_response)
+
             return TokenValidationResponse(
                 valid=True,
                 user=user_response,
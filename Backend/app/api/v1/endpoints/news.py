@@ -19,7 +19,7 @@ from app.models.news import News
 router = APIRouter()
 
 
-@router.get("/", response_model=NewsListResponse)
+@router.get("/", response_model=NewsListResponse, response_model_exclude_none=True)
 async def get_news(
     category_id: Optional[int] = Query(None, description="카테고리 ID"),
     limit: int = Query(20, ge=1, le=100, description="조회할 뉴스 수"),
@@ -44,7 +44,7 @@ async def get_news(
         raise HTTPException(status_code=500, detail=f"뉴스 조회 실패: {str(e)}")
 
 
-@router.get("/trending", response_model=List[NewsResponse])
+@router.get("/trending", response_model=List[NewsResponse], response_model_exclude_none=True)
 async def get_trending_news(
     hours: int = Query(24, ge=1, le=168, description="시간 범위"),
     limit: int = Query(10, ge=1, le=50, description="조회할 뉴스 수")
@@ -58,7 +58,7 @@ async def get_trending_news(
         raise HTTPException(status_code=500, detail=f"트렌딩 뉴스 조회 실패: {str(e)}")
 
 
-@router.get("/category/{category_name}", response_model=List[NewsResponse])
+@router.get("/category/{category_name}", response_model=List[NewsResponse], response_model_exclude_none=True)
 async def get_news_by_category(
     category_name: str,
     limit: int = Query(10, ge=1, le=50, description="조회할 뉴스 수")
@@ -75,7 +75,7 @@ async def get_news_by_category(
         raise HTTPException(status_code=500, detail=f"카테고리별 뉴스 조회 실패: {str(e)}")
 
 
-@router.get("/search", response_model=List[NewsResponse])
+@router.get("/search", response_model=List[NewsResponse], response_model_exclude_none=True)
 async def search_news(
     q: str = Query(..., min_length=1, description="검색 키워드"),
     category_id: Optional[int] = Query(None, description="카테고리 ID"),
@@ -94,7 +94,7 @@ async def search_news(
         raise HTTPException(status_code=500, detail=f"뉴스 검색 실패: {str(e)}")
 
 
-@router.get("/{news_id}", response_model=NewsResponse)
+@router.get("/{news_id}", response_model=NewsResponse, response_model_exclude_none=True)
 async def get_news_detail(news_id: int) -> NewsResponse:
     """뉴스 상세 조회"""
     try:
@@ -11,6 +11,7 @@ from app.core.database import get_db
 from app.core.auth import get_current_user, require_admin
 from app.models.user import User
 from app.models.feedback import Feedback, FeedbackStatus, FeedbackCategory
+from app.schemas.common import Pagination
 from app.schemas.feedback import (
     FeedbackCreateRequest,
     FeedbackResponse,
@@ -59,7 +60,7 @@ async def create_feedback(
         raise HTTPException(status_code=500, detail=f"건의사항 제출 실패: {str(e)}")
 
 
-@router.get("/my", response_model=List[FeedbackResponse])
+@router.get("/my", response_model=List[FeedbackResponse], response_model_exclude_none=True)
 async def get_my_feedbacks(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -96,7 +97,7 @@ async def get_my_feedbacks(
         raise HTTPException(status_code=500, detail=f"건의사항 조회 실패: {str(e)}")
 
 
-@router.get("/{feedback_id}", response_model=FeedbackResponse)
+@router.get("/{feedback_id}", response_model=FeedbackResponse, response_model_exclude_none=True)
 async def get_feedback_detail(
     feedback_id: int,
     current_user: User = Depends(get_current_user),
@@ -224,7 +225,7 @@ async def delete_feedback(
 
 
 # 관리자 전용 엔드포인트들
-@router.get("/admin/list", response_model=FeedbackListResponse)
+@router.get("/admin/list", response_model=FeedbackListResponse, response_model_exclude_none=True)
 async def get_admin_feedbacks(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
@@ -273,12 +274,12 @@ async def get_admin_feedbacks(
         
         return FeedbackListResponse(
             feedbacks=feedback_responses,
-            pagination={
-                "page": page,
-                "size": size,
-                "total": total,
-                "pages": (total + size - 1) // size
-            }
+            pagination=Pagination(
+                page=page,
+                size=size,
+                total=total,
+                pages=(total + size - 1) // size
+            )
         )
         
     except Exception as e:
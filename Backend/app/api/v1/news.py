@@ -19,7 +19,7 @@ from app.schemas.news import NewsResponse, NewsListResponse, NewsSummaryResponse
 router = APIRouter()
 
 
-@router.get("/", response_model=NewsListResponse)
+@router.get("/", response_model=NewsListResponse, response_model_exclude_none=True)
 async def get_news_list(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
@@ -87,7 +87,7 @@ async def get_news_list(
         raise HTTPException(status_code=500, detail=f"뉴스 목록 조회 실패: {str(e)}")
 
 
-@router.get("/{news_id}", response_model=NewsResponse)
+@router.get("/{news_id}", response_model=NewsResponse, response_model_exclude_none=True)
 async def get_news_detail(
     news_id: int,
     db: Session = Depends(get_db),
@@ -110,7 +110,7 @@ async def get_news_detail(
     return NewsResponse.from_orm(news)
 
 
-@router.get("/categories/{category_name}", response_model=NewsListResponse)
+@router.get("/categories/{category_name}", response_model=NewsListResponse, response_model_exclude_none=True)
 async def get_news_by_category(
     category_name: str,
     page: int = Query(1, ge=1),
@@ -156,7 +156,7 @@ async def get_news_by_category(
         raise HTTPException(status_code=500, detail=f"카테고리 뉴스 조회 실패: {str(e)}")
 
 
-@router.get("/companies/{company_name}", response_model=NewsListResponse)
+@router.get("/companies/{company_name}", response_model=NewsListResponse, response_model_exclude_none=True)
 async def get_news_by_company(
     company_name: str,
     page: int = Query(1, ge=1),
@@ -271,7 +271,7 @@ async def get_company_sentiment_analysis(
         raise HTTPException(status_code=500, detail=f"감정분석 조회 실패: {str(e)}")
 
 
-@router.get("/controversial/", response_model=NewsListResponse)
+@router.get("/controversial/", response_model=NewsListResponse, response_model_exclude_none=True)
 async def get_controversial_news(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
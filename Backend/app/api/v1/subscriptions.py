@@ -295,7 +295,7 @@ async def send_test_email_to_user(
         success = await send_daily_news_email(
             user_email=current_user.email,
             user_name=current_user.name or "사용자",
-            personalized_data=content["news_data"]
+            personalized_data=content.news_data
         )
         
         if success:
@@ -70,6 +70,8 @@ class Settings(BaseSettings):
     # AI API
     OPENAI_API_KEY: str = ""
     GEMINI_API_KEY: str = ""
+    LLM_RPM: int = 60  # LLM API 분당 요청 한도
+    AI_CONCURRENCY: int = 10  # AI 배치 처리 동시 실행 수
     
     # 이메일 (SMTP)
     SMTP_SERVER: str = "smtp.gmail.com"
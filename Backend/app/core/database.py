@@ -19,6 +19,10 @@ engine = create_async_engine(
     str(settings.DATABASE_URL).replace("postgresql://", "postgresql+asyncpg://"),
     echo=settings.DEBUG,
     future=True,
+    # 요청/크롤링이 겹쳐도 세션마다 새 연결을 만들지 않도록 풀 크기 고정
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
 )
 
 async_session = sessionmaker(
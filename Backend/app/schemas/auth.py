@@ -1,48 +1,98 @@
 """
 Authentication related Pydantic schemas
 """
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+# OpenAPI 예시 딕셔너리 (모듈 스코프에 한 번만 정의하여 스키마 생성 시 재평가/복사 방지)
+_GOOGLE_LOGIN_REQUEST_EXAMPLE = {
+    "example": {
+        "access_token": "google_oauth_token_here"
+    }
+}
+
+_LOGIN_RESPONSE_EXAMPLE = {
+    "example": {
+        "access_token": "jwt.token.here",
+        "token_type": "bearer",
+        "expires_in": 3600,
+        "user": {
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "email": "user@example.com",
+            "display_name": "홍길동",
+            "avatar_url": "https://example.com/avatar.jpg"
+        }
+    }
+}
+
+_USER_RESPONSE_EXAMPLE = {
+    "example": {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "supabase_id": "123e4567-e89b-12d3-a456-426614174000",
+        "email": "user@example.com",
+        "display_name": "홍길동",
+        "avatar_url": "https://example.com/avatar.jpg",
+        "is_active": True,
+        "email_notifications_enabled": True,
+        "email_send_time": "19:00",
+        "created_at": "2024-01-01T00:00:00Z",
+        "last_login_at": "2024-01-01T12:00:00Z"
+    }
+}
+
+_USER_UPDATE_REQUEST_EXAMPLE = {
+    "example": {
+        "display_name": "김뉴스",
+        "email_notifications_enabled": True,
+        "email_send_time": "18:30"
+    }
+}
+
+_TOKEN_VALIDATION_REQUEST_EXAMPLE = {
+    "example": {
+        "token": "jwt.token.here"
+    }
+}
+
+_TOKEN_VALIDATION_RESPONSE_EXAMPLE = {
+    "example": {
+        "valid": True,
+        "user": {
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "email": "user@example.com",
+            "display_name": "홍길동"
+        },
+        "message": None
+    }
+}
+
+_LOGOUT_RESPONSE_EXAMPLE = {
+    "example": {
+        "message": "성공적으로 로그아웃되었습니다"
+    }
+}
+
+_AUTH_ERROR_RESPONSE_EXAMPLE = {
+    "example": {
+        "detail": "유효하지 않은 토큰입니다",
+        "error_code": "INVALID_TOKEN"
+    }
+}
+
+
 class GoogleLoginRequest(BaseModel):
     """구글 로그인 요청 스키마"""
     access_token: str = Field(..., description="구글 OAuth Access Token")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "access_token": "google_oauth_token_here"
-            }
-        }
-
-class LoginResponse(BaseModel):
-    """로그인 응답 스키마"""
-    access_token: str = Field(..., description="Supabase JWT 토큰")
-    token_type: str = Field(default="bearer", description="토큰 타입")
-    expires_in: Optional[int] = Field(None, description="토큰 만료 시간(초)")
-    user: "UserResponse" = Field(..., description="사용자 정보")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "access_token": "jwt.token.here",
-                "token_type": "bearer", 
-                "expires_in": 3600,
-                "user": {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "email": "user@example.com",
-                    "display_name": "홍길동",
-                    "avatar_url": "https://example.com/avatar.jpg"
-                }
-            }
-        }
+        json_schema_extra = _GOOGLE_LOGIN_REQUEST_EXAMPLE
 
 class UserResponse(BaseModel):
     """사용자 정보 응답 스키마"""
     id: str = Field(..., description="사용자 ID")
     supabase_id: Optional[str] = Field(None, description="Supabase 사용자 ID")
-    email: EmailStr = Field(..., description="이메일 주소")
+    email: str = Field(..., description="이메일 주소")
     display_name: Optional[str] = Field(None, description="표시 이름")
     avatar_url: Optional[str] = Field(None, description="프로필 이미지 URL")
     is_active: bool = Field(True, description="활성 상태")
@@ -52,21 +102,20 @@ class UserResponse(BaseModel):
     last_login_at: Optional[datetime] = Field(None, description="마지막 로그인 일시")
     
     class Config:
+        frozen = True
         from_attributes = True
-        json_schema_extra = {
-            "example": {
-                "id": "123e4567-e89b-12d3-a456-426614174000",
-                "supabase_id": "123e4567-e89b-12d3-a456-426614174000",
-                "email": "user@example.com",
-                "display_name": "홍길동",
-                "avatar_url": "https://example.com/avatar.jpg",
-                "is_active": True,
-                "email_notifications_enabled": True,
-                "email_send_time": "19:00",
-                "created_at": "2024-01-01T00:00:00Z",
-                "last_login_at": "2024-01-01T12:00:00Z"
-            }
-        }
+        json_schema_extra = _USER_RESPONSE_EXAMPLE
+
+class LoginResponse(BaseModel):
+    """로그인 응답 스키마"""
+    access_token: str = Field(..., description="Supabase JWT 토큰")
+    token_type: str = Field(default="bearer", description="토큰 타입")
+    expires_in: Optional[int] = Field(None, description="토큰 만료 시간(초)")
+    user: UserResponse = Field(..., description="사용자 정보")
+    
+    class Config:
+        frozen = True
+        json_schema_extra = _LOGIN_RESPONSE_EXAMPLE
 
 class UserUpdateRequest(BaseModel):
     """사용자 정보 수정 요청 스키마"""
@@ -75,24 +124,14 @@ class UserUpdateRequest(BaseModel):
     email_send_time: Optional[str] = Field(None, pattern=r"^([01]?[0-9]|2[0-3]):[0-5][0-9]$", description="이메일 발송 시간 (HH:MM)")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "display_name": "김뉴스",
-                "email_notifications_enabled": True,
-                "email_send_time": "18:30"
-            }
-        }
+        json_schema_extra = _USER_UPDATE_REQUEST_EXAMPLE
 
 class TokenValidationRequest(BaseModel):
     """토큰 검증 요청 스키마"""
     token: str = Field(..., description="검증할 JWT 토큰")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "token": "jwt.token.here"
-            }
-        }
+        json_schema_extra = _TOKEN_VALIDATION_REQUEST_EXAMPLE
 
 class TokenValidationResponse(BaseModel):
     """토큰 검증 응답 스키마"""
@@ -101,28 +140,16 @@ class TokenValidationResponse(BaseModel):
     message: Optional[str] = Field(None, description="에러 메시지 (유효하지 않은 경우)")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "valid": True,
-                "user": {
-                    "id": "123e4567-e89b-12d3-a456-426614174000",
-                    "email": "user@example.com",
-                    "display_name": "홍길동"
-                },
-                "message": None
-            }
-        }
+        frozen = True
+        json_schema_extra = _TOKEN_VALIDATION_RESPONSE_EXAMPLE
 
 class LogoutResponse(BaseModel):
     """로그아웃 응답 스키마"""
     message: str = Field(..., description="로그아웃 메시지")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "성공적으로 로그아웃되었습니다"
-            }
-        }
+        frozen = True
+        json_schema_extra = _LOGOUT_RESPONSE_EXAMPLE
 
 class AuthErrorResponse(BaseModel):
     """인증 오류 응답 스키마"""
@@ -130,12 +157,5 @@ class AuthErrorResponse(BaseModel):
     error_code: Optional[str] = Field(None, description="오류 코드")
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "detail": "유효하지 않은 토큰입니다",
-                "error_code": "INVALID_TOKEN"
-            }
-        }
-
-# Forward reference 해결
-LoginResponse.model_rebuild()
\ No newline at end of file
+        frozen = True
+        json_schema_extra = _AUTH_ERROR_RESPONSE_EXAMPLE
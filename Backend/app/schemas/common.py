@@ -0,0 +1,13 @@
+"""
+공통 Pydantic 스키마
+여러 응답 모델에서 재사용되는 구조 정의
+"""
+from pydantic import BaseModel, Field
+
+
+class Pagination(BaseModel):
+    """페이지네이션 정보 스키마"""
+    page: int = Field(..., description="현재 페이지")
+    size: int = Field(..., description="페이지 크기")
+    total: int = Field(..., description="전체 항목 수")
+    pages: int = Field(..., description="전체 페이지 수")
@@ -6,6 +6,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 
 from app.models.feedback import FeedbackStatus, FeedbackCategory
+from app.schemas.common import Pagination
 
 
 class FeedbackCreateRequest(BaseModel):
@@ -15,6 +16,9 @@ class FeedbackCreateRequest(BaseModel):
     category: FeedbackCategory = Field(default=FeedbackCategory.OTHER, description="건의사항 카테고리")
     contact_email: Optional[str] = Field(None, description="별도 연락처 이메일 (선택사항)")
 
+    class Config:
+        use_enum_values = True
+
 
 class FeedbackResponse(BaseModel):
     """건의사항 응답 스키마"""
@@ -33,6 +37,11 @@ class FeedbackResponse(BaseModel):
     user_email: str
     user_name: Optional[str] = None
 
+    class Config:
+        frozen = True
+        # enum 값을 str로 미리 변환해 직렬화 시 enum 객체 분기를 제거
+        use_enum_values = True
+
 
 class FeedbackUpdateRequest(BaseModel):
     """건의사항 수정 요청 스키마 (사용자용)"""
@@ -47,11 +56,18 @@ class AdminFeedbackResponse(BaseModel):
     admin_response: str = Field(..., min_length=1, description="관리자 응답")
     status: FeedbackStatus = Field(..., description="건의사항 상태")
 
+    class Config:
+        use_enum_values = True
+
 
 class FeedbackListResponse(BaseModel):
     """건의사항 목록 응답 스키마"""
     feedbacks: list[FeedbackResponse]
-    pagination: dict
+    pagination: Pagination
+
+    class Config:
+        frozen = True
+        use_enum_values = True
 
 
 class FeedbackStatsResponse(BaseModel):
@@ -62,4 +78,8 @@ class FeedbackStatsResponse(BaseModel):
     resolved_count: int
     rejected_count: int
     category_distribution: list[dict]
-    recent_feedbacks: list[FeedbackResponse]
\ No newline at end of file
+    recent_feedbacks: list[FeedbackResponse]
+
+    class Config:
+        frozen = True
+        use_enum_values = True
\ No newline at end of file
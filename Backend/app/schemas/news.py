@@ -24,7 +24,7 @@ class NewsUpdate(BaseModel):
     """뉴스 수정 스키마"""
     title: Optional[str] = Field(None, description="뉴스 제목")
     summary: Optional[str] = Field(None, description="AI 요약")
-    sentiment_score: Optional[float] = Field(None, description="감정 점수")
+    sentiment_score: Optional[float] = Field(None, ge=-1.0, le=1.0, description="감정 점수")
     sentiment_label: Optional[str] = Field(None, description="감정 라벨")
     keywords: Optional[List[str]] = Field(None, description="키워드")
     is_controversial: Optional[bool] = Field(None, description="논쟁성 여부")
@@ -45,9 +45,10 @@ class NewsResponse(BaseModel):
     published_at: datetime
     
     # AI 분석 결과
-    sentiment_score: Optional[float] = None
+    sentiment_score: Optional[float] = Field(None, ge=-1.0, le=1.0)
     sentiment_label: Optional[str] = None
-    keywords: Optional[List[str]] = None
+    # DB에서 검증된 배열이므로 응답에서는 항목별 재검증 생략
+    keywords: Optional[List[Any]] = None
     
     # 논쟁 이슈 관련
     is_controversial: bool = False
@@ -55,7 +56,7 @@ class NewsResponse(BaseModel):
     cons_summary: Optional[str] = None
     
     # 기업 관련
-    mentioned_companies: Optional[List[str]] = None
+    mentioned_companies: Optional[List[Any]] = None
     
     # 상태
     is_processed: bool = False
@@ -64,6 +65,7 @@ class NewsResponse(BaseModel):
     updated_at: datetime
 
     class Config:
+        frozen = True
         from_attributes = True
 
 
@@ -75,6 +77,9 @@ class NewsListResponse(BaseModel):
     size: int = Field(..., description="페이지 크기")
     has_next: bool = Field(..., description="다음 페이지 존재 여부")
 
+    class Config:
+        frozen = True
+
 
 class NewsSummaryResponse(BaseModel):
     """뉴스 요약 응답 스키마"""
@@ -84,6 +89,9 @@ class NewsSummaryResponse(BaseModel):
     by_category: Dict[str, int] = Field(..., description="카테고리별 뉴스 수")
     by_source: Dict[str, int] = Field(..., description="소스별 뉴스 수")
 
+    class Config:
+        frozen = True
+
 
 class CategoryNewsResponse(BaseModel):
     """카테고리별 뉴스 응답 스키마"""
@@ -91,6 +99,9 @@ class CategoryNewsResponse(BaseModel):
     news: List[NewsResponse] = Field(..., description="뉴스 목록")
     total_count: int = Field(..., description="해당 카테고리 총 뉴스 수")
 
+    class Config:
+        frozen = True
+
 
 class CompanySentimentResponse(BaseModel):
     """기업 감정분석 응답 스키마"""
@@ -100,6 +111,9 @@ class CompanySentimentResponse(BaseModel):
     average_sentiment: float = Field(..., description="평균 감정 점수")
     sentiment_distribution: Dict[str, int] = Field(..., description="감정 분포")
 
+    class Config:
+        frozen = True
+
 
 class NewsSearchRequest(BaseModel):
     """뉴스 검색 요청 스키마"""
@@ -126,6 +140,9 @@ class AIProcessingResponse(BaseModel):
     total_found: Optional[int] = Field(None, description="발견된 총 뉴스 수")
     error: Optional[str] = Field(None, description="오류 메시지")
 
+    class Config:
+        frozen = True
+
 
 # 크롤링 관련 스키마
 class CrawlingRequest(BaseModel):
@@ -138,11 +155,14 @@ class CrawlingResponse(BaseModel):
     success: bool = Field(..., description="크롤링 성공 여부")
     crawled_count: Optional[int] = Field(None, description="크롤링된 뉴스 수")
     saved_count: Optional[int] = Field(None, description="저장된 뉴스 수")
-    duration_seconds: float = Field(..., description="소요 시간")
+    duration_us: int = Field(..., description="소요 시간 (마이크로초)")
     start_time: str = Field(..., description="시작 시간")
     end_time: str = Field(..., description="종료 시간")
     error: Optional[str] = Field(None, description="오류 메시지")
 
+    class Config:
+        frozen = True
+
 
 # 스케줄러 관련 스키마
 class SchedulerJobInfo(BaseModel):
@@ -151,9 +171,15 @@ class SchedulerJobInfo(BaseModel):
     name: str = Field(..., description="작업 이름")
     next_run_time: Optional[datetime] = Field(None, description="다음 실행 시간")
 
+    class Config:
+        frozen = True
+
 
 class SchedulerStatusResponse(BaseModel):
     """스케줄러 상태 응답 스키마"""
     is_running: bool = Field(..., description="스케줄러 실행 상태")
     jobs: List[SchedulerJobInfo] = Field(..., description="작업 목록")
-    server_time: datetime = Field(default_factory=datetime.now, description="서버 시간")
\ No newline at end of file
+    server_time: datetime = Field(default_factory=datetime.now, description="서버 시간")
+
+    class Config:
+        frozen = True
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 사용자 구독 관련 Pydantic 스키마
 """
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -13,6 +13,9 @@ class CategorySubscriptionResponse(BaseModel):
     category_description: Optional[str] = None
     is_subscribed: bool
 
+    class Config:
+        frozen = True
+
 
 class CompanySubscriptionResponse(BaseModel):
     """기업 구독 응답 스키마"""
@@ -23,6 +26,9 @@ class CompanySubscriptionResponse(BaseModel):
     is_subscribed: bool
     sentiment_alerts_enabled: bool = False
 
+    class Config:
+        frozen = True
+
 
 class SubscriptionUpdateRequest(BaseModel):
     """구독 업데이트 요청 스키마"""
@@ -42,6 +48,9 @@ class UserPreferencesResponse(BaseModel):
     total_categories: int
     total_companies: int
 
+    class Config:
+        frozen = True
+
 
 class PersonalizedNewsItem(BaseModel):
     """개인화 뉴스 아이템 스키마"""
@@ -54,7 +63,7 @@ class PersonalizedNewsItem(BaseModel):
     category_name: Optional[str] = None
     sentiment_score: Optional[float] = None
     sentiment_label: Optional[str] = None
-    mentioned_companies: Optional[List[str]] = None
+    mentioned_companies: Optional[List[Any]] = None
     is_controversial: bool = False
     pros_summary: Optional[str] = None
     cons_summary: Optional[str] = None
@@ -67,4 +76,7 @@ class PersonalizedNewsResponse(BaseModel):
     news_by_category: dict
     news_by_company: dict
     controversial_news: List[PersonalizedNewsItem]
-    generated_at: datetime
\ No newline at end of file
+    generated_at: datetime
+
+    class Config:
+        frozen = True
\ No newline at end of file
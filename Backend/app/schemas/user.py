@@ -34,7 +34,8 @@ class UserResponse(BaseModel):
     """사용자 정보 응답 스키마"""
     id: int
     supabase_id: str
-    email: EmailStr
+    # DB에 저장될 때 이미 검증된 값이므로 응답에서는 재검증하지 않음
+    email: str
     name: Optional[str] = None
     avatar_url: Optional[str] = None
     
@@ -50,6 +51,7 @@ class UserResponse(BaseModel):
     last_login: Optional[datetime] = None
     
     class Config:
+        frozen = True
         from_attributes = True  # Pydantic v2에서 orm_mode 대신 사용
 
 
@@ -67,4 +69,7 @@ class UserStats(BaseModel):
     active_users: int
     new_users_today: int
     new_users_this_week: int
-    new_users_this_month: int
\ No newline at end of file
+    new_users_this_month: int
+
+    class Config:
+        frozen = True
\ No newline at end of file
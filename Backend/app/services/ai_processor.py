@@ -3,24 +3,168 @@ AI 처리 서비스
 뉴스 요약, 감정분석, 찬반정리, 임베딩 생성
 """
 import asyncio
+import hashlib
 import logging
+import os
 from typing import List, Dict, Any, Optional, Tuple
 import json
 import re
+from collections import Counter
 from dataclasses import dataclass
 
 import openai
 import google.generativeai as genai
+from aiolimiter import AsyncLimiter
 from sentence_transformers import SentenceTransformer
 import numpy as np
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import async_session
 from app.models.news import News
 
 logger = logging.getLogger(__name__)
 
+# orjson이 있으면 응답 파싱에 사용 (표준 json 대비 수 배 빠름)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 토크나이저 기반 길이 제한 (tiktoken 미설치 시 글자 수 기반 폴백)
+try:
+    import tiktoken
+    _TOKEN_ENCODER = tiktoken.encoding_for_model("gpt-3.5-turbo")
+except Exception:
+    _TOKEN_ENCODER = None
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    텍스트를 토큰 수 기준으로 자른다
+
+    글자 수 기반 truncation은 한글(멀티바이트)에서 컨텍스트를 초과하고
+    ASCII에서는 덜 채우므로 토크나이저로 정확히 자른다.
+    """
+    if _TOKEN_ENCODER is None:
+        # 폴백: 한글 기준 대략 토큰당 1.5자
+        limit = int(max_tokens * 1.5)
+        return text[:limit]
+
+    tokens = _TOKEN_ENCODER.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return _TOKEN_ENCODER.decode(tokens[:max_tokens])
+
+
+# 긴 기사 키워드 카운팅용 (pandas 미설치 시 Counter 경로 사용)
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# pandas value_counts(C 해시맵)로 전환하는 토큰 수 기준
+_VALUE_COUNTS_THRESHOLD = 20000
+
+# 키워드 추출용 컴파일된 패턴/불용어 (호출마다 재생성하지 않음)
+_WORD_RE = re.compile(r'[가-힣a-zA-Z0-9]+')
+
+# 내용 해시 기반 처리 결과 캐시
+# 신디케이트로 동일 본문이 여러 소스에서 들어올 때 LLM 재호출을 건너뛴다
+_RESULT_CACHE_MAX = 10000
+_result_cache: Dict[str, "ProcessingResult"] = {}
+
+
+def _content_cache_key(title: str, content: str) -> str:
+    """제목+본문 앞부분의 blake2b 해시를 캐시 키로 사용"""
+    return hashlib.blake2b(
+        f"{title}\n{content[:4096]}".encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+
+_STOPWORDS = frozenset({
+    '이', '가', '을', '를', '에', '의', '는', '은', '도', '과', '와', '로', '으로',
+    '있다', '있는', '하다', '한다', '된다', '되다', '것', '수', '때', '등',
+    '그', '이런', '저런', '그런', '여러', '많은', '또한', '하지만', '그러나'
+})
+
+# 한국 주요 기업 리스트 (확장 가능) - 인스턴스마다 재구성하지 않는 불변 공유 상태
+_KOREAN_COMPANIES = (
+    "삼성전자", "SK하이닉스", "LG에너지솔루션", "삼성바이오로직스",
+    "NAVER", "카카오", "셀트리온", "현대차", "기아", "포스코홀딩스",
+    "LG화학", "SK이노베이션", "한국전력", "삼성물산", "LG전자",
+    "한화솔루션", "SK", "현대모비스", "POSCO", "아모레퍼시픽"
+)
+
+
+def _build_company_automaton():
+    """기업명 Aho-Corasick 오토마톤 생성 (pyahocorasick 미설치 시 None)"""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for company in _KOREAN_COMPANIES:
+        automaton.add_word(company, company)
+    automaton.make_automaton()
+    return automaton
+
+
+# 모듈 로드 시 1회 구축 - 모든 AIProcessor 인스턴스가 읽기 전용으로 공유
+_COMPANY_AUTOMATON = _build_company_automaton()
+
+# 프로세스당 1회만 로드하는 임베딩 모델 싱글톤
+# AIProcessor()가 배치마다 생성되어도 수 초짜리 모델 로드를 반복하지 않는다
+_embedding_model_singleton = None
+_embedding_model_loaded = False
+
+
+class _OnnxEmbeddingModel:
+    """
+    INT8 양자화 ONNX 임베딩 모델 래퍼
+
+    SentenceTransformer.encode 와 호환되는 인터페이스를 제공하면서
+    추론은 ONNX Runtime(CPU)에서 수행한다. FP32 대비 2-4배 빠르다.
+    """
+
+    def __init__(self, session, tokenizer):
+        self.session = session
+        self.tokenizer = tokenizer
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False,
+               convert_to_numpy=True, normalize_embeddings=False):
+        single_input = isinstance(texts, str)
+        if single_input:
+            texts = [texts]
+
+        results = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            inputs = self.tokenizer(
+                batch, padding=True, truncation=True,
+                max_length=512, return_tensors="np"
+            )
+            outputs = self.session.run(None, dict(inputs))
+            hidden = outputs[0]  # (batch, seq, dim)
+
+            # mean pooling (attention mask 가중)
+            mask = inputs["attention_mask"][:, :, np.newaxis].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            results.append(pooled)
+
+        embeddings = np.concatenate(results, axis=0)
+
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        if single_input:
+            return embeddings[0]
+        return embeddings
+
 
 @dataclass
 class ProcessingResult:
@@ -33,7 +177,8 @@ class ProcessingResult:
     pros_summary: Optional[str] = None
     cons_summary: Optional[str] = None
     mentioned_companies: List[str] = None
-    embedding: List[float] = None
+    # float32 ndarray로 유지하고 DB 저장 시점에만 리스트로 변환
+    embedding: Optional[np.ndarray] = None
 
 
 class AIProcessor:
@@ -41,8 +186,9 @@ class AIProcessor:
     
     def __init__(self):
         # API 키 설정
+        self.openai_client = None
         if settings.OPENAI_API_KEY:
-            openai.api_key = settings.OPENAI_API_KEY
+            self.openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         
         if settings.GEMINI_API_KEY:
             genai.configure(api_key=settings.GEMINI_API_KEY)
@@ -52,16 +198,38 @@ class AIProcessor:
         self.embedding_model = None
         self._load_embedding_model()
         
-        # 한국 주요 기업 리스트 (확장 가능)
-        self.korean_companies = [
-            "삼성전자", "SK하이닉스", "LG에너지솔루션", "삼성바이오로직스",
-            "NAVER", "카카오", "셀트리온", "현대차", "기아", "포스코홀딩스",
-            "LG화학", "SK이노베이션", "한국전력", "삼성물산", "LG전자",
-            "한화솔루션", "SK", "현대모비스", "POSCO", "아모레퍼시픽"
-        ]
+        # 모듈 레벨 싱글톤 참조 (인스턴스마다 재구성 없음)
+        self.korean_companies = _KOREAN_COMPANIES
+
+        # Aho-Corasick 오토마톤 (기업명 전체를 텍스트 1회 스캔으로 탐색)
+        self._company_automaton = _COMPANY_AUTOMATON
+
+        # LLM 호출 토큰 버킷 (고정 sleep 대신 실제 쿼터에 맞춰 제한)
+        self._rate_limiter = AsyncLimiter(settings.LLM_RPM, 60)
     
     def _load_embedding_model(self):
-        """임베딩 모델 로드"""
+        """임베딩 모델 로드 (프로세스당 1회, 인스턴스 간 공유)"""
+        global _embedding_model_singleton, _embedding_model_loaded
+
+        if _embedding_model_loaded:
+            self.embedding_model = _embedding_model_singleton
+            return
+
+        self._load_embedding_model_uncached()
+
+        _embedding_model_singleton = self.embedding_model
+        _embedding_model_loaded = True
+
+    def _load_embedding_model_uncached(self):
+        """임베딩 모델 실제 로드"""
+        # INT8 양자화 ONNX 경로 우선 시도 (onnxruntime/optimum 설치 시)
+        quantized = self._load_quantized_model('jhgan/ko-sroberta-multitask')
+        if quantized:
+            self.embedding_model = quantized
+            logger.info("INT8 양자화 임베딩 모델 로드 완료")
+            self._warmup_embedding_model()
+            return
+
         try:
             # 한국어 특화 임베딩 모델
             self.embedding_model = SentenceTransformer('jhgan/ko-sroberta-multitask')
@@ -74,7 +242,173 @@ class AIProcessor:
                 logger.info("영어 임베딩 모델 로드 완료")
             except Exception as e2:
                 logger.error(f"폴백 임베딩 모델 로드도 실패: {e2}")
+                return
+
+        self._tune_embedding_runtime()
+        self._warmup_embedding_model()
+
+    def _tune_embedding_runtime(self):
+        """임베딩 모델 실행 환경 튜닝 (GPU FP16 또는 CPU 스레드 수)"""
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                # FP16은 텐서코어 GPU에서 처리량 약 2배, 유사도 오차는 무시 가능
+                self.embedding_model = self.embedding_model.half().to("cuda")
+                logger.info("임베딩 모델 FP16/CUDA 전환 완료")
+            else:
+                # 기본 스레드 수가 1로 잡히는 환경에서 코어 수만큼 복구
+                torch.set_num_threads(max(1, os.cpu_count() or 1))
+                try:
+                    torch.set_num_interop_threads(1)
+                except RuntimeError:
+                    # 이미 병렬 작업이 시작된 경우 변경 불가
+                    pass
+        except Exception as e:
+            logger.warning(f"임베딩 런타임 튜닝 실패: {e}")
+
+    def _warmup_embedding_model(self):
+        """첫 실제 요청 전에 JIT/커널 선택 비용을 선지불"""
+        if not self.embedding_model:
+            return
+
+        try:
+            self.embedding_model.encode(
+                ["워밍업"], batch_size=1, show_progress_bar=False
+            )
+        except Exception as e:
+            logger.warning(f"임베딩 모델 워밍업 실패: {e}")
+
+    def _load_quantized_model(self, model_name: str) -> Optional[_OnnxEmbeddingModel]:
+        """
+        INT8 동적 양자화 ONNX 임베딩 모델 로드
+
+        optimum/onnxruntime 미설치 또는 변환 실패 시 None을 반환하여
+        기존 SentenceTransformer 경로로 폴백한다.
+        """
+        try:
+            import tempfile
+            import onnxruntime
+            from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+            from transformers import AutoTokenizer
+        except ImportError:
+            return None
+
+        try:
+            export_dir = tempfile.mkdtemp(prefix="newsbite_onnx_")
+            ort_model = ORTModelForFeatureExtraction.from_pretrained(
+                model_name, export=True
+            )
+            ort_model.save_pretrained(export_dir)
+
+            quantizer = ORTQuantizer.from_pretrained(export_dir)
+            qconfig = AutoQuantizationConfig.avx512_vnni(
+                is_static=False, per_channel=True
+            )
+            quantized_path = quantizer.quantize(
+                save_dir=export_dir, quantization_config=qconfig
+            )
+
+            session = onnxruntime.InferenceSession(
+                str(quantized_path / "model_quantized.onnx"),
+                providers=["CPUExecutionProvider"]
+            )
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            return _OnnxEmbeddingModel(session, tokenizer)
+
+        except Exception as e:
+            logger.warning(f"ONNX 양자화 모델 변환 실패 (FP32 경로 사용): {e}")
+            return None
     
+    async def _analyze_news_fused(self, title: str, content: str) -> Optional[Tuple]:
+        """
+        요약/감정분석/논쟁탐지를 단일 JSON 호출로 처리
+
+        같은 기사 본문을 3번 보내는 대신 1회 호출로 모든 결과를 받는다.
+        호출 또는 파싱 실패 시 None을 반환해 분할 호출로 폴백한다.
+
+        Returns:
+            (summary, sentiment_score, sentiment_label,
+             is_controversial, pros_summary, cons_summary) 튜플 또는 None
+        """
+        prompt = f"""
+다음 뉴스를 분석하고 반드시 아래 JSON 형식으로만 답변해주세요.
+
+제목: {title}
+
+본문: {_truncate_tokens(content, 900)}
+
+JSON 형식:
+{{
+  "summary": "핵심 사실만 담은 객관적인 3-4문장 요약",
+  "sentiment": {{"score": -1.0에서 1.0 사이 숫자, "label": "positive/negative/neutral 중 하나"}},
+  "controversy": {{"is": true 또는 false, "pros": "찬성 측 주장 요약 또는 null", "cons": "반대 측 주장 요약 또는 null"}}
+}}
+"""
+        data = await self._call_llm_json(prompt, max_tokens=600)
+        if not isinstance(data, dict):
+            logger.warning("통합 분석 실패 - 분할 호출로 폴백")
+            return None
+
+        sentiment = data.get("sentiment") or {}
+        controversy = data.get("controversy") or {}
+
+        try:
+            score = max(-1.0, min(1.0, float(sentiment.get("score", 0.0))))
+        except (TypeError, ValueError):
+            score = 0.0
+
+        label = sentiment.get("label")
+        if label not in ("positive", "negative", "neutral"):
+            label = "neutral"
+
+        is_controversial = bool(controversy.get("is"))
+        pros_summary = controversy.get("pros") if is_controversial else None
+        cons_summary = controversy.get("cons") if is_controversial else None
+
+        return (
+            data.get("summary") or "",
+            score,
+            label,
+            is_controversial,
+            pros_summary or None,
+            cons_summary or None
+        )
+
+    async def _call_llm_json(self, prompt: str, max_tokens: int = 300) -> Optional[Dict]:
+        """
+        JSON 모드로 LLM 호출 후 파싱된 딕셔너리 반환
+
+        구조화 출력을 API에 직접 요청하므로 응답에 대한 정규식 파싱이
+        필요 없다. 호출/파싱 실패 시 None을 반환한다.
+        """
+        try:
+            if hasattr(self, 'gemini_model'):
+                async with self._rate_limiter:
+                    response = await self.gemini_model.generate_content_async(
+                        prompt,
+                        generation_config={"response_mime_type": "application/json"}
+                    )
+                text = response.text
+            elif self.openai_client:
+                async with self._rate_limiter:
+                    response = await self.openai_client.chat.completions.create(
+                        model="gpt-3.5-turbo",
+                        messages=[{"role": "user", "content": prompt}],
+                        max_tokens=max_tokens,
+                        temperature=0.3,
+                        response_format={"type": "json_object"}
+                    )
+                text = response.choices[0].message.content
+            else:
+                return None
+
+            return _json_loads(text)
+        except Exception as e:
+            logger.warning(f"JSON 모드 LLM 호출 실패: {e}")
+            return None
+
     async def summarize_news(self, title: str, content: str, use_gemini: bool = True) -> str:
         """
         뉴스 요약 생성
@@ -92,7 +426,7 @@ class AIProcessor:
 
 제목: {title}
 
-본문: {content[:1500]}
+본문: {_truncate_tokens(content, 900)}
 
 요약:
 """
@@ -122,42 +456,35 @@ class AIProcessor:
             (감정 점수, 감정 라벨) 튜플
         """
         prompt = f"""
-다음 뉴스 텍스트의 감정을 분석해주세요. 
+다음 뉴스 텍스트의 감정을 분석하고 반드시 아래 JSON 형식으로만 답변해주세요.
 
-텍스트: {text[:1000]}
+텍스트: {_truncate_tokens(text, 600)}
 
-다음 형식으로만 답변해주세요:
-점수: [---1.0에서 1.0 사이의 숫자]
-라벨: [positive/negative/neutral 중 하나]
+JSON 형식:
+{{"score": -1.0에서 1.0 사이 숫자, "label": "positive/negative/neutral 중 하나"}}
 
 분석 기준:
 - 긍정적 내용, 호재, 성장, 성공 → positive (0.1~1.0)
-- 부정적 내용, 악재, 감소, 실패 → negative (-1.0~-0.1)  
+- 부정적 내용, 악재, 감소, 실패 → negative (-1.0~-0.1)
 - 중립적, 단순 사실 전달 → neutral (-0.1~0.1)
 """
-        
-        try:
-            response = await self._call_gemini(prompt)
-            
-            # 응답 파싱
-            score_match = re.search(r'점수:\s*([+-]?\d*\.?\d+)', response)
-            label_match = re.search(r'라벨:\s*(positive|negative|neutral)', response)
-            
-            if score_match and label_match:
-                score = float(score_match.group(1))
-                label = label_match.group(1)
-                
-                # 점수 범위 검증
-                score = max(-1.0, min(1.0, score))
-                
-                return score, label
-            else:
-                # 파싱 실패시 기본값
-                return 0.0, "neutral"
-                
-        except Exception as e:
-            logger.error(f"감정 분석 실패: {e}")
+
+        data = await self._call_llm_json(prompt, max_tokens=60)
+
+        if not isinstance(data, dict):
+            # 호출 실패시 기본값
             return 0.0, "neutral"
+
+        try:
+            score = max(-1.0, min(1.0, float(data.get("score", 0.0))))
+        except (TypeError, ValueError):
+            score = 0.0
+
+        label = data.get("label")
+        if label not in ("positive", "negative", "neutral"):
+            label = "neutral"
+
+        return score, label
     
     async def detect_controversy(self, title: str, content: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
@@ -171,16 +498,13 @@ class AIProcessor:
             (논쟁성 여부, 찬성 의견 요약, 반대 의견 요약)
         """
         prompt = f"""
-다음 뉴스가 논쟁적 이슈인지 판단하고, 만약 논쟁적이라면 찬반 의견을 정리해주세요.
+다음 뉴스가 논쟁적 이슈인지 판단하고, 반드시 아래 JSON 형식으로만 답변해주세요.
 
 제목: {title}
-본문: {content[:1200]}
+본문: {_truncate_tokens(content, 720)}
 
-다음 형식으로만 답변해주세요:
-
-논쟁성: [true/false]
-찬성 의견: [찬성 측 주장 요약 또는 "없음"]
-반대 의견: [반대 측 주장 요약 또는 "없음"]
+JSON 형식:
+{{"is": true 또는 false, "pros": "찬성 측 주장 요약 또는 null", "cons": "반대 측 주장 요약 또는 null"}}
 
 논쟁적 이슈 기준:
 - 정치적 갈등, 정책 논란
@@ -188,38 +512,27 @@ class AIProcessor:
 - 경제 정책, 규제 관련 논란
 - 찬반이 나뉘는 사회 이슈
 """
-        
-        try:
-            response = await self._call_gemini(prompt)
-            
-            # 응답 파싱
-            controversy_match = re.search(r'논쟁성:\s*(true|false)', response)
-            pros_match = re.search(r'찬성 의견:\s*(.+?)(?=반대 의견:|$)', response, re.DOTALL)
-            cons_match = re.search(r'반대 의견:\s*(.+?)$', response, re.DOTALL)
-            
-            is_controversial = False
-            if controversy_match:
-                is_controversial = controversy_match.group(1) == "true"
-            
-            pros_summary = None
-            cons_summary = None
-            
-            if is_controversial:
-                if pros_match:
-                    pros_text = pros_match.group(1).strip()
-                    if pros_text and pros_text != "없음":
-                        pros_summary = pros_text
-                
-                if cons_match:
-                    cons_text = cons_match.group(1).strip()
-                    if cons_text and cons_text != "없음":
-                        cons_summary = cons_text
-            
-            return is_controversial, pros_summary, cons_summary
-            
-        except Exception as e:
-            logger.error(f"논쟁 탐지 실패: {e}")
+
+        data = await self._call_llm_json(prompt, max_tokens=300)
+
+        if not isinstance(data, dict):
             return False, None, None
+
+        is_controversial = bool(data.get("is"))
+
+        pros_summary = None
+        cons_summary = None
+
+        if is_controversial:
+            pros_text = data.get("pros")
+            if pros_text and pros_text != "없음":
+                pros_summary = pros_text
+
+            cons_text = data.get("cons")
+            if cons_text and cons_text != "없음":
+                cons_summary = cons_text
+
+        return is_controversial, pros_summary, cons_summary
     
     def extract_keywords(self, text: str, max_keywords: int = 5) -> List[str]:
         """
@@ -233,31 +546,21 @@ class AIProcessor:
             키워드 리스트
         """
         try:
-            # 한국어 불용어
-            stopwords = {
-                '이', '가', '을', '를', '에', '의', '는', '은', '도', '과', '와', '로', '으로',
-                '있다', '있는', '하다', '한다', '된다', '되다', '것', '수', '때', '등',
-                '그', '이런', '저런', '그런', '여러', '많은', '또한', '하지만', '그러나'
-            }
-            
             # 단어 추출 (한글, 영문, 숫자만)
-            words = re.findall(r'[가-힣a-zA-Z0-9]+', text)
-            
+            words = _WORD_RE.findall(text)
+
             # 불용어 제거 및 길이 필터링
-            filtered_words = [
-                word for word in words 
-                if len(word) >= 2 and word not in stopwords
+            filtered = [
+                word for word in words
+                if len(word) >= 2 and word not in _STOPWORDS
             ]
-            
-            # 빈도 계산
-            word_freq = {}
-            for word in filtered_words:
-                word_freq[word] = word_freq.get(word, 0) + 1
-            
-            # 빈도순 정렬 후 상위 키워드 반환
-            keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-            return [word for word, freq in keywords[:max_keywords]]
-            
+
+            # 매우 긴 기사는 pandas의 C 해시맵/정렬로 카운팅
+            if pd is not None and len(filtered) > _VALUE_COUNTS_THRESHOLD:
+                return pd.Series(filtered).value_counts().head(max_keywords).index.tolist()
+
+            return [word for word, freq in Counter(filtered).most_common(max_keywords)]
+
         except Exception as e:
             logger.error(f"키워드 추출 실패: {e}")
             return []
@@ -272,75 +575,150 @@ class AIProcessor:
         Returns:
             언급된 기업 리스트
         """
+        # 오토마톤이 있으면 텍스트를 한 번만 스캔
+        if self._company_automaton is not None:
+            return list({name for _, name in self._company_automaton.iter(text)})
+
         mentioned = []
-        
+
         for company in self.korean_companies:
             if company in text:
                 mentioned.append(company)
-        
+
         return list(set(mentioned))  # 중복 제거
     
-    def generate_embedding(self, text: str) -> Optional[List[float]]:
+    def generate_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         텍스트 임베딩 생성
-        
+
         Args:
             text: 임베딩을 생성할 텍스트
-            
+
         Returns:
-            임베딩 벡터
+            float32 임베딩 벡터 (DB 저장 시점에만 리스트로 변환)
         """
         if not self.embedding_model:
             return None
-        
+
         try:
             # 텍스트 길이 제한
             text = text[:512]
-            
+
             # 임베딩 생성
             embedding = self.embedding_model.encode(text)
-            
-            # numpy array를 리스트로 변환
-            if isinstance(embedding, np.ndarray):
-                embedding = embedding.tolist()
-            
-            return embedding
-            
+
+            # 파이썬 리스트 박싱 없이 연속 float32 배열로 유지
+            return np.asarray(embedding).astype(np.float32, copy=False)
+
         except Exception as e:
             logger.error(f"임베딩 생성 실패: {e}")
             return None
-    
-    async def process_news(self, news_item: Dict[str, Any]) -> ProcessingResult:
+
+    @staticmethod
+    def cosine_matrix(embeddings: List[np.ndarray]) -> np.ndarray:
+        """
+        임베딩 집합의 모든 쌍별 코사인 유사도 행렬 계산
+
+        파이썬 루프 대신 L2 정규화 후 단일 행렬곱(BLAS GEMM)으로 처리한다.
+
+        Args:
+            embeddings: 임베딩 벡터 리스트
+
+        Returns:
+            (N, N) 코사인 유사도 행렬
+        """
+        matrix = np.vstack(embeddings).astype(np.float32, copy=False)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.clip(norms, 1e-12, None)
+        return matrix @ matrix.T
+
+    def generate_embeddings_batch(self, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        텍스트 배치 임베딩 생성
+
+        개별 encode 호출 N번 대신 한 번의 배치 호출로 처리하여
+        토크나이저/패딩 오버헤드를 줄이고 행렬 연산 활용도를 높인다.
+
+        Args:
+            texts: 임베딩을 생성할 텍스트 리스트
+
+        Returns:
+            (len(texts), dim) 형태의 임베딩 행렬
+        """
+        if not self.embedding_model or not texts:
+            return None
+
+        try:
+            # 텍스트 길이 제한
+            truncated = [text[:512] for text in texts]
+
+            embeddings = self.embedding_model.encode(
+                truncated,
+                batch_size=32,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+            return embeddings.astype(np.float32, copy=False)
+
+        except Exception as e:
+            logger.error(f"배치 임베딩 생성 실패: {e}")
+            return None
+
+    async def process_news(
+        self,
+        news_item: Dict[str, Any],
+        embedding: Optional[np.ndarray] = None
+    ) -> ProcessingResult:
         """
         단일 뉴스 항목에 대한 전체 AI 처리
-        
+
         Args:
             news_item: 뉴스 데이터
-            
+            embedding: 배치에서 미리 계산된 임베딩 (없으면 개별 생성)
+
         Returns:
             처리 결과
         """
         title = news_item.get("title", "")
         content = news_item.get("content_snippet", "") or news_item.get("raw_content", "")
         full_text = f"{title}\n{content}"
-        
+
+        # 동일 내용 기사는 캐시로 단락 (LLM 호출/임베딩 생성 생략)
+        cache_key = _content_cache_key(title, content)
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # LLM과 무관한 작업은 스레드 풀에서 먼저 시작해 LLM 대기와 겹치게 한다
+        # (torch는 encode 내부에서 GIL을 해제하므로 임베딩이 API 대기와 병렬 실행됨)
+        loop = asyncio.get_running_loop()
+        keywords_future = loop.run_in_executor(None, self.extract_keywords, full_text)
+        companies_future = loop.run_in_executor(None, self.extract_companies, full_text)
+        embedding_future = None
+        if embedding is None:
+            embedding_future = loop.run_in_executor(None, self.generate_embedding, full_text)
+
         try:
-            # 병렬 처리
-            summary_task = self.summarize_news(title, content)
-            sentiment_task = self.analyze_sentiment(full_text)
-            controversy_task = self.detect_controversy(title, content)
-            
-            # 결과 수집
-            summary = await summary_task
-            sentiment_score, sentiment_label = await sentiment_task
-            is_controversial, pros_summary, cons_summary = await controversy_task
-            
-            # 동기 처리
-            keywords = self.extract_keywords(full_text)
-            companies = self.extract_companies(full_text)
-            embedding = self.generate_embedding(full_text)
-            
-            return ProcessingResult(
+            # 요약/감정/논쟁 분석을 단일 호출로 통합 (본문 프리필 3회 → 1회)
+            fused = await self._analyze_news_fused(title, content)
+
+            if fused is not None:
+                (summary, sentiment_score, sentiment_label,
+                 is_controversial, pros_summary, cons_summary) = fused
+            else:
+                # 폴백: 기존 3회 분할 호출
+                summary = await self.summarize_news(title, content)
+                sentiment_score, sentiment_label = await self.analyze_sentiment(full_text)
+                is_controversial, pros_summary, cons_summary = await self.detect_controversy(title, content)
+
+            # LLM 대기 중 백그라운드로 실행된 동기 작업 결과 수집
+            keywords = await keywords_future
+            companies = await companies_future
+            if embedding_future is not None:
+                embedding = await embedding_future
+
+            result = ProcessingResult(
                 summary=summary,
                 sentiment_score=sentiment_score,
                 sentiment_label=sentiment_label,
@@ -351,29 +729,44 @@ class AIProcessor:
                 mentioned_companies=companies,
                 embedding=embedding
             )
+
+            # 성공 결과만 캐시 (가장 오래된 항목부터 제거)
+            if len(_result_cache) >= _RESULT_CACHE_MAX:
+                _result_cache.pop(next(iter(_result_cache)))
+            _result_cache[cache_key] = result
+
+            return result
             
         except Exception as e:
             logger.error(f"뉴스 처리 실패: {e}")
+
+            # 백그라운드 작업 결과는 실패 경로에서도 그대로 재사용
+            keywords = await keywords_future
+            companies = await companies_future
+            if embedding_future is not None:
+                embedding = await embedding_future
+
             # 기본값 반환
             return ProcessingResult(
                 summary=content[:200] if content else title,
                 sentiment_score=0.0,
                 sentiment_label="neutral",
-                keywords=self.extract_keywords(full_text),
+                keywords=keywords,
                 is_controversial=False,
-                mentioned_companies=self.extract_companies(full_text),
-                embedding=self.generate_embedding(full_text)
+                mentioned_companies=companies,
+                embedding=embedding
             )
     
     async def _call_openai(self, prompt: str, max_tokens: int = 300) -> str:
         """OpenAI API 호출"""
         try:
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens,
-                temperature=0.3
-            )
+            async with self._rate_limiter:
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=max_tokens,
+                    temperature=0.3
+                )
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"OpenAI API 호출 실패: {e}")
@@ -382,10 +775,8 @@ class AIProcessor:
     async def _call_gemini(self, prompt: str) -> str:
         """Gemini API 호출"""
         try:
-            response = await asyncio.to_thread(
-                self.gemini_model.generate_content, 
-                prompt
-            )
+            async with self._rate_limiter:
+                response = await self.gemini_model.generate_content_async(prompt)
             return response.text
         except Exception as e:
             logger.error(f"Gemini API 호출 실패: {e}")
@@ -402,66 +793,114 @@ async def process_unprocessed_news(batch_size: int = 10) -> Dict[str, Any]:
     Returns:
         처리 결과 정보
     """
-    db = next(get_db())
     processor = AIProcessor()
-    
-    try:
-        # 처리되지 않은 뉴스 조회
-        unprocessed_news = db.query(News).filter(
-            News.is_processed == False
-        ).limit(batch_size).all()
-        
-        if not unprocessed_news:
-            return {"success": True, "message": "처리할 뉴스가 없습니다", "processed_count": 0}
-        
-        processed_count = 0
-        
-        for news in unprocessed_news:
-            try:
-                # 뉴스 데이터 준비
+
+    # 호출마다 세션을 새로 만들지 않고 작업 실행 단위로 하나를 풀에서
+    # 빌려 배치 조회와 중간 플러시에 재사용한다
+    async with async_session() as db:
+        try:
+            # 처리되지 않은 뉴스 조회 (필요한 컬럼만 - 전체 엔티티 하이드레이션 방지)
+            unprocessed_rows = (
+                await db.execute(
+                    select(News.id, News.title, News.content_snippet)
+                    .where(News.is_processed == False)
+                    .limit(batch_size)
+                )
+            ).all()
+
+            if not unprocessed_rows:
+                return {"success": True, "message": "처리할 뉴스가 없습니다", "processed_count": 0}
+
+            # 배치 전체 임베딩을 한 번에 생성 (개별 encode 호출 N번 방지)
+            batch_texts = [
+                f"{row.title}\n{row.content_snippet or ''}"
+                for row in unprocessed_rows
+            ]
+            batch_embeddings = processor.generate_embeddings_batch(batch_texts)
+
+            # 배치를 동시 처리 (동시 실행 수는 세마포어로 제한, 요청 제한은 토큰 버킷이 담당)
+            semaphore = asyncio.Semaphore(settings.AI_CONCURRENCY)
+
+            async def process_one(i: int, row):
                 news_data = {
-                    "title": news.title,
-                    "content_snippet": news.content_snippet,
-                    "raw_content": getattr(news, 'raw_content', None)
+                    "title": row.title,
+                    "content_snippet": row.content_snippet
                 }
-                
-                # AI 처리
-                result = await processor.process_news(news_data)
-                
-                # 결과 저장
-                news.summary = result.summary
-                news.sentiment_score = result.sentiment_score
-                news.sentiment_label = result.sentiment_label
-                news.keywords = result.keywords
-                news.is_controversial = result.is_controversial
-                news.pros_summary = result.pros_summary
-                news.cons_summary = result.cons_summary
-                news.mentioned_companies = result.mentioned_companies
-                news.embedding = result.embedding
-                news.is_processed = True
-                
-                processed_count += 1
-                logger.info(f"뉴스 처리 완료: {news.title[:50]}...")
-                
-                # API 요청 제한 방지
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"개별 뉴스 처리 실패 (ID: {news.id}): {e}")
-                continue
-        
-        db.commit()
-        
-        return {
-            "success": True,
-            "processed_count": processed_count,
-            "total_found": len(unprocessed_news)
-        }
-        
-    except Exception as e:
-        db.rollback()
-        logger.error(f"배치 처리 실패: {e}")
-        return {"success": False, "error": str(e)}
-        
-    finally:
-        db.close()
\ No newline at end of file
+
+                # 미리 계산한 임베딩 전달 (float32 배열 그대로)
+                embedding = None
+                if batch_embeddings is not None:
+                    embedding = batch_embeddings[i]
+
+                async with semaphore:
+                    try:
+                        result = await processor.process_news(
+                            news_data, embedding=embedding
+                        )
+                    except Exception as e:
+                        return row, e
+                    return row, result
+
+            # 전부 끝나길 기다렸다 쓰는 대신 as_completed로 완료되는 즉시
+            # 결과를 모아 _FLUSH_EVERY건마다 일괄 UPDATE - 남은 LLM 호출
+            # 지연과 DB 쓰기가 겹쳐 완료 결과를 메모리에 쌓아두지 않는다
+            _FLUSH_EVERY = 10
+            update_mappings = []
+            processed_count = 0
+
+            async def flush() -> None:
+                nonlocal processed_count
+                if update_mappings:
+                    # 기본키가 포함된 매핑 리스트의 executemany UPDATE
+                    await db.execute(update(News), update_mappings)
+                    await db.commit()
+                    processed_count += len(update_mappings)
+                    update_mappings.clear()
+
+            tasks = [
+                asyncio.ensure_future(process_one(i, row))
+                for i, row in enumerate(unprocessed_rows)
+            ]
+            for future in asyncio.as_completed(tasks):
+                row, result = await future
+                if isinstance(result, Exception):
+                    logger.error(f"개별 뉴스 처리 실패 (ID: {row.id}): {result}")
+                    continue
+
+                update_mappings.append({
+                    "id": row.id,
+                    "summary": result.summary,
+                    "sentiment_score": result.sentiment_score,
+                    "sentiment_label": result.sentiment_label,
+                    "keywords": result.keywords,
+                    "is_controversial": result.is_controversial,
+                    "pros_summary": result.pros_summary,
+                    "cons_summary": result.cons_summary,
+                    "mentioned_companies": result.mentioned_companies,
+                    # pgvector Vector 컬럼에 float32 배열로 전달
+                    # (JSON 리스트 직렬화 대비 IO/파싱 비용 ~6배 절감)
+                    "embedding": (
+                        np.asarray(result.embedding, dtype=np.float32)
+                        if result.embedding is not None
+                        else None
+                    ),
+                    "is_processed": True
+                })
+
+                logger.info(f"뉴스 처리 완료: {row.title[:50]}...")
+
+                if len(update_mappings) >= _FLUSH_EVERY:
+                    await flush()
+
+            await flush()
+
+            return {
+                "success": True,
+                "processed_count": processed_count,
+                "total_found": len(unprocessed_rows)
+            }
+
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"배치 처리 실패: {e}")
+            return {"success": False, "error": str(e)}
\ No newline at end of file
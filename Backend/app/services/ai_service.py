@@ -15,6 +15,7 @@ AI 처리 서비스
 OpenAI/Gemini API를 이용한 뉴스 요약, 감정분석, 찬반정리
 """
 import asyncio
+import json
 import logging
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
@@ -53,6 +54,12 @@ class AIService:
         self.openai_available = bool(settings.OPENAI_API_KEY)
         self.gemini_available = bool(settings.GEMINI_API_KEY)
         
+        # 네이티브 비동기 클라이언트 (스레드풀 우회 없이 이벤트 루프에서 처리)
+        self.openai_client = (
+            openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            if self.openai_available else None
+        )
+        
         if self.gemini_available:
             self.gemini_model = genai.GenerativeModel('gemini-pro')
         
@@ -67,32 +74,33 @@ class AIService:
         result = AIProcessingResult()
         
         try:
-            # 1. 뉴스 요약
-            summary_task = self.summarize_news(title, content, category)
-            
-            # 2. 감정 분석
-            sentiment_task = self.analyze_sentiment(title, content)
-            
-            # 3. 찬반 정리 (논쟁성 이슈인 경우)
-            pros_cons_task = self.analyze_pros_and_cons(title, content, category)
-            
-            # 병렬 처리
-            summary_result, sentiment_result, pros_cons_result = await asyncio.gather(
-                summary_task, sentiment_task, pros_cons_task,
-                return_exceptions=True
-            )
-            
-            # 결과 통합
-            if isinstance(summary_result, str):
-                result.ai_summary = summary_result
-            
-            if isinstance(sentiment_result, dict):
-                result.sentiment_score = sentiment_result.get('score')
-                result.sentiment_label = sentiment_result.get('label')
-            
-            if isinstance(pros_cons_result, str) and pros_cons_result.strip():
-                result.pros_and_cons = pros_cons_result
-            
+            # 요약/감정/찬반을 단일 호출로 처리 (기사 본문 프리필 비용 1회)
+            fused = await self._analyze_article_fused(title, content, category)
+
+            if fused is not None:
+                result.ai_summary = fused.get('summary')
+                result.sentiment_score = fused.get('sentiment_score')
+                result.sentiment_label = fused.get('sentiment_label')
+                result.pros_and_cons = fused.get('pros_and_cons')
+            else:
+                # 폴백: 기존 3회 분할 호출 병렬 처리
+                summary_result, sentiment_result, pros_cons_result = await asyncio.gather(
+                    self.summarize_news(title, content, category),
+                    self.analyze_sentiment(title, content),
+                    self.analyze_pros_and_cons(title, content, category),
+                    return_exceptions=True
+                )
+
+                if isinstance(summary_result, str):
+                    result.ai_summary = summary_result
+
+                if isinstance(sentiment_result, dict):
+                    result.sentiment_score = sentiment_result.get('score')
+                    result.sentiment_label = sentiment_result.get('label')
+
+                if isinstance(pros_cons_result, str) and pros_cons_result.strip():
+                    result.pros_and_cons = pros_cons_result
+
             processing_time = (datetime.now() - start_time).total_seconds()
             result.processing_time = processing_time
             
@@ -104,9 +112,192 @@ class AIService:
             logger.error(f"뉴스 AI 처리 오류: {e}")
             return result
     
-    async def summarize_news(self, 
-                           title: str, 
-                           content: str, 
+    async def _analyze_article_fused(self,
+                                   title: str,
+                                   content: str,
+                                   category: str = "") -> Optional[Dict]:
+        """
+        요약/감정분석/찬반정리를 단일 LLM 호출로 통합 처리
+
+        기사 본문을 3번 재전송하던 것을 1회로 줄인다.
+        호출 실패나 JSON 파싱 실패 시 None을 반환하여
+        기존 분할 호출 경로로 폴백한다.
+        """
+        content_preview = content[:3000] if len(content) > 3000 else content
+
+        prompt = f"""다음 뉴스 기사를 분석하고 반드시 아래 JSON 형식으로만 답변해주세요.
+
+제목: {title}
+카테고리: {category}
+내용: {content_preview}
+
+JSON 형식:
+{{
+  "summary": "핵심 내용만 담은 객관적이고 중립적인 3-4문장 요약",
+  "sentiment": {{"score": 0.0에서 1.0 사이 숫자, "label": "매우 긍정적/긍정적/중립적/부정적/매우 부정적 중 하나"}},
+  "controversy": {{"is": true 또는 false, "pros": "찬성 측 주요 논점 또는 null", "cons": "반대 측 주요 논점 또는 null"}}
+}}"""
+
+        response = ""
+        if self.gemini_available:
+            try:
+                gemini_response = await self.gemini_model.generate_content_async(
+                    prompt,
+                    generation_config={"response_mime_type": "application/json"}
+                )
+                response = gemini_response.text or ""
+            except Exception as e:
+                logger.warning(f"Gemini 통합 분석 실패: {e}")
+
+        if not response and self.openai_available:
+            try:
+                response = await self._call_openai(
+                    prompt,
+                    max_tokens=600,
+                    temperature=0.3,
+                    response_format={"type": "json_object"}
+                )
+            except Exception as e:
+                logger.warning(f"OpenAI 통합 분석 실패: {e}")
+
+        if not response:
+            return None
+
+        try:
+            data = json.loads(response)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("통합 분석 JSON 파싱 실패 - 분할 호출로 폴백")
+            return None
+
+        return self._parse_fused_payload(data)
+
+    def _parse_fused_payload(self, data: Dict) -> Dict:
+        """통합 분석 JSON 항목을 결과 딕셔너리로 정규화"""
+        sentiment = data.get("sentiment") or {}
+        controversy = data.get("controversy") or {}
+
+        try:
+            score = max(0.0, min(1.0, float(sentiment.get("score", 0.5))))
+        except (TypeError, ValueError):
+            score = 0.5
+
+        pros_and_cons = None
+        if controversy.get("is"):
+            pros = controversy.get("pros")
+            cons = controversy.get("cons")
+            if pros or cons:
+                pros_and_cons = (
+                    f"찬성 측 주요 논점:\n{pros or '없음'}\n\n"
+                    f"반대 측 주요 논점:\n{cons or '없음'}"
+                )
+
+        return {
+            "summary": data.get("summary"),
+            "sentiment_score": score,
+            "sentiment_label": sentiment.get("label") or "중립적",
+            "pros_and_cons": pros_and_cons
+        }
+
+    async def batch_summarize_and_analyze(self, articles: List[Dict]) -> Optional[List[AIProcessingResult]]:
+        """
+        여러 기사를 하나의 프롬프트로 묶어 일괄 분석
+
+        기사당 1회 호출 대신 K개 기사를 한 번에 보내 요청 수와
+        프롬프트 공통 부분 비용을 1/K로 줄인다. 호출/파싱 실패 또는
+        결과 개수 불일치 시 None을 반환해 개별 처리로 폴백한다.
+        """
+        if not articles:
+            return []
+
+        start_time = datetime.now()
+
+        sections = []
+        for idx, article in enumerate(articles, start=1):
+            content = article.get('content', '')
+            content_preview = content[:1500] if len(content) > 1500 else content
+            sections.append(
+                f"## 기사 {idx}\n"
+                f"제목: {article.get('title', '')}\n"
+                f"카테고리: {article.get('category', '')}\n"
+                f"내용: {content_preview}"
+            )
+
+        articles_block = "\n\n".join(sections)
+
+        prompt = f"""다음 {len(articles)}개의 뉴스 기사를 각각 분석해주세요.
+반드시 아래 JSON 형식으로만, 기사 순서대로 답변해주세요.
+
+{articles_block}
+
+JSON 형식:
+{{
+  "results": [
+    {{
+      "summary": "핵심 내용만 담은 객관적이고 중립적인 3-4문장 요약",
+      "sentiment": {{"score": 0.0에서 1.0 사이 숫자, "label": "매우 긍정적/긍정적/중립적/부정적/매우 부정적 중 하나"}},
+      "controversy": {{"is": true 또는 false, "pros": "찬성 측 주요 논점 또는 null", "cons": "반대 측 주요 논점 또는 null"}}
+    }}
+  ]
+}}"""
+
+        response = ""
+        if self.gemini_available:
+            try:
+                gemini_response = await self.gemini_model.generate_content_async(
+                    prompt,
+                    generation_config={"response_mime_type": "application/json"}
+                )
+                response = gemini_response.text or ""
+            except Exception as e:
+                logger.warning(f"Gemini 일괄 분석 실패: {e}")
+
+        if not response and self.openai_available:
+            try:
+                response = await self._call_openai(
+                    prompt,
+                    max_tokens=300 * len(articles) + 300,
+                    temperature=0.3,
+                    response_format={"type": "json_object"}
+                )
+            except Exception as e:
+                logger.warning(f"OpenAI 일괄 분석 실패: {e}")
+
+        if not response:
+            return None
+
+        try:
+            data = json.loads(response)
+        except (json.JSONDecodeError, TypeError):
+            logger.warning("일괄 분석 JSON 파싱 실패 - 개별 처리로 폴백")
+            return None
+
+        entries = data.get("results")
+        if not isinstance(entries, list) or len(entries) != len(articles):
+            logger.warning(
+                f"일괄 분석 결과 개수 불일치 ({len(entries) if isinstance(entries, list) else '없음'}"
+                f"/{len(articles)}) - 개별 처리로 폴백"
+            )
+            return None
+
+        processing_time = (datetime.now() - start_time).total_seconds()
+
+        results = []
+        for entry in entries:
+            parsed = self._parse_fused_payload(entry if isinstance(entry, dict) else {})
+            results.append(AIProcessingResult(
+                ai_summary=parsed.get('summary'),
+                sentiment_score=parsed.get('sentiment_score'),
+                sentiment_label=parsed.get('sentiment_label'),
+                pros_and_cons=parsed.get('pros_and_cons'),
+                processing_time=processing_time
+            ))
+
+        logger.info(f"뉴스 {len(articles)}건 일괄 AI 처리 완료 - 소요시간: {processing_time:.2f}초")
+        return results
+
+    async def summarize_news(self,
+                           title: str,
+                           content: str,
                            category: str = "") -> str:
         """뉴스 기사 요약"""
         try:
@@ -272,27 +463,30 @@ class AIService:
     async def _call_gemini(self, prompt: str) -> str:
         """Gemini API 호출"""
         try:
-            response = await asyncio.to_thread(
-                self.gemini_model.generate_content, prompt
-            )
+            response = await self.gemini_model.generate_content_async(prompt)
             return response.text if response.text else ""
         except Exception as e:
             logger.error(f"Gemini API 오류: {e}")
             raise
     
-    async def _call_openai(self, 
-                          prompt: str, 
-                          max_tokens: int = 150, 
-                          temperature: float = 0.3) -> str:
+    async def _call_openai(self,
+                          prompt: str,
+                          max_tokens: int = 150,
+                          temperature: float = 0.3,
+                          response_format: Optional[Dict] = None) -> str:
         """OpenAI API 호출"""
         try:
-            response = await asyncio.to_thread(
-                openai.ChatCompletion.create,
+            extra_kwargs = {}
+            if response_format is not None:
+                extra_kwargs["response_format"] = response_format
+
+            response = await self.openai_client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
                 temperature=temperature,
-                timeout=30
+                timeout=30,
+                **extra_kwargs
             )
             return response.choices[0].message.content if response.choices else ""
         except Exception as e:
@@ -319,35 +513,56 @@ class AIService:
 ai_service = AIService()
 
 
-async def batch_process_news(news_items: List[Dict]) -> List[AIProcessingResult]:
-    """뉴스 배치 처리"""
-    results = []
-    
-    # 동시 처리 수 제한 (API 레이트 리밋 고려)
+async def batch_process_news(news_items: List[Dict], k: int = 5) -> List[AIProcessingResult]:
+    """뉴스 배치 처리 (K개 기사를 한 프롬프트로 묶어 호출 수 절감)"""
+    if not news_items:
+        return []
+
+    # 동시 처리 수 제한 (API 레이트 리밋 고려) - 청크 단위로 적용
     semaphore = asyncio.Semaphore(3)
-    
-    async def process_single_news(news_item):
+
+    chunks = [news_items[i:i + k] for i in range(0, len(news_items), k)]
+
+    async def process_chunk(chunk):
         async with semaphore:
-            return await ai_service.process_news_article(
-                title=news_item.get('title', ''),
-                content=news_item.get('content', ''),
-                category=news_item.get('category', '')
-            )
-    
-    # 모든 뉴스 병렬 처리
-    tasks = [process_single_news(item) for item in news_items]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    # 예외 처리
+            batch_results = await ai_service.batch_summarize_and_analyze(chunk)
+            if batch_results is not None:
+                return batch_results
+
+            # 폴백: 청크 내 기사를 개별 처리
+            return await asyncio.gather(*[
+                ai_service.process_news_article(
+                    title=item.get('title', ''),
+                    content=item.get('content', ''),
+                    category=item.get('category', '')
+                )
+                for item in chunk
+            ], return_exceptions=True)
+
+    chunk_results = await asyncio.gather(
+        *[process_chunk(chunk) for chunk in chunks],
+        return_exceptions=True
+    )
+
+    # 청크 결과를 기사 단위로 펼치고 예외 처리
     processed_results = []
-    for i, result in enumerate(results):
-        if isinstance(result, AIProcessingResult):
-            processed_results.append(result)
-        else:
-            error_result = AIProcessingResult(error=str(result))
-            processed_results.append(error_result)
-            logger.error(f"뉴스 {i} AI 처리 실패: {result}")
-    
+    for i, chunk in enumerate(chunks):
+        result = chunk_results[i]
+
+        if isinstance(result, Exception):
+            logger.error(f"뉴스 청크 {i} AI 처리 실패: {result}")
+            processed_results.extend(
+                AIProcessingResult(error=str(result)) for _ in chunk
+            )
+            continue
+
+        for item_result in result:
+            if isinstance(item_result, AIProcessingResult):
+                processed_results.append(item_result)
+            else:
+                processed_results.append(AIProcessingResult(error=str(item_result)))
+                logger.error(f"뉴스 AI 처리 실패: {item_result}")
+
     return processed_results
 
 
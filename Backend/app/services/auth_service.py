@@ -15,16 +15,143 @@
 """
 from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.models.user import User
 from app.schemas.auth import UserResponse, UserUpdateRequest
-from app.utils.supabase_client import supabase_client, supabase_admin_client
+from app.utils.supabase_client import get_supabase_client
 from app.utils.auth import verify_supabase_token, AuthError
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
+import base64
+import hashlib
+import json
+import jwt
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 토큰별 UserResponse 단기 캐시 (핫 토큰의 반복 검증/재구성 방지)
+# 원본 토큰 대신 SHA-256 해시를 키로 사용
+_USER_RESPONSE_CACHE_TTL = 15.0  # 초
+_USER_RESPONSE_CACHE_MAX = 4096
+_user_response_cache: Dict[str, tuple] = {}
+
+
+def _token_cache_key(token: str) -> str:
+    """토큰의 SHA-256 해시 캐시 키 생성"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_cached_user_response(token: str) -> Optional[UserResponse]:
+    """토큰에 대해 캐시된 UserResponse 조회 (TTL 만료 시 None)"""
+    entry = _user_response_cache.get(_token_cache_key(token))
+    if not entry:
+        return None
+
+    cached_at, user_response = entry
+    if time.monotonic() - cached_at > _USER_RESPONSE_CACHE_TTL:
+        _user_response_cache.pop(_token_cache_key(token), None)
+        return None
+
+    return user_response
+
+
+def cache_user_response(token: str, user_response: UserResponse) -> None:
+    """토큰별 UserResponse 캐시 저장"""
+    if len(_user_response_cache) >= _USER_RESPONSE_CACHE_MAX:
+        # 가장 오래된 항목부터 제거 (dict는 삽입 순서 유지)
+        oldest_key = next(iter(_user_response_cache))
+        _user_response_cache.pop(oldest_key, None)
+
+    _user_response_cache[_token_cache_key(token)] = (time.monotonic(), user_response)
+
+
+# 검증 완료된 토큰 클레임 단기 캐시
+# 핫 토큰의 요청마다 반복되는 전체 토큰 검증을 건너뛴다
+_TOKEN_CLAIMS_CACHE_TTL = 30.0  # 초
+_TOKEN_CLAIMS_CACHE_MAX = 10000
+_token_claims_cache: Dict[str, tuple] = {}
+
+
+def _get_cached_token_claims(token: str) -> Optional[Dict[str, Any]]:
+    """캐시된 토큰 클레임 조회 (TTL 또는 토큰 만료 경과 시 None)"""
+    key = _token_cache_key(token)
+    entry = _token_claims_cache.get(key)
+    if not entry:
+        return None
+
+    cached_at, expires_at, user_info = entry
+
+    if time.monotonic() - cached_at > _TOKEN_CLAIMS_CACHE_TTL:
+        _token_claims_cache.pop(key, None)
+        return None
+
+    # 캐시 히트여도 토큰 자체의 exp는 재확인
+    if expires_at is not None and expires_at <= time.time():
+        _token_claims_cache.pop(key, None)
+        return None
+
+    return user_info
+
+
+def _cache_token_claims(token: str, user_info: Dict[str, Any]) -> None:
+    """검증 완료된 토큰 클레임 캐시 저장"""
+    if len(_token_claims_cache) >= _TOKEN_CLAIMS_CACHE_MAX:
+        # 가장 오래된 항목부터 제거 (dict는 삽입 순서 유지)
+        _token_claims_cache.pop(next(iter(_token_claims_cache)), None)
+
+    # 만료 시각은 서명 검증 없이 클레임에서만 읽는다 (검증은 이미 완료됨)
+    expires_at = None
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+        expires_at = claims.get("exp")
+    except Exception:
+        pass
+
+    _token_claims_cache[_token_cache_key(token)] = (time.monotonic(), expires_at, user_info)
+
+
+# 프로필 업데이트가 허용된 컬럼 (hasattr 반복 검사 대신 집합 필터)
+# UserUpdateRequest의 필드와 일치해야 한다 (schemas/auth.py)
+_UPDATABLE_PROFILE_FIELDS = frozenset(
+    {"display_name", "email_notifications_enabled", "email_send_time"}
+)
+
+
+# 검증 실패 토큰 단기 네거티브 캐시
+# 동일한 무효 토큰이 반복 유입될 때(재전송/크리덴셜 스터핑) 서명 검증 CPU를 아낀다
+# TTL을 짧게 유지해 키 회전 등으로 유효해진 토큰이 오래 막히지 않도록 한다
+_INVALID_TOKEN_CACHE_TTL = 5.0  # 초
+_INVALID_TOKEN_CACHE_MAX = 2048
+_invalid_token_cache: Dict[str, tuple] = {}
+
+
+def _get_cached_invalid_reason(token: str) -> Optional[str]:
+    """캐시된 검증 실패 사유 조회 (TTL 만료 시 None)"""
+    key = _token_cache_key(token)
+    entry = _invalid_token_cache.get(key)
+    if not entry:
+        return None
+
+    cached_at, reason = entry
+    if time.monotonic() - cached_at > _INVALID_TOKEN_CACHE_TTL:
+        _invalid_token_cache.pop(key, None)
+        return None
+
+    return reason
+
+
+def _cache_invalid_token(token: str, reason: str) -> None:
+    """검증 실패 토큰 캐시 저장"""
+    if len(_invalid_token_cache) >= _INVALID_TOKEN_CACHE_MAX:
+        # 가장 오래된 항목부터 제거 (dict는 삽입 순서 유지)
+        _invalid_token_cache.pop(next(iter(_invalid_token_cache)), None)
+
+    _invalid_token_cache[_token_cache_key(token)] = (time.monotonic(), reason)
+
+
 class AuthService:
     """인증 관련 비즈니스 로직"""
     
@@ -44,7 +171,9 @@ class AuthService:
         """
         try:
             # Supabase를 통한 구글 OAuth 인증
-            response = supabase_client.auth.sign_in_with_oauth_credentials(
+            # (동기 클라이언트의 네트워크 호출이 이벤트 루프를 막지 않도록 스레드로 위임)
+            response = await asyncio.to_thread(
+                get_supabase_client().auth.sign_in_with_oauth_credentials,
                 {
                     "provider": "google",
                     "access_token": access_token
@@ -88,41 +217,41 @@ class AuthService:
         """
         try:
             supabase_id = supabase_user["user_id"]
-            
-            # 기존 사용자 조회
-            result = await db.execute(
-                select(User).where(User.supabase_id == supabase_id)
+            user_metadata = supabase_user.get("user_metadata", {})
+
+            # SELECT 후 INSERT/UPDATE 2~3회 왕복 대신 단일 UPSERT
+            # (SELECT와 INSERT 사이의 경쟁 조건도 함께 제거)
+            stmt = pg_insert(User).values(
+                supabase_id=supabase_id,
+                email=supabase_user["email"],
+                display_name=user_metadata.get("full_name", ""),
+                avatar_url=user_metadata.get("avatar_url", ""),
+                is_active=True,
+                email_notifications_enabled=True,
+                last_login_at=datetime.now(timezone.utc)
             )
-            user = result.scalar_one_or_none()
-            
-            if user:
-                # 기존 사용자 정보 업데이트
-                user.last_login_at = datetime.utcnow()
-                user.email = supabase_user["email"]
-                
-                # 프로필 정보 업데이트 (변경된 경우만)
-                user_metadata = supabase_user.get("user_metadata", {})
-                if user_metadata.get("full_name"):
-                    user.display_name = user_metadata["full_name"]
-                if user_metadata.get("avatar_url"):
-                    user.avatar_url = user_metadata["avatar_url"]
-                    
-            else:
-                # 새 사용자 생성
-                user_metadata = supabase_user.get("user_metadata", {})
-                user = User(
-                    supabase_id=supabase_id,
-                    email=supabase_user["email"],
-                    display_name=user_metadata.get("full_name", ""),
-                    avatar_url=user_metadata.get("avatar_url", ""),
-                    is_active=True,
-                    email_notifications_enabled=True,
-                    last_login_at=datetime.utcnow()
-                )
-                db.add(user)
-            
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["supabase_id"],
+                set_={
+                    "email": stmt.excluded.email,
+                    "last_login_at": stmt.excluded.last_login_at,
+                    # 메타데이터가 비어 있으면 기존 프로필 값 유지
+                    "display_name": func.coalesce(
+                        func.nullif(stmt.excluded.display_name, ""),
+                        User.display_name
+                    ),
+                    "avatar_url": func.coalesce(
+                        func.nullif(stmt.excluded.avatar_url, ""),
+                        User.avatar_url
+                    )
+                }
+            ).returning(User)
+
+            result = await db.execute(stmt)
+            user = result.scalar_one()
+
+            # RETURNING으로 행을 이미 받았으므로 refresh 불필요
             await db.commit()
-            await db.refresh(user)
             return user
             
         except Exception as e:
@@ -141,14 +270,56 @@ class AuthService:
         Returns:
             검증 결과
         """
+        # 서명 검증 전에 형식/만료를 저비용으로 선별
+        # (명백히 잘못되거나 만료된 토큰에 비싼 검증 비용을 쓰지 않는다)
+        parts = token.split(".") if token else []
+        if len(parts) != 3:
+            return {
+                "valid": False,
+                "user": None,
+                "message": "잘못된 토큰 형식입니다"
+            }
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=="))
+            if payload.get("exp") and payload["exp"] < time.time():
+                return {
+                    "valid": False,
+                    "user": None,
+                    "message": "만료된 토큰입니다"
+                }
+        except Exception:
+            # 페이로드 해석 실패는 본 검증 단계에서 판정
+            pass
+
+        # 최근에 검증 실패한 토큰이면 재검증 없이 즉시 거부
+        cached_reason = _get_cached_invalid_reason(token)
+        if cached_reason is not None:
+            return {
+                "valid": False,
+                "user": None,
+                "message": cached_reason
+            }
+
+        # 단기 캐시 히트 시 전체 검증 생략
+        cached_info = _get_cached_token_claims(token)
+        if cached_info is not None:
+            return {
+                "valid": True,
+                "user": cached_info,
+                "message": None
+            }
+
         try:
             user_info = verify_supabase_token(token)
+            _cache_token_claims(token, user_info)
             return {
                 "valid": True,
                 "user": user_info,
                 "message": None
             }
         except AuthError as e:
+            _cache_invalid_token(token, str(e))
             return {
                 "valid": False,
                 "user": None,
@@ -167,8 +338,8 @@ class AuthService:
             로그아웃 성공 여부
         """
         try:
-            # Supabase 세션 종료
-            supabase_client.auth.sign_out()
+            # Supabase 세션 종료 (블로킹 호출을 스레드로 위임)
+            await asyncio.to_thread(get_supabase_client().auth.sign_out)
             return True
         except Exception as e:
             logger.error(f"로그아웃 중 오류 발생: {e}")
@@ -192,27 +363,37 @@ class AuthService:
             업데이트된 User 모델 또는 None
         """
         try:
-            # 사용자 조회
-            result = await db.execute(
-                select(User).where(User.supabase_id == user_id)
+            # 허용된 필드만 추려 SELECT 없이 단일 UPDATE로 반영
+            update_dict = {
+                field: value
+                for field, value in update_data.model_dump(exclude_unset=True).items()
+                if field in _UPDATABLE_PROFILE_FIELDS
+            }
+
+            stmt = (
+                update(User)
+                .where(User.supabase_id == user_id)
+                .values(**update_dict, updated_at=datetime.now(timezone.utc))
+                .returning(User)
             )
+
+            result = await db.execute(stmt)
             user = result.scalar_one_or_none()
-            
+
             if not user:
+                await db.rollback()
                 return None
-            
-            # 업데이트 적용
-            update_dict = update_data.model_dump(exclude_unset=True)
-            for field, value in update_dict.items():
-                if hasattr(user, field):
-                    setattr(user, field, value)
-            
-            user.updated_at = datetime.utcnow()
-            
+
+            # RETURNING으로 행을 이미 받았으므로 refresh 불필요
             await db.commit()
-            await db.refresh(user)
+
+            # 설정 변경이 즉시 반영되도록 미리보기 캐시 무효화
+            # (순환 임포트 방지를 위해 지역 임포트)
+            from app.services.content_generator import invalidate_content_preview
+            invalidate_content_preview(user.id)
+
             return user
-            
+
         except Exception as e:
             logger.error(f"사용자 프로필 업데이트 중 오류 발생: {e}")
             await db.rollback()
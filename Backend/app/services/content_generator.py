@@ -2,30 +2,92 @@
 개인화된 뉴스 콘텐츠 생성 서비스
 사용자별 맞춤형 뉴스 데이터 생성 및 최적화
 """
+import asyncio
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+import time
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Awaitable, Callable, List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import async_session
 from app.models.user import User
-from app.services.personalization import get_personalized_news_for_user
-from app.services.email_service import send_daily_news_email
+from app.services.personalization import (
+    get_personalized_news_for_user,
+    get_personalized_news_for_users
+)
+from app.services.email_service import send_daily_news_email, send_bulk_daily_news
 
 logger = logging.getLogger(__name__)
 
+# 미리보기 결과 단기 캐시 (UI 폴링/재시도 시 전체 파이프라인 재실행 방지)
+_PREVIEW_CACHE_TTL = 60.0  # 초
+_PREVIEW_CACHE_MAX = 1000
+_preview_cache: Dict[int, tuple] = {}
+
+
+def _get_cached_preview(user_id: int) -> Optional[Dict[str, Any]]:
+    """캐시된 미리보기 조회 (TTL 만료 시 None)"""
+    entry = _preview_cache.get(user_id)
+    if not entry:
+        return None
+
+    cached_at, preview = entry
+    if time.monotonic() - cached_at > _PREVIEW_CACHE_TTL:
+        _preview_cache.pop(user_id, None)
+        return None
+
+    return preview
+
+
+def _cache_preview(user_id: int, preview: Dict[str, Any]) -> None:
+    """미리보기 캐시 저장"""
+    if len(_preview_cache) >= _PREVIEW_CACHE_MAX:
+        # 가장 오래된 항목부터 제거 (dict는 삽입 순서 유지)
+        _preview_cache.pop(next(iter(_preview_cache)), None)
+
+    _preview_cache[user_id] = (time.monotonic(), preview)
+
+
+def invalidate_content_preview(user_id: int) -> None:
+    """미리보기 캐시 무효화 (프로필/구독 변경 시 즉시 반영용)"""
+    _preview_cache.pop(user_id, None)
+
+
+@dataclass(slots=True)
+class UserContent:
+    """사용자별 생성 콘텐츠
+
+    일괄 발송 중 수천 건이 메모리에 머무를 수 있어
+    딕셔너리 대신 __slots__ 데이터클래스로 객체당 메모리를 줄인다.
+    """
+    user_id: int
+    user_email: str
+    user_name: str
+    news_data: Dict[str, Any]
+    generated_at: str
+
 
 class ContentGenerator:
     """개인화된 뉴스 콘텐츠 생성기"""
-    
+
+    # 일괄 생성 시 한 번에 스트리밍/처리하는 사용자 수
+    _BULK_PARTITION_SIZE = 500
+
+    # 이메일 발송 시 한 번에 묶어 보내는 수신자 수
+    _SEND_BATCH_SIZE = 50
+
     def __init__(self):
         pass
     
     async def generate_user_content(
         self,
         user_id: int,
-        db: Session = None
-    ) -> Optional[Dict[str, Any]]:
+        db: AsyncSession = None
+    ) -> Optional[UserContent]:
         """
         단일 사용자를 위한 개인화된 뉴스 콘텐츠 생성
         
@@ -36,52 +98,77 @@ class ContentGenerator:
         Returns:
             개인화된 뉴스 데이터 또는 None
         """
-        if not db:
-            db = next(get_db())
+        if db is None:
+            async with async_session() as own_db:
+                return await self.generate_user_content(user_id=user_id, db=own_db)
         
         try:
-            # 사용자 정보 조회
-            user = db.query(User).filter(User.id == user_id).first()
+            # 사용자 정보 조회 (이벤트 루프를 막지 않는 비동기 쿼리)
+            result = await db.execute(select(User).where(User.id == user_id))
+            user = result.scalar_one_or_none()
             if not user:
                 logger.warning(f"사용자를 찾을 수 없습니다: {user_id}")
                 return None
-            
+
+            return await self._generate_for_prefetched_user(user, db)
+
+        except Exception as e:
+            logger.error(f"사용자 콘텐츠 생성 실패 (user_id: {user_id}): {e}")
+            return None
+
+    async def _generate_for_prefetched_user(
+        self,
+        user: User,
+        db: AsyncSession,
+        personalized_data: Optional[Dict[str, Any]] = None,
+        generated_at: Optional[str] = None
+    ) -> Optional[UserContent]:
+        """
+        이미 로드된 User 객체로 콘텐츠 생성
+
+        일괄 생성 경로에서 사용자별 재조회(N+1)를 피하기 위해
+        사용자 조회 이후의 로직을 분리한 내부 메소드. 일괄 경로는
+        미리 조회한 개인화 데이터를 넘겨 뉴스 조회도 생략할 수 있다.
+        """
+        try:
             # 이메일 알림이 비활성화된 사용자 건너뛰기
             if not user.email_notifications_enabled:
                 logger.info(f"이메일 알림 비활성화 사용자 건너뛰기: {user.email}")
                 return None
-            
-            # 개인화된 뉴스 조회
-            personalized_data = await get_personalized_news_for_user(
-                user_id=user_id,
-                limit=20,  # 충분한 뉴스 수집
-                days=1,    # 최근 1일
-                db=db
-            )
-            
+
+            # 개인화된 뉴스 조회 (미리 조회된 데이터가 없는 경우만)
+            if personalized_data is None:
+                personalized_data = await get_personalized_news_for_user(
+                    user_id=user.id,
+                    limit=20,  # 충분한 뉴스 수집
+                    days=1,    # 최근 1일
+                    db=db
+                )
+
             # 에러 처리
             if "error" in personalized_data:
-                logger.error(f"개인화 뉴스 조회 실패 (user_id: {user_id}): {personalized_data['error']}")
+                logger.error(f"개인화 뉴스 조회 실패 (user_id: {user.id}): {personalized_data['error']}")
                 return None
-            
+
             # 뉴스가 없는 경우
             if personalized_data.get("total_news", 0) == 0:
-                logger.warning(f"사용자 {user_id}에 대한 개인화 뉴스가 없습니다")
+                logger.warning(f"사용자 {user.id}에 대한 개인화 뉴스가 없습니다")
                 return None
-            
+
             # 콘텐츠 최적화
             optimized_content = await self._optimize_content(personalized_data, user)
-            
-            return {
-                "user_id": user_id,
-                "user_email": user.email,
-                "user_name": user.name or "사용자",
-                "news_data": optimized_content,
-                "generated_at": datetime.now().isoformat()
-            }
-            
+
+            return UserContent(
+                user_id=user.id,
+                user_email=user.email,
+                user_name=user.name or "사용자",
+                news_data=optimized_content,
+                # 일괄 경로에서는 배치 단위로 한 번 계산한 시각을 재사용
+                generated_at=generated_at or datetime.now(timezone.utc).isoformat()
+            )
+
         except Exception as e:
-            logger.error(f"사용자 콘텐츠 생성 실패 (user_id: {user_id}): {e}")
+            logger.error(f"사용자 콘텐츠 생성 실패 (user_id: {user.id}): {e}")
             return None
     
     async def _optimize_content(
@@ -96,55 +183,43 @@ class ContentGenerator:
         - 이메일 길이 최적화
         """
         try:
-            optimized = personalized_data.copy()
-            
-            # 카테고리별 뉴스 개수 제한 (최대 3개씩)
-            if "news_by_category" in optimized:
-                for category, news_list in optimized["news_by_category"].items():
-                    if len(news_list) > 3:
-                        # 최신순으로 정렬 후 상위 3개만 유지
-                        sorted_news = sorted(
-                            news_list, 
-                            key=lambda x: x.get("published_at", ""), 
-                            reverse=True
-                        )
-                        optimized["news_by_category"][category] = sorted_news[:3]
-            
-            # 기업별 뉴스 개수 제한 (최대 2개씩)
-            if "news_by_company" in optimized:
-                for company, news_list in optimized["news_by_company"].items():
-                    if len(news_list) > 2:
-                        sorted_news = sorted(
-                            news_list,
-                            key=lambda x: x.get("published_at", ""),
-                            reverse=True
-                        )
-                        optimized["news_by_company"][company] = sorted_news[:2]
-            
-            # 논쟁 이슈 제한 (최대 3개)
-            if "controversial_news" in optimized:
-                controversial = optimized["controversial_news"]
-                if len(controversial) > 3:
-                    # 최신순으로 정렬 후 상위 3개만 유지
-                    sorted_controversial = sorted(
-                        controversial,
-                        key=lambda x: x.get("published_at", ""),
-                        reverse=True
-                    )
-                    optimized["controversial_news"] = sorted_controversial[:3]
-            
-            # 총 뉴스 개수 재계산
-            total_category_news = sum(
-                len(news_list) 
-                for news_list in optimized.get("news_by_category", {}).values()
-            )
-            total_company_news = sum(
-                len(news_list) 
-                for news_list in optimized.get("news_by_company", {}).values()
-            )
-            controversial_count = len(optimized.get("controversial_news", []))
-            
-            optimized["total_news"] = total_category_news + total_company_news + controversial_count
+            # 상위 k개만 필요하므로 전체 정렬 대신 heapq.nlargest 사용 (O(n log k))
+            recency_key = itemgetter("published_at")
+
+            # 얕은 copy 후 중첩 딕셔너리를 덮어쓰면 원본까지 변형되므로
+            # 잘라낼 키만 새로 만들고 나머지는 참조를 공유한다
+            # 총 뉴스 개수도 별도 순회 없이 자르는 동안 함께 집계한다
+
+            # 카테고리별 뉴스 개수 제한 (최대 3개씩, 최신순)
+            news_by_category = {}
+            total_category_news = 0
+            for category, news_list in personalized_data.get("news_by_category", {}).items():
+                if len(news_list) > 3:
+                    news_list = heapq.nlargest(3, news_list, key=recency_key)
+                news_by_category[category] = news_list
+                total_category_news += len(news_list)
+
+            # 기업별 뉴스 개수 제한 (최대 2개씩, 최신순)
+            news_by_company = {}
+            total_company_news = 0
+            for company, news_list in personalized_data.get("news_by_company", {}).items():
+                if len(news_list) > 2:
+                    news_list = heapq.nlargest(2, news_list, key=recency_key)
+                news_by_company[company] = news_list
+                total_company_news += len(news_list)
+
+            # 논쟁 이슈 제한 (최대 3개, 최신순)
+            controversial = personalized_data.get("controversial_news", [])
+            if len(controversial) > 3:
+                controversial = heapq.nlargest(3, controversial, key=recency_key)
+
+            optimized = {
+                **personalized_data,
+                "news_by_category": news_by_category,
+                "news_by_company": news_by_company,
+                "controversial_news": controversial,
+                "total_news": total_category_news + total_company_news + len(controversial)
+            }
             
             # 사용자별 추가 최적화 (시간대 등)
             optimized = await self._apply_user_preferences(optimized, user)
@@ -177,55 +252,103 @@ class ContentGenerator:
     async def generate_bulk_content(
         self,
         limit: Optional[int] = None,
-        db: Session = None
-    ) -> List[Dict[str, Any]]:
+        db: AsyncSession = None,
+        on_content: Optional[Callable[["UserContent"], Awaitable[None]]] = None
+    ) -> List["UserContent"]:
         """
         모든 활성 사용자를 위한 일괄 콘텐츠 생성
-        
+
         Args:
             limit: 처리할 사용자 수 제한 (테스트용)
             db: 데이터베이스 세션
-            
+            on_content: 콘텐츠가 생성될 때마다 호출되는 비동기 콜백
+                        (발송 파이프라인과의 중첩 처리용)
+
         Returns:
             생성된 콘텐츠 목록
         """
-        if not db:
-            db = next(get_db())
+        if db is None:
+            async with async_session() as own_db:
+                return await self.generate_bulk_content(
+                    limit=limit, db=own_db, on_content=on_content
+                )
         
         try:
-            # 이메일 알림이 활성화된 사용자 조회
-            query = db.query(User).filter(
+            # 이메일 알림이 활성화된 사용자를 서버측 커서로 스트리밍 조회
+            # (.all() 전체 적재 대신 파티션 단위 처리로 메모리 사용량을 일정하게 유지)
+            stmt = select(User).where(
                 User.is_active == True,
                 User.email_notifications_enabled == True
-            )
-            
+            ).execution_options(yield_per=self._BULK_PARTITION_SIZE)
+
             if limit:
-                query = query.limit(limit)
-            
-            active_users = query.all()
-            
-            logger.info(f"일괄 콘텐츠 생성 시작 - 대상 사용자: {len(active_users)}명")
-            
+                stmt = stmt.limit(limit)
+
+            logger.info("일괄 콘텐츠 생성 시작")
+
+            # 배치 시각은 한 번만 계산해 전 사용자에 동일하게 기록
+            # (시계 조회 반복 제거 + 배치 단위 디버깅 용이)
+            batch_generated_at = datetime.now(timezone.utc).isoformat()
+
+            # 사용자별 파이프라인은 서로 독립적이므로 제한된 동시성으로 병렬 처리
+            semaphore = asyncio.Semaphore(16)
+
+            async def generate_one(
+                user: User,
+                personalized_data: Optional[Dict[str, Any]]
+            ) -> Optional[UserContent]:
+                async with semaphore:
+                    # AsyncSession은 태스크 간 공유가 안전하지 않으므로 태스크마다 새로 연다
+                    # 이미 로드된 User와 미리 조회한 개인화 데이터를 넘겨 재조회를 생략
+                    async with async_session() as task_db:
+                        return await self._generate_for_prefetched_user(
+                            user,
+                            task_db,
+                            personalized_data=personalized_data,
+                            generated_at=batch_generated_at
+                        )
+
             generated_contents = []
-            
-            for user in active_users:
-                try:
-                    content = await self.generate_user_content(
-                        user_id=user.id,
-                        db=db
+            total_users = 0
+
+            stream = await db.stream(stmt)
+
+            async for partition in stream.scalars().partitions(self._BULK_PARTITION_SIZE):
+                users = list(partition)
+                total_users += len(users)
+
+                # 파티션 내 사용자의 개인화 뉴스를 일괄 조회 (사용자별 N회 왕복 제거)
+                # 스트리밍 커서가 열린 세션과 분리된 세션에서 수행
+                async with async_session() as batch_db:
+                    bulk_personalized = await get_personalized_news_for_users(
+                        user_ids=[user.id for user in users],
+                        limit=20,
+                        days=1,
+                        db=batch_db
                     )
-                    
-                    if content:
-                        generated_contents.append(content)
+
+                results = await asyncio.gather(
+                    *(
+                        generate_one(user, bulk_personalized.get(user.id))
+                        for user in users
+                    ),
+                    return_exceptions=True
+                )
+
+                for user, result in zip(users, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"사용자 {user.email} 콘텐츠 생성 중 오류: {result}")
+                    elif result:
+                        generated_contents.append(result)
+                        if on_content is not None:
+                            await on_content(result)
                         logger.debug(f"콘텐츠 생성 성공: {user.email}")
                     else:
                         logger.warning(f"콘텐츠 생성 실패: {user.email}")
-                        
-                except Exception as e:
-                    logger.error(f"사용자 {user.email} 콘텐츠 생성 중 오류: {e}")
-                    continue
-            
-            logger.info(f"일괄 콘텐츠 생성 완료 - 성공: {len(generated_contents)}명")
+
+            logger.info(
+                f"일괄 콘텐츠 생성 완료 - 대상: {total_users}명, 성공: {len(generated_contents)}명"
+            )
             return generated_contents
             
         except Exception as e:
@@ -236,7 +359,7 @@ class ContentGenerator:
         self,
         test_mode: bool = False,
         test_limit: int = 5,
-        db: Session = None
+        db: AsyncSession = None
     ) -> Dict[str, int]:
         """
         일일 뉴스 이메일 생성 및 발송
@@ -250,32 +373,63 @@ class ContentGenerator:
             발송 결과 통계
         """
         try:
-            # 콘텐츠 생성
             limit = test_limit if test_mode else None
-            generated_contents = await self.generate_bulk_content(limit=limit, db=db)
-            
-            if not generated_contents:
+
+            # 생성과 발송을 생산자/소비자 큐로 중첩 처리
+            # (전체 생성 완료를 기다리지 않고 준비된 수신자부터 바로 발송)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=200)
+
+            async def enqueue_recipient(content: UserContent) -> None:
+                await queue.put({
+                    "email": content.user_email,
+                    "name": content.user_name,
+                    "news_data": content.news_data
+                })
+
+            async def produce() -> int:
+                try:
+                    generated = await self.generate_bulk_content(
+                        limit=limit, db=db, on_content=enqueue_recipient
+                    )
+                    return len(generated)
+                finally:
+                    # 소비자 종료 신호
+                    await queue.put(None)
+
+            async def consume() -> Dict[str, int]:
+                stats = {"success": 0, "failed": 0}
+                batch: List[Dict[str, Any]] = []
+
+                async def flush() -> None:
+                    if not batch:
+                        return
+                    send_results = await send_bulk_daily_news(batch)
+                    stats["success"] += send_results.get("success", 0)
+                    stats["failed"] += send_results.get("failed", 0)
+                    batch.clear()
+
+                while True:
+                    recipient = await queue.get()
+                    if recipient is None:
+                        break
+                    batch.append(recipient)
+                    if len(batch) >= self._SEND_BATCH_SIZE:
+                        await flush()
+
+                await flush()
+                return stats
+
+            generated_count, send_stats = await asyncio.gather(produce(), consume())
+
+            if generated_count == 0:
                 logger.warning("생성된 콘텐츠가 없습니다")
                 return {"success": 0, "failed": 0, "generated": 0}
-            
-            # 이메일 발송 준비
-            recipients = []
-            for content in generated_contents:
-                recipients.append({
-                    "email": content["user_email"],
-                    "name": content["user_name"],
-                    "news_data": content["news_data"]
-                })
-            
-            # 일괄 이메일 발송
-            from app.services.email_service import send_bulk_daily_news
-            send_results = await send_bulk_daily_news(recipients)
-            
+
             # 결과 통계
             results = {
-                "generated": len(generated_contents),
-                "success": send_results.get("success", 0),
-                "failed": send_results.get("failed", 0)
+                "generated": generated_count,
+                "success": send_stats["success"],
+                "failed": send_stats["failed"]
             }
             
             logger.info(f"일일 이메일 발송 완료 - 생성: {results['generated']}, 성공: {results['success']}, 실패: {results['failed']}")
@@ -289,7 +443,7 @@ class ContentGenerator:
     async def get_content_preview(
         self,
         user_id: int,
-        db: Session = None
+        db: AsyncSession = None
     ) -> Optional[Dict[str, Any]]:
         """
         사용자의 이메일 콘텐츠 미리보기 생성
@@ -301,31 +455,38 @@ class ContentGenerator:
         Returns:
             미리보기 콘텐츠
         """
+        # 단기 캐시 히트 시 전체 생성 파이프라인 생략
+        cached_preview = _get_cached_preview(user_id)
+        if cached_preview is not None:
+            return cached_preview
+
         try:
             content = await self.generate_user_content(user_id=user_id, db=db)
-            
+
             if not content:
                 return None
             
             # 미리보기용으로 일부 정보만 반환
+            news_data = content.news_data
             preview = {
-                "user_name": content["user_name"],
-                "total_news": content["news_data"].get("total_news", 0),
-                "categories": list(content["news_data"].get("news_by_category", {}).keys()),
-                "companies": list(content["news_data"].get("news_by_company", {}).keys()),
-                "controversial_count": len(content["news_data"].get("controversial_news", [])),
+                "user_name": content.user_name,
+                "total_news": news_data.get("total_news", 0),
+                "categories": list(news_data.get("news_by_category", {}).keys()),
+                "companies": list(news_data.get("news_by_company", {}).keys()),
+                "controversial_count": len(news_data.get("controversial_news", [])),
                 "sample_news": []
             }
             
             # 샘플 뉴스 추가 (각 카테고리에서 1개씩)
-            for category, news_list in content["news_data"].get("news_by_category", {}).items():
+            for category, news_list in news_data.get("news_by_category", {}).items():
                 if news_list:
                     preview["sample_news"].append({
                         "category": category,
                         "title": news_list[0].get("title", ""),
                         "summary": news_list[0].get("summary", "")[:100] + "..."
                     })
-            
+
+            _cache_preview(user_id, preview)
             return preview
             
         except Exception as e:
@@ -338,12 +499,12 @@ content_generator = ContentGenerator()
 
 
 # 편의 함수들
-async def generate_user_content(user_id: int, db: Session = None) -> Optional[Dict[str, Any]]:
+async def generate_user_content(user_id: int, db: AsyncSession = None) -> Optional[UserContent]:
     """사용자 콘텐츠 생성 편의 함수"""
     return await content_generator.generate_user_content(user_id=user_id, db=db)
 
 
-async def generate_bulk_content(limit: Optional[int] = None, db: Session = None) -> List[Dict[str, Any]]:
+async def generate_bulk_content(limit: Optional[int] = None, db: AsyncSession = None) -> List[UserContent]:
     """일괄 콘텐츠 생성 편의 함수"""
     return await content_generator.generate_bulk_content(limit=limit, db=db)
 
@@ -351,7 +512,7 @@ async def generate_bulk_content(limit: Optional[int] = None, db: Session = None)
 async def generate_and_send_daily_emails(
     test_mode: bool = False,
     test_limit: int = 5,
-    db: Session = None
+    db: AsyncSession = None
 ) -> Dict[str, int]:
     """일일 이메일 생성 및 발송 편의 함수"""
     return await content_generator.generate_and_send_daily_emails(
@@ -361,6 +522,6 @@ async def generate_and_send_daily_emails(
     )
 
 
-async def get_content_preview(user_id: int, db: Session = None) -> Optional[Dict[str, Any]]:
+async def get_content_preview(user_id: int, db: AsyncSession = None) -> Optional[Dict[str, Any]]:
     """콘텐츠 미리보기 편의 함수"""
     return await content_generator.get_content_preview(user_id=user_id, db=db)
\ No newline at end of file
@@ -4,21 +4,47 @@ Playwright를 사용한 주요 뉴스 사이트 크롤링
 """
 import asyncio
 import logging
+import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
 import re
 
+import lxml.html
+from lxml.cssselect import CSSSelector
 from playwright.async_api import async_playwright, Browser, Page
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from app.core.database import get_db
+from app.core.database import async_session
 from app.models.news import News
 from app.models.category import Category
 from app.services.ai_processor import AIProcessor
 
 logger = logging.getLogger(__name__)
 
+# 최근 저장/중복 확인된 URL의 프로세스 내 캐시
+# 연속된 크롤링 실행에서 같은 URL이 반복 유입될 때 DB 왕복 없이 걸러낸다
+_SEEN_URLS_MAX = 20000
+_seen_urls: Dict[str, bool] = {}
+
+
+def _remember_url(url: str) -> None:
+    """URL을 캐시에 기록 (가득 차면 가장 오래된 항목부터 제거)"""
+    if len(_seen_urls) >= _SEEN_URLS_MAX:
+        # dict는 삽입 순서를 유지하므로 첫 키가 가장 오래된 항목
+        _seen_urls.pop(next(iter(_seen_urls)), None)
+    _seen_urls[url] = True
+
+
+# 컴파일된 CSS 선택자 캐시 (선택자 파싱은 한 번만)
+_sel_cache: Dict[str, CSSSelector] = {}
+
+
+def _sel(selector: str) -> CSSSelector:
+    """CSS 선택자를 컴파일해 캐시에서 재사용"""
+    return _sel_cache.setdefault(selector, CSSSelector(selector))
+
 
 class NewsSource:
     """뉴스 소스 설정 클래스"""
@@ -38,9 +64,22 @@ class NewsSource:
 class NewsCrawler:
     """뉴스 크롤링 메인 클래스"""
     
-    def __init__(self):
+    # 텍스트 추출에 불필요한 리소스 유형 (요청 자체를 차단)
+    _BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media"}
+
+    # 광고/추적 호스트 차단 목록
+    _BLOCKED_HOST_RE = re.compile(
+        r"google-analytics|googletagmanager|doubleclick|googlesyndication"
+        r"|facebook\.(net|com)|criteo|taboola|outbrain|adsystem"
+    )
+
+    def __init__(self, max_concurrent: int = 8):
         self.browser: Optional[Browser] = None
+        self.list_context = None
+        self.article_context = None
         self.ai_processor = AIProcessor()
+        # (소스, 카테고리) 목록 크롤링 동시 실행 상한
+        self._crawl_sem = asyncio.Semaphore(max_concurrent)
         
         # 주요 뉴스 사이트 설정
         self.news_sources = [
@@ -89,12 +128,45 @@ class NewsCrawler:
         playwright = await async_playwright().start()
         self.browser = await playwright.chromium.launch(
             headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
+            args=[
+                '--no-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-gpu',
+                '--disable-extensions',
+                '--disable-background-networking',
+                '--disable-sync',
+                '--blink-settings=imagesEnabled=false'
+            ]
         )
+
+        # 목록 페이지는 서버 렌더링이라 JS 실행이 순수 오버헤드 - JS 비활성 컨텍스트 사용
+        # 본문 페이지는 JS가 필요할 수 있어 별도의 JS 활성 컨텍스트를 둔다
+        self.list_context = await self.browser.new_context(java_script_enabled=False)
+        self.article_context = await self.browser.new_context()
+
+        # 이미지/폰트/광고/추적 요청은 응답을 기다리지 않도록 라우트에서 차단
+        await self.list_context.route("**/*", self._route_filter)
+        await self.article_context.route("**/*", self._route_filter)
+
         return self
-    
+
+    async def _route_filter(self, route) -> None:
+        """본문 추출과 무관한 리소스/추적 요청 차단"""
+        request = route.request
+        if (
+            request.resource_type in self._BLOCKED_RESOURCE_TYPES
+            or self._BLOCKED_HOST_RE.search(request.url)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
+        if self.list_context:
+            await self.list_context.close()
+        if self.article_context:
+            await self.article_context.close()
         if self.browser:
             await self.browser.close()
     
@@ -119,82 +191,112 @@ class NewsCrawler:
             logger.warning(f"{source.name}에서 '{category}' 카테고리를 찾을 수 없습니다")
             return []
         
-        page = await self.browser.new_page()
-        
+        page = await self.list_context.new_page()
+
         try:
             url = urljoin(source.base_url, source.category_urls[category])
             logger.info(f"크롤링 시작: {source.name} - {category} ({url})")
-            
-            await page.goto(url, wait_until="networkidle")
-            await page.wait_for_timeout(2000)  # 2초 대기
-            
-            # 뉴스 목록 추출
-            articles = await page.query_selector_all(source.selectors["article_list"])
-            news_data = []
-            
-            for i, article in enumerate(articles[:limit]):
+
+            # 서브리소스가 차단되므로 networkidle 대신 domcontentloaded +
+            # 목록 선택자 대기로 충분하다 (고정 2초 대기 제거)
+            await page.goto(url, wait_until="domcontentloaded")
+            try:
+                await page.wait_for_selector(
+                    source.selectors["article_list"], timeout=5000
+                )
+            except Exception:
+                pass
+
+            # 렌더링된 HTML을 한 번만 받아 파이썬에서 파싱한다
+            # (요소별 CDP 왕복 없이 추출 루프가 전부 로컬에서 돈다)
+            html = await page.content()
+            news_data = self._extract_news_list(html, source, category, limit)
+
+            # JS 없이 목록이 비면 JS 활성 컨텍스트로 한 번 재시도
+            if not news_data:
+                await page.close()
+                page = await self.article_context.new_page()
+                await page.goto(url, wait_until="domcontentloaded")
                 try:
-                    # 제목 추출
-                    title_element = await article.query_selector(source.selectors["title"])
-                    if not title_element:
-                        continue
-                        
-                    title = await title_element.inner_text()
-                    title = title.strip()
-                    
-                    # 링크 추출
-                    link_element = await article.query_selector(source.selectors["link"])
-                    if not link_element:
-                        continue
-                        
-                    link = await link_element.get_attribute("href")
-                    if link and not link.startswith("http"):
-                        link = urljoin(source.base_url, link)
-                    
-                    # 요약/미리보기 텍스트
-                    summary_element = await article.query_selector(source.selectors.get("summary"))
-                    summary = ""
-                    if summary_element:
-                        summary = await summary_element.inner_text()
-                        summary = summary.strip()
-                    
-                    # 시간 정보
-                    time_element = await article.query_selector(source.selectors.get("time"))
-                    published_time = None
-                    if time_element:
-                        time_text = await time_element.inner_text()
-                        published_time = self._parse_time(time_text)
-                    
-                    if not published_time:
-                        published_time = datetime.now()
-                    
-                    news_item = {
-                        "title": title,
-                        "source_name": source.name,
-                        "source_url": link,
-                        "content_snippet": summary,
-                        "published_at": published_time,
-                        "category": category,
-                        "raw_content": None  # 본문은 별도로 크롤링
-                    }
-                    
-                    news_data.append(news_item)
-                    logger.debug(f"뉴스 수집: {title[:50]}...")
-                    
-                except Exception as e:
-                    logger.error(f"개별 뉴스 처리 중 오류: {e}")
-                    continue
-            
+                    await page.wait_for_selector(
+                        source.selectors["article_list"], timeout=5000
+                    )
+                except Exception:
+                    pass
+                html = await page.content()
+                news_data = self._extract_news_list(html, source, category, limit)
+
             logger.info(f"{source.name} - {category}: {len(news_data)}개 뉴스 수집 완료")
             return news_data
-            
+
         except Exception as e:
             logger.error(f"{source.name} - {category} 크롤링 오류: {e}")
             return []
-        
+
         finally:
             await page.close()
-    
+
+    def _extract_news_list(
+        self,
+        html: str,
+        source: NewsSource,
+        category: str,
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """목록 페이지 HTML에서 뉴스 항목 추출 (lxml, 순수 파이썬)"""
+        tree = lxml.html.fromstring(html)
+        news_data: List[Dict[str, Any]] = []
+
+        for article in _sel(source.selectors["article_list"])(tree)[:limit]:
+            try:
+                title_elements = _sel(source.selectors["title"])(article)
+                link_elements = _sel(source.selectors["link"])(article)
+                if not title_elements or not link_elements:
+                    continue
+
+                title = title_elements[0].text_content().strip()
+                link = link_elements[0].get("href")
+
+                summary = ""
+                summary_selector = source.selectors.get("summary")
+                if summary_selector:
+                    summary_elements = _sel(summary_selector)(article)
+                    if summary_elements:
+                        summary = summary_elements[0].text_content().strip()
+
+                time_text = ""
+                time_selector = source.selectors.get("time")
+                if time_selector:
+                    time_elements = _sel(time_selector)(article)
+                    if time_elements:
+                        time_text = time_elements[0].text_content().strip()
+
+                if link and not link.startswith("http"):
+                    link = urljoin(source.base_url, link)
+
+                published_time = self._parse_time(time_text) if time_text else None
+                if not published_time:
+                    published_time = datetime.now()
+
+                news_item = {
+                    "title": title,
+                    "source_name": source.name,
+                    "source_url": link,
+                    "content_snippet": summary,
+                    "published_at": published_time,
+                    "category": category,
+                    "raw_content": None  # 본문은 별도로 크롤링
+                }
+
+                news_data.append(news_item)
+                logger.debug(f"뉴스 수집: {title[:50]}...")
+
+            except Exception as e:
+                logger.error(f"개별 뉴스 처리 중 오류: {e}")
+                continue
+
+        return news_data
+
     async def crawl_article_content(self, url: str, source: NewsSource) -> Optional[str]:
         """
         개별 뉴스 기사 본문 크롤링
@@ -206,12 +308,17 @@ class NewsCrawler:
         Returns:
             기사 본문 텍스트
         """
-        page = await self.browser.new_page()
+        page = await self.article_context.new_page()
         
         try:
-            await page.goto(url, wait_until="networkidle")
-            await page.wait_for_timeout(1000)
-            
+            await page.goto(url, wait_until="domcontentloaded")
+            try:
+                await page.wait_for_selector(
+                    source.selectors.get("content"), timeout=5000
+                )
+            except Exception:
+                pass
+
             # 본문 추출
             content_element = await page.query_selector(source.selectors.get("content"))
             if content_element:
@@ -227,35 +334,76 @@ class NewsCrawler:
         finally:
             await page.close()
     
+    # 본문 크롤링 소비자 워커 수
+    CONTENT_WORKERS = 8
+
     async def crawl_all_categories(self, limit_per_category: int = 10) -> List[Dict[str, Any]]:
         """
         모든 소스의 모든 카테고리에서 뉴스 크롤링
-        
+
+        목록 크롤링(생산자)과 본문 크롤링(소비자)을 큐로 연결해
+        목록이 전부 끝나기를 기다리지 않고 URL이 나오는 즉시
+        본문 수집을 시작한다. 두 단계가 모두 네트워크 바운드라
+        중첩 실행으로 전체 시간이 크게 줄어든다.
+
         Args:
             limit_per_category: 카테고리별 최대 뉴스 수
-            
+
         Returns:
             전체 뉴스 데이터 리스트
         """
-        all_news = []
-        
-        for source in self.news_sources:
-            for category in source.category_urls.keys():
-                try:
+        all_news: List[Dict[str, Any]] = []
+        urls_q: asyncio.Queue = asyncio.Queue(maxsize=100)
+
+        async def produce(source: NewsSource, category: str) -> None:
+            try:
+                # 세마포어로 동시 목록 크롤링 수를 제한하되
+                # 제한 안에서는 네트워크/렌더링 대기를 서로 겹친다
+                async with self._crawl_sem:
                     category_news = await self.crawl_category(
-                        source, 
-                        category, 
+                        source,
+                        category,
                         limit_per_category
                     )
-                    all_news.extend(category_news)
-                    
-                    # 요청 간 지연
-                    await asyncio.sleep(1)
-                    
+                for news_item in category_news:
+                    await urls_q.put((news_item, source))
+
+            except Exception as e:
+                logger.error(f"{source.name} - {category} 크롤링 실패: {e}")
+
+        async def worker() -> None:
+            while True:
+                news_item, source = await urls_q.get()
+                try:
+                    if news_item.get("source_url"):
+                        news_item["raw_content"] = await self.crawl_article_content(
+                            news_item["source_url"], source
+                        )
+                    all_news.append(news_item)
                 except Exception as e:
-                    logger.error(f"{source.name} - {category} 크롤링 실패: {e}")
-                    continue
-        
+                    logger.error(f"본문 수집 실패 ({news_item.get('source_url')}): {e}")
+                    all_news.append(news_item)
+                finally:
+                    urls_q.task_done()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(self.CONTENT_WORKERS)
+        ]
+
+        try:
+            # 모든 (소스, 카테고리) 조합을 동시 태스크로 펼친다
+            await asyncio.gather(*(
+                produce(source, category)
+                for source in self.news_sources
+                for category in source.category_urls.keys()
+            ), return_exceptions=True)
+            # 큐에 남은 본문 크롤링이 끝날 때까지 대기
+            await urls_q.join()
+        finally:
+            for task in workers:
+                task.cancel()
+
         logger.info(f"전체 크롤링 완료: {len(all_news)}개 뉴스 수집")
         return all_news
     
@@ -302,54 +450,76 @@ class NewsCrawler:
         except Exception:
             return None
     
-    async def save_news_to_db(self, news_data: List[Dict[str, Any]]) -> int:
+    async def save_news_to_db(self, news_data: List[Dict[str, Any]]) -> List[int]:
         """
         크롤링한 뉴스 데이터를 데이터베이스에 저장
-        
+
+        비동기 세션을 풀에서 빌려 단일 INSERT로 저장하므로 스레드
+        위임 없이도 이벤트 루프를 막지 않는다.
+
         Args:
             news_data: 뉴스 데이터 리스트
-            
+
         Returns:
-            저장된 뉴스 수
+            새로 저장된 뉴스 id 리스트
         """
-        db = next(get_db())
-        saved_count = 0
-        
-        try:
-            for news_item in news_data:
-                # 중복 확인
-                existing = db.query(News).filter(
-                    News.source_url == news_item["source_url"]
-                ).first()
-                
-                if existing:
-                    logger.debug(f"중복 뉴스 스킵: {news_item['title'][:50]}...")
-                    continue
-                
-                # 새 뉴스 생성
-                news = News(
-                    title=news_item["title"],
-                    source_name=news_item["source_name"],
-                    source_url=news_item["source_url"],
-                    content_snippet=news_item.get("content_snippet"),
-                    published_at=news_item["published_at"],
-                    is_processed=False
+        # 최근 실행에서 이미 본 URL은 DB 조회 전에 걸러낸다
+        news_data = [
+            item for item in news_data
+            if item.get("source_url") not in _seen_urls
+        ]
+        if not news_data:
+            return []
+
+        saved_ids: List[int] = []
+
+        async with async_session() as db:
+            try:
+                # 배치 내 중복만 파이썬에서 걸러내고, DB에 이미 있는 URL은
+                # ON CONFLICT DO NOTHING으로 INSERT 자체에서 처리한다
+                seen_urls = set()
+                rows = []
+                for news_item in news_data:
+                    url = news_item.get("source_url")
+                    if not url or url in seen_urls:
+                        logger.debug(f"중복 뉴스 스킵: {news_item['title'][:50]}...")
+                        continue
+
+                    seen_urls.add(url)
+                    rows.append({
+                        "title": news_item["title"],
+                        "source_name": news_item["source_name"],
+                        "source_url": url,
+                        "content_snippet": news_item.get("content_snippet"),
+                        "published_at": news_item["published_at"],
+                        "is_processed": False
+                    })
+
+                if not rows:
+                    return []
+
+                # 중복 확인 + INSERT + id 회수를 단일 라운드트립으로 처리
+                stmt = (
+                    pg_insert(News)
+                    .values(rows)
+                    .on_conflict_do_nothing()
+                    .returning(News.id)
                 )
-                
-                db.add(news)
-                saved_count += 1
-            
-            db.commit()
-            logger.info(f"데이터베이스 저장 완료: {saved_count}개 뉴스")
-            
-        except Exception as e:
-            db.rollback()
-            logger.error(f"데이터베이스 저장 오류: {e}")
-            
-        finally:
-            db.close()
-        
-        return saved_count
+                result = await db.execute(stmt)
+                await db.commit()
+                saved_ids = [row[0] for row in result.fetchall()]
+
+                # 커밋 후에만 캐시에 반영 (실패 시 다음 실행에서 재시도되도록)
+                for url in seen_urls:
+                    _remember_url(url)
+
+                logger.info(f"데이터베이스 저장 완료: {len(saved_ids)}개 뉴스")
+
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"데이터베이스 저장 오류: {e}")
+
+        return saved_ids
 
 
 # 크롤링 실행 함수
@@ -364,23 +534,26 @@ async def run_news_crawling(limit_per_category: int = 15) -> Dict[str, Any]:
         실행 결과 정보
     """
     start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     
     try:
         async with NewsCrawler() as crawler:
             # 뉴스 크롤링
             news_data = await crawler.crawl_all_categories(limit_per_category)
             
-            # 데이터베이스 저장
-            saved_count = await crawler.save_news_to_db(news_data)
-            
+            # 데이터베이스 저장 (INSERT ... RETURNING으로 신규 id까지 한 번에)
+            saved_ids = await crawler.save_news_to_db(news_data)
+
             end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            
+            # 정수 마이크로초 (float 초 대비 정확하고 직렬화도 빠름)
+            duration_us = (time.perf_counter_ns() - start_ns) // 1000
+
             result = {
                 "success": True,
                 "crawled_count": len(news_data),
-                "saved_count": saved_count,
-                "duration_seconds": duration,
+                "saved_count": len(saved_ids),
+                "saved_ids": saved_ids,
+                "duration_us": duration_us,
                 "start_time": start_time.isoformat(),
                 "end_time": end_time.isoformat()
             }
@@ -390,12 +563,12 @@ async def run_news_crawling(limit_per_category: int = 15) -> Dict[str, Any]:
             
     except Exception as e:
         end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration_us = (time.perf_counter_ns() - start_ns) // 1000
         
         error_result = {
             "success": False,
             "error": str(e),
-            "duration_seconds": duration,
+            "duration_us": duration_us,
             "start_time": start_time.isoformat(),
             "end_time": end_time.isoformat()
         }
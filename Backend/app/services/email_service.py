@@ -2,8 +2,11 @@
 이메일 발송 서비스
 SMTP를 통한 HTML/텍스트 이메일 전송
 """
-import smtplib
+import asyncio
 import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -11,9 +14,9 @@ from email import encoders
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+import aiosmtplib
 
 from app.core.config import settings
 
@@ -22,7 +25,62 @@ logger = logging.getLogger(__name__)
 
 class EmailService:
     """이메일 발송 서비스"""
-    
+
+    # 한 SMTP 세션으로 묶어 보내는 메시지 수 (서버 세션 제한 고려)
+    _SMTP_BATCH_SIZE = 50
+
+    # 고정 본문은 호출마다 f-string으로 재조립하지 않도록
+    # 클래스 상수 템플릿으로 두고 format_map으로 변수만 채운다
+    _WELCOME_HTML = """
+    <html>
+    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+        <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+            <h1 style="color: #667eea;">🗞️ 뉴스한입에 오신 것을 환영합니다!</h1>
+            <p>안녕하세요, {user_name}님!</p>
+            <p>뉴스한입 회원이 되어주셔서 감사합니다. 매일 저녁 7시에 개인 맞춤형 뉴스를 이메일로 받아보실 수 있습니다.</p>
+            <p>먼저 <a href="{preferences_url}" style="color: #667eea;">관심사 설정</a>에서 원하는 뉴스 카테고리와 기업을 선택해 주세요.</p>
+            <p>감사합니다!</p>
+            <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
+            <p style="font-size: 12px; color: #888;">
+                © 2024 뉴스한입. 모든 권리 보유.
+            </p>
+        </div>
+    </body>
+    </html>
+    """
+
+    _WELCOME_TEXT = """
+    뉴스한입에 오신 것을 환영합니다!
+
+    안녕하세요, {user_name}님!
+
+    뉴스한입 회원이 되어주셔서 감사합니다. 매일 저녁 7시에 개인 맞춤형 뉴스를 이메일로 받아보실 수 있습니다.
+
+    먼저 관심사 설정({preferences_url})에서 원하는 뉴스 카테고리와 기업을 선택해 주세요.
+
+    감사합니다!
+
+    © 2024 뉴스한입. 모든 권리 보유.
+    """
+
+    _TEST_HTML = """
+    <html>
+    <body style="font-family: Arial, sans-serif;">
+        <h1 style="color: #667eea;">📧 테스트 이메일</h1>
+        <p>뉴스한입 이메일 시스템이 정상적으로 작동합니다!</p>
+        <p>발송 시간: {sent_at}</p>
+    </body>
+    </html>
+    """
+
+    _TEST_TEXT = """
+    📧 테스트 이메일
+
+    뉴스한입 이메일 시스템이 정상적으로 작동합니다!
+
+    발송 시간: {sent_at}
+    """
+
     def __init__(self):
         self.smtp_server = settings.SMTP_SERVER
         self.smtp_port = settings.SMTP_PORT
@@ -30,90 +88,147 @@ class EmailService:
         self.smtp_password = settings.SMTP_PASSWORD
         self.from_email = settings.FROM_EMAIL
         self.from_name = settings.FROM_NAME or "뉴스한입"
+
+        # 수신자와 무관하게 동일한 URL 상수는 한 번만 계산
+        # (일괄 발송 시 수신자마다 f-string/설정 속성 접근을 반복하지 않는다)
+        self._webapp_url = settings.WEBAPP_URL or "https://newsbite.kr"
+        self._preferences_url = f"{settings.WEBAPP_URL}/preferences"
+        self._feedback_url = f"{settings.WEBAPP_URL}/feedback"
+        self._unsubscribe_prefix = f"{settings.WEBAPP_URL}/unsubscribe?email="
+
+        # 날짜 문자열은 하루에 한 번만 포맷
+        self._date_cache_day = None
+        self._date_str = ""
+
+        # 템플릿 렌더링/MIME 조립은 CPU 바운드라 이벤트 루프를 막지 않도록
+        # 전용 스레드 풀에서 수행 (발송 I/O와 중첩 실행)
+        self._cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
         
         # Jinja2 템플릿 환경 설정
+        # 바이트코드 캐시로 재시작 시 재컴파일을 피하고,
+        # auto_reload=False로 렌더링마다 발생하는 mtime stat 호출을 제거
         template_dir = Path(__file__).parent.parent / "templates" / "email"
+        bytecode_cache_dir = Path(tempfile.gettempdir()) / "newsbite_jinja_cache"
+        bytecode_cache_dir.mkdir(exist_ok=True)
         self.template_env = Environment(
             loader=FileSystemLoader(str(template_dir)),
-            autoescape=True
+            autoescape=True,
+            bytecode_cache=FileSystemBytecodeCache(str(bytecode_cache_dir)),
+            auto_reload=False
+        )
+
+        # 자주 쓰는 템플릿은 기동 시 미리 컴파일해 둔다 (일괄 발송 핫 패스)
+        self._templates: Dict[str, Any] = {}
+        for template_name in ("daily_news.html", "daily_news.txt"):
+            try:
+                self._templates[template_name] = self.template_env.get_template(template_name)
+            except Exception as e:
+                logger.warning(f"템플릿 사전 로드 실패 ({template_name}): {e}")
+
+    def _create_smtp_client(self) -> aiosmtplib.SMTP:
+        """비동기 SMTP 클라이언트 생성 (연결/인증은 connect 시점에 수행)"""
+        return aiosmtplib.SMTP(
+            hostname=self.smtp_server,
+            port=self.smtp_port,
+            username=self.smtp_username,
+            password=self.smtp_password,
+            # 465는 암시적 TLS, 그 외 포트는 STARTTLS
+            use_tls=(self.smtp_port == 465),
+            start_tls=(self.smtp_port != 465)
         )
-        
-        # 스레드 풀 실행기 (비동기 이메일 발송용)
-        self.executor = ThreadPoolExecutor(max_workers=5)
-    
-    def _create_smtp_connection(self) -> smtplib.SMTP:
-        """SMTP 연결 생성"""
-        try:
-            if self.smtp_port == 465:
-                # SSL 연결
-                server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port)
-            else:
-                # TLS 연결
-                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-                server.starttls()
-            
-            server.login(self.smtp_username, self.smtp_password)
-            return server
-            
-        except Exception as e:
-            logger.error(f"SMTP 연결 실패: {e}")
-            raise
     
     def _render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """템플릿 렌더링"""
         try:
-            template = self.template_env.get_template(template_name)
+            template = self._templates.get(template_name)
+            if template is None:
+                template = self.template_env.get_template(template_name)
+                self._templates[template_name] = template
             return template.render(**context)
         except Exception as e:
             logger.error(f"템플릿 렌더링 실패 ({template_name}): {e}")
             raise
     
-    def _send_email_sync(
+    def _build_message(
         self,
         to_email: str,
         subject: str,
         html_content: str,
         text_content: str,
         attachments: Optional[List[Dict[str, Any]]] = None
-    ) -> bool:
-        """동기 이메일 발송"""
+    ) -> MIMEMultipart:
+        """MIME 메시지 생성"""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = f"{self.from_name} <{self.from_email}>"
+        msg['To'] = to_email
+        msg['Subject'] = subject
+
+        # 텍스트 및 HTML 파트 추가
+        text_part = MIMEText(text_content, 'plain', 'utf-8')
+        html_part = MIMEText(html_content, 'html', 'utf-8')
+
+        msg.attach(text_part)
+        msg.attach(html_part)
+
+        # 첨부파일 추가 (선택사항)
+        if attachments:
+            for attachment in attachments:
+                part = MIMEBase('application', 'octet-stream')
+                part.set_payload(attachment['content'])
+                encoders.encode_base64(part)
+                part.add_header(
+                    'Content-Disposition',
+                    f'attachment; filename= {attachment["filename"]}'
+                )
+                msg.attach(part)
+
+        return msg
+
+    async def _send_batch_async(self, messages: List[tuple]) -> List[bool]:
+        """
+        일괄 비동기 발송 - 배치당 SMTP 연결 1회 재사용
+
+        수신자마다 연결/STARTTLS/AUTH를 반복하면 TLS 협상이 발송 시간의
+        대부분을 차지하므로, 한 세션으로 여러 메시지를 보내고
+        연결이 끊긴 경우에만 지연 재연결한다.
+        """
+        results = []
+        smtp = None
+
         try:
-            # 메시지 생성
-            msg = MIMEMultipart('alternative')
-            msg['From'] = f"{self.from_name} <{self.from_email}>"
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # 텍스트 및 HTML 파트 추가
-            text_part = MIMEText(text_content, 'plain', 'utf-8')
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            
-            msg.attach(text_part)
-            msg.attach(html_part)
-            
-            # 첨부파일 추가 (선택사항)
-            if attachments:
-                for attachment in attachments:
-                    part = MIMEBase('application', 'octet-stream')
-                    part.set_payload(attachment['content'])
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        'Content-Disposition',
-                        f'attachment; filename= {attachment["filename"]}'
-                    )
-                    msg.attach(part)
-            
-            # SMTP 연결 및 발송
-            with self._create_smtp_connection() as server:
-                server.send_message(msg)
-            
-            logger.info(f"이메일 발송 성공: {to_email}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"이메일 발송 실패 ({to_email}): {e}")
-            return False
-    
+            for to_email, msg in messages:
+                try:
+                    if smtp is None or not smtp.is_connected:
+                        smtp = self._create_smtp_client()
+                        await smtp.connect()
+                    await smtp.send_message(msg)
+                    results.append(True)
+                    logger.info(f"이메일 발송 성공: {to_email}")
+                except Exception as e:
+                    logger.error(f"이메일 발송 실패 ({to_email}): {e}")
+                    results.append(False)
+
+                    # 연결 상태 확인 후 죽었으면 다음 메시지에서 재연결
+                    if smtp is not None and smtp.is_connected:
+                        try:
+                            await smtp.noop()
+                        except Exception:
+                            try:
+                                await smtp.quit()
+                            except Exception:
+                                pass
+                            smtp = None
+                    else:
+                        smtp = None
+        finally:
+            if smtp is not None and smtp.is_connected:
+                try:
+                    await smtp.quit()
+                except Exception:
+                    pass
+
+        return results
+
     async def send_email(
         self,
         to_email: str,
@@ -123,17 +238,63 @@ class EmailService:
         attachments: Optional[List[Dict[str, Any]]] = None
     ) -> bool:
         """비동기 이메일 발송"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor,
-            self._send_email_sync,
-            to_email,
-            subject,
-            html_content,
-            text_content,
-            attachments
-        )
+        try:
+            msg = self._build_message(
+                to_email, subject, html_content, text_content, attachments
+            )
+
+            # SMTP는 순수 I/O이므로 스레드 위임 없이 코루틴으로 직접 발송
+            smtp = self._create_smtp_client()
+            async with smtp:
+                await smtp.send_message(msg)
+
+            logger.info(f"이메일 발송 성공: {to_email}")
+            return True
+
+        except Exception as e:
+            logger.error(f"이메일 발송 실패 ({to_email}): {e}")
+            return False
     
+    def _render_daily_news(
+        self,
+        user_email: str,
+        user_name: str,
+        personalized_data: Dict[str, Any]
+    ) -> tuple:
+        """일일 뉴스 이메일의 제목/HTML/텍스트 콘텐츠 생성"""
+        # 날짜 포맷팅 (같은 날에는 캐시된 문자열 재사용)
+        today = datetime.now()
+        if self._date_cache_day != today.date():
+            self._date_cache_day = today.date()
+            self._date_str = today.strftime("%Y년 %m월 %d일")
+        date_str = self._date_str
+
+        # 템플릿 컨텍스트 준비
+        context = {
+            "user_name": user_name,
+            "date": date_str,
+            "total_news": personalized_data.get("total_news", 0),
+            "categories_count": len(personalized_data.get("news_by_category", {})),
+            "companies_count": len(personalized_data.get("news_by_company", {})),
+            "controversial_count": len(personalized_data.get("controversial_news", [])),
+            "news_by_category": personalized_data.get("news_by_category", {}),
+            "news_by_company": personalized_data.get("news_by_company", {}),
+            "controversial_news": personalized_data.get("controversial_news", []),
+            "webapp_url": self._webapp_url,
+            "preferences_url": self._preferences_url,
+            "feedback_url": self._feedback_url,
+            "unsubscribe_url": self._unsubscribe_prefix + quote(user_email),
+        }
+
+        # HTML 및 텍스트 콘텐츠 생성
+        html_content = self._render_template("daily_news.html", context)
+        text_content = self._render_template("daily_news.txt", context)
+
+        # 이메일 제목
+        subject = f"🗞️ {date_str} 뉴스한입 - 개인 맞춤 뉴스 ({context['total_news']}개)"
+
+        return subject, html_content, text_content
+
     async def send_daily_news_email(
         self,
         user_email: str,
@@ -142,34 +303,10 @@ class EmailService:
     ) -> bool:
         """일일 뉴스 이메일 발송"""
         try:
-            # 날짜 포맷팅
-            today = datetime.now()
-            date_str = today.strftime("%Y년 %m월 %d일")
-            
-            # 템플릿 컨텍스트 준비
-            context = {
-                "user_name": user_name,
-                "date": date_str,
-                "total_news": personalized_data.get("total_news", 0),
-                "categories_count": len(personalized_data.get("news_by_category", {})),
-                "companies_count": len(personalized_data.get("news_by_company", {})),
-                "controversial_count": len(personalized_data.get("controversial_news", [])),
-                "news_by_category": personalized_data.get("news_by_category", {}),
-                "news_by_company": personalized_data.get("news_by_company", {}),
-                "controversial_news": personalized_data.get("controversial_news", []),
-                "webapp_url": settings.WEBAPP_URL or "https://newsbite.kr",
-                "preferences_url": f"{settings.WEBAPP_URL}/preferences",
-                "feedback_url": f"{settings.WEBAPP_URL}/feedback",
-                "unsubscribe_url": f"{settings.WEBAPP_URL}/unsubscribe?email={user_email}",
-            }
-            
-            # HTML 및 텍스트 콘텐츠 생성
-            html_content = self._render_template("daily_news.html", context)
-            text_content = self._render_template("daily_news.txt", context)
-            
-            # 이메일 제목
-            subject = f"🗞️ {date_str} 뉴스한입 - 개인 맞춤 뉴스 ({context['total_news']}개)"
-            
+            subject, html_content, text_content = self._render_daily_news(
+                user_email, user_name, personalized_data
+            )
+
             # 이메일 발송
             return await self.send_email(
                 to_email=user_email,
@@ -177,44 +314,71 @@ class EmailService:
                 html_content=html_content,
                 text_content=text_content
             )
-            
+
         except Exception as e:
             logger.error(f"일일 뉴스 이메일 발송 실패 ({user_email}): {e}")
             return False
-    
+
+    def _build_daily_message(self, recipient: Dict[str, Any]) -> tuple:
+        """단일 수신자의 일일 뉴스 MIME 메시지 조립 (스레드 풀에서 실행)"""
+        subject, html_content, text_content = self._render_daily_news(
+            recipient["email"], recipient["name"], recipient["news_data"]
+        )
+        msg = self._build_message(
+            recipient["email"], subject, html_content, text_content
+        )
+        return recipient["email"], msg
+
     async def send_bulk_daily_news(
         self,
         recipients: List[Dict[str, Any]]
     ) -> Dict[str, int]:
         """일괄 일일 뉴스 이메일 발송"""
         results = {"success": 0, "failed": 0}
-        
-        # 동시 발송 제한 (5개씩)
-        semaphore = asyncio.Semaphore(5)
-        
-        async def send_to_user(recipient):
-            async with semaphore:
-                success = await self.send_daily_news_email(
-                    user_email=recipient["email"],
-                    user_name=recipient["name"],
-                    personalized_data=recipient["news_data"]
-                )
-                return success
-        
-        # 모든 사용자에게 병렬 발송
-        tasks = [send_to_user(recipient) for recipient in recipients]
-        send_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 결과 집계
-        for result in send_results:
-            if isinstance(result, Exception):
-                logger.error(f"이메일 발송 예외: {result}")
-                results["failed"] += 1
-            elif result:
-                results["success"] += 1
-            else:
-                results["failed"] += 1
-        
+
+        # 렌더링/MIME 조립(CPU)은 스레드 풀에서, 발송(I/O)은 코루틴에서
+        # 큐로 연결해 두 단계를 중첩 실행한다
+        loop = asyncio.get_running_loop()
+        mime_q: asyncio.Queue = asyncio.Queue(maxsize=200)
+
+        async def produce() -> None:
+            build_futures = [
+                loop.run_in_executor(self._cpu_pool, self._build_daily_message, recipient)
+                for recipient in recipients
+            ]
+            for future in asyncio.as_completed(build_futures):
+                try:
+                    to_email, msg = await future
+                    await mime_q.put((to_email, msg))
+                except Exception as e:
+                    logger.error(f"이메일 생성 실패: {e}")
+                    results["failed"] += 1
+            # 소비자 종료 신호
+            await mime_q.put(None)
+
+        async def consume() -> None:
+            batch = []
+
+            async def flush() -> None:
+                if not batch:
+                    return
+                send_results = await self._send_batch_async(batch)
+                results["success"] += sum(1 for ok in send_results if ok)
+                results["failed"] += sum(1 for ok in send_results if not ok)
+                batch.clear()
+
+            while True:
+                item = await mime_q.get()
+                if item is None:
+                    break
+                batch.append(item)
+                if len(batch) >= self._SMTP_BATCH_SIZE:
+                    await flush()
+
+            await flush()
+
+        await asyncio.gather(produce(), consume())
+
         logger.info(f"일괄 이메일 발송 완료 - 성공: {results['success']}, 실패: {results['failed']}")
         return results
     
@@ -223,43 +387,12 @@ class EmailService:
         try:
             context = {
                 "user_name": user_name,
-                "webapp_url": settings.WEBAPP_URL or "https://newsbite.kr",
-                "preferences_url": f"{settings.WEBAPP_URL}/preferences"
+                "preferences_url": self._preferences_url,
             }
-            
-            # 간단한 환영 메시지 (템플릿 추가 가능)
-            html_content = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h1 style="color: #667eea;">🗞️ 뉴스한입에 오신 것을 환영합니다!</h1>
-                    <p>안녕하세요, {user_name}님!</p>
-                    <p>뉴스한입 회원이 되어주셔서 감사합니다. 매일 저녁 7시에 개인 맞춤형 뉴스를 이메일로 받아보실 수 있습니다.</p>
-                    <p>먼저 <a href="{context['preferences_url']}" style="color: #667eea;">관심사 설정</a>에서 원하는 뉴스 카테고리와 기업을 선택해 주세요.</p>
-                    <p>감사합니다!</p>
-                    <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
-                    <p style="font-size: 12px; color: #888;">
-                        © 2024 뉴스한입. 모든 권리 보유.
-                    </p>
-                </div>
-            </body>
-            </html>
-            """
-            
-            text_content = f"""
-            뉴스한입에 오신 것을 환영합니다!
-            
-            안녕하세요, {user_name}님!
-            
-            뉴스한입 회원이 되어주셔서 감사합니다. 매일 저녁 7시에 개인 맞춤형 뉴스를 이메일로 받아보실 수 있습니다.
-            
-            먼저 관심사 설정({context['preferences_url']})에서 원하는 뉴스 카테고리와 기업을 선택해 주세요.
-            
-            감사합니다!
-            
-            © 2024 뉴스한입. 모든 권리 보유.
-            """
-            
+
+            html_content = self._WELCOME_HTML.format_map(context)
+            text_content = self._WELCOME_TEXT.format_map(context)
+
             return await self.send_email(
                 to_email=user_email,
                 subject="🗞️ 뉴스한입에 오신 것을 환영합니다!",
@@ -274,24 +407,11 @@ class EmailService:
     async def send_test_email(self, to_email: str) -> bool:
         """테스트 이메일 발송"""
         try:
-            html_content = """
-            <html>
-            <body style="font-family: Arial, sans-serif;">
-                <h1 style="color: #667eea;">📧 테스트 이메일</h1>
-                <p>뉴스한입 이메일 시스템이 정상적으로 작동합니다!</p>
-                <p>발송 시간: {}</p>
-            </body>
-            </html>
-            """.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            
-            text_content = f"""
-            📧 테스트 이메일
-            
-            뉴스한입 이메일 시스템이 정상적으로 작동합니다!
-            
-            발송 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-            """
-            
+            context = {"sent_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+            html_content = self._TEST_HTML.format_map(context)
+            text_content = self._TEST_TEXT.format_map(context)
+
             return await self.send_email(
                 to_email=to_email,
                 subject="📧 뉴스한입 테스트 이메일",
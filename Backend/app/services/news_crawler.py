@@ -15,16 +15,202 @@
 Playwright를 이용한 주요 뉴스사이트 크롤링
 """
 from typing import List, Dict, Optional
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse, parse_qs
+from aiolimiter import AsyncLimiter
+from concurrent.futures import ProcessPoolExecutor
 from playwright.async_api import async_playwright, Page, Browser
 import asyncio
+import hashlib
+import httpx
 import logging
+import lxml.html
+from lxml.cssselect import CSSSelector
+import os
+import re
+import tempfile
+import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 피드/기사 본문용 공유 HTTP 클라이언트
+# 크롤링 전체에서 커넥션 풀을 재사용하도록 프로세스당 하나만 만든다
+# HTTP/2 멀티플렉싱으로 기사당 TCP+TLS 핸드셰이크를 없애고
+# brotli 수신으로 전송량을 gzip 대비 ~20% 줄인다
+_article_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_article_client() -> httpx.AsyncClient:
+    """공유 httpx 클라이언트 반환 (최초 호출 시 생성)"""
+    global _article_client
+    if _article_client is None:
+        _article_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            headers={
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                ),
+                "Accept-Encoding": "br, gzip",
+            },
+            follow_redirects=True,
+            timeout=httpx.Timeout(8.0, connect=3.0),
+        )
+    return _article_client
+
+
+async def close_article_client() -> None:
+    """공유 httpx 클라이언트 종료 (앱 shutdown에서 호출)"""
+    global _article_client
+    if _article_client is not None:
+        await _article_client.aclose()
+        _article_client = None
+
+
+# 기사 본문 추출용 CSS 선택자 (임포트 시 1회 컴파일, 워커 프로세스에서도 동일)
+_SEL_ARTICLE_CONTENT = CSSSelector(".newsct_article, #articleBodyContents, .article_body")
+_SEL_ARTICLE_THUMB = CSSSelector(".end_photo_org img, .article_img img")
+_SEL_ARTICLE_TIME = CSSSelector(".media_end_head_info_datestamp_time")
+
+
+def _parse_article_html(html: str) -> Optional[Dict]:
+    """
+    기사 HTML에서 본문/썸네일/발행시간 텍스트 추출 (순수 CPU 작업)
+
+    워커 프로세스에서 실행되므로 인자/반환값은 피클 가능한
+    문자열/딕셔너리만 사용한다. 본문이 없으면 None을 반환한다.
+    """
+    tree = lxml.html.fromstring(html)
+
+    content_nodes = _SEL_ARTICLE_CONTENT(tree)
+    if not content_nodes:
+        return None
+
+    # 개행/연속 공백을 한 칸으로 접어 2000자 창을 본문으로만 채운다
+    content = _RE_WS.sub(" ", content_nodes[0].text_content()).strip()[:2000]
+    if not content:
+        return None
+
+    thumbnail_url = None
+    thumbnail_nodes = _SEL_ARTICLE_THUMB(tree)
+    if thumbnail_nodes:
+        thumbnail_url = thumbnail_nodes[0].get("src")
+
+    time_text = None
+    time_nodes = _SEL_ARTICLE_TIME(tree)
+    if time_nodes:
+        time_text = time_nodes[0].text_content()
+
+    return {"content": content, "thumbnail": thumbnail_url, "time_text": time_text}
+
+
+# HTML 파싱은 CPU 바운드라 이벤트 루프(Playwright 제어 중)를 막지 않도록
+# 프로세스 풀로 격리한다. GIL 밖에서 코어를 온전히 쓴다.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """공유 파싱 프로세스 풀 반환 (최초 호출 시 생성)"""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
+
+# 발행시간 파싱용 정규식 (호출마다 재컴파일하지 않도록 모듈 로드 시 1회 컴파일)
+_RE_WS = re.compile(r"\s+")
+_RE_ISO = re.compile(r"(\d{4})[-.](\d{2})[-.](\d{2})[ T](\d{2}):(\d{2})(?::(\d{2}))?")
+_RE_DAY = re.compile(r"(\d+)일")
+_RE_HOURS = re.compile(r"(\d+)시간")
+_RE_MIN = re.compile(r"(\d+)분")
+
+
+def _parse_time(time_text: str) -> datetime:
+    """
+    기사 시간 문자열을 datetime으로 변환
+
+    "2024.01.05 14:30" 같은 절대 표기와 "3시간전"/"5분전" 같은
+    상대 표기를 모두 처리하고, 해석 불가 시 현재 시각을 반환한다.
+    """
+    now = datetime.now()
+    if not time_text:
+        return now
+
+    match = _RE_ISO.search(time_text)
+    if match:
+        try:
+            return datetime(*(int(group) for group in match.groups() if group is not None))
+        except ValueError:
+            return now
+
+    match = _RE_DAY.search(time_text)
+    if match:
+        return now - timedelta(days=int(match.group(1)))
+
+    match = _RE_HOURS.search(time_text)
+    if match:
+        return now - timedelta(hours=int(match.group(1)))
+
+    match = _RE_MIN.search(time_text)
+    if match:
+        return now - timedelta(minutes=int(match.group(1)))
+
+    return now
+
+
+def _url_key(url: str) -> str:
+    """
+    중복 판별용 안정 URL 키 생성
+
+    추적 파라미터 등 불필요한 쿼리는 버리되, 네이버 구형 URL처럼
+    기사를 식별하는 oid/aid 쿼리는 유지해 근접 중복을 하나로 묶는다.
+    """
+    parts = urlparse(url)
+    if parts.query:
+        params = parse_qs(parts.query)
+        if "oid" in params and "aid" in params:
+            return (
+                f"{parts.netloc}{parts.path}"
+                f"?oid={params['oid'][0]}&aid={params['aid'][0]}"
+            )
+    return f"{parts.netloc}{parts.path}"
+
+
+_RE_TITLE_STRIP = re.compile(r"[^0-9a-z가-힣]")
+
+
+def _simhash64(text: str) -> int:
+    """
+    제목용 64비트 SimHash 계산
+
+    공백과 문장부호를 전부 제거한 소문자 문자열을 3문자 슁글로 잘라
+    각 슁글의 64비트 해시를 비트 단위로 가중 합산한다. 비슷한
+    제목일수록 해시의 해밍 거리가 가깝고, 구두점·띄어쓰기만 다른
+    제목은 같은 해시가 된다.
+    """
+    normalized = _RE_TITLE_STRIP.sub("", text.lower())
+    weights = [0] * 64
+    for i in range(max(len(normalized) - 2, 1)):
+        shingle = normalized[i:i + 3]
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        shingle_hash = int.from_bytes(digest, "big")
+        for bit in range(64):
+            if (shingle_hash >> bit) & 1:
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+    value = 0
+    for bit in range(64):
+        if weights[bit] > 0:
+            value |= 1 << bit
+    return value
+
 
 @dataclass
 class NewsItem:
@@ -39,23 +225,238 @@ class NewsItem:
     thumbnail_url: Optional[str] = None
 
 
+class NewsItemBatch:
+    """
+    NewsItem 배치의 열 지향(SoA) 표현
+
+    대량 후처리(중복 제거, 길이 필터, 일괄 저장)에서 필드별 리스트를
+    연속으로 순회하므로, 아이템 객체를 돌며 속성을 반복 접근하는
+    것보다 캐시 친화적이고 한 번의 패스로 끝난다.
+    """
+
+    __slots__ = (
+        "titles", "contents", "summaries", "urls",
+        "published_at", "sources", "categories", "thumbnail_urls"
+    )
+
+    def __init__(self, titles, contents, summaries, urls,
+                 published_at, sources, categories, thumbnail_urls):
+        self.titles = titles
+        self.contents = contents
+        self.summaries = summaries
+        self.urls = urls
+        self.published_at = published_at
+        self.sources = sources
+        self.categories = categories
+        self.thumbnail_urls = thumbnail_urls
+
+    @classmethod
+    def from_items(cls, items: List[NewsItem]) -> "NewsItemBatch":
+        """NewsItem 리스트를 병렬 열 리스트로 변환"""
+        if not items:
+            return cls([], [], [], [], [], [], [], [])
+        columns = map(list, zip(*(
+            (
+                item.title, item.content, item.summary, item.url,
+                item.published_at, item.source, item.category,
+                item.thumbnail_url
+            )
+            for item in items
+        )))
+        return cls(*columns)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def _take(self, indices: List[int]) -> "NewsItemBatch":
+        """선택된 인덱스만 남긴 새 배치 반환"""
+        return NewsItemBatch(
+            [self.titles[i] for i in indices],
+            [self.contents[i] for i in indices],
+            [self.summaries[i] for i in indices],
+            [self.urls[i] for i in indices],
+            [self.published_at[i] for i in indices],
+            [self.sources[i] for i in indices],
+            [self.categories[i] for i in indices],
+            [self.thumbnail_urls[i] for i in indices],
+        )
+
+    def dedup_by_url(self) -> "NewsItemBatch":
+        """URL 키 기준 중복 제거 (첫 항목 유지)"""
+        seen: set = set()
+        indices = []
+        for i, url in enumerate(self.urls):
+            key = _url_key(url)
+            if key in seen:
+                continue
+            seen.add(key)
+            indices.append(i)
+        return self._take(indices) if len(indices) < len(self) else self
+
+    def dedup_near_titles(self, max_distance: int = 3) -> "NewsItemBatch":
+        """
+        제목 SimHash 기준 근접 중복 제거 (첫 항목 유지)
+
+        구두점이나 언론사 꼬리표만 다른 사실상 같은 기사를 URL 중복
+        제거 이후에 걸러낸다. 해밍 거리 max_distance 이하면 같은
+        기사로 본다. 거리 3 이하인 두 해시는 16비트 밴드 4개 중
+        최소 하나가 완전히 일치하므로, 밴드별 버킷으로 후보만 추려
+        전수 비교 없이 O(N)에 가깝게 동작한다.
+        """
+        buckets: Dict[tuple, List[int]] = {}
+        kept_hashes: List[int] = []
+        indices: List[int] = []
+        for i, title in enumerate(self.titles):
+            title_hash = _simhash64(title or "")
+            band_keys = [
+                (band, (title_hash >> (band * 16)) & 0xFFFF)
+                for band in range(4)
+            ]
+            candidates: set = set()
+            for key in band_keys:
+                candidates.update(buckets.get(key, ()))
+
+            if any(
+                bin(title_hash ^ kept_hashes[slot]).count("1") <= max_distance
+                for slot in candidates
+            ):
+                continue
+
+            slot = len(kept_hashes)
+            kept_hashes.append(title_hash)
+            for key in band_keys:
+                buckets.setdefault(key, []).append(slot)
+            indices.append(i)
+        return self._take(indices) if len(indices) < len(self) else self
+
+    def filter_min_content(self, min_chars: int) -> "NewsItemBatch":
+        """본문 길이가 기준 미만인 항목 제거"""
+        indices = [
+            i for i, content in enumerate(self.contents)
+            if len(content or "") >= min_chars
+        ]
+        return self._take(indices) if len(indices) < len(self) else self
+
+    def to_records(
+        self,
+        category_ids: Dict[str, int],
+        created_at: Optional[datetime] = None
+    ) -> List[Dict]:
+        """ORM 객체 생성 없이 일괄 INSERT용 행 딕셔너리 생성"""
+        now = created_at or datetime.now()
+        return [
+            {
+                "title": title,
+                "content": content,
+                "summary": summary,
+                "url": url,
+                "source": source,
+                "thumbnail_url": thumbnail_url,
+                "published_at": published_at,
+                "category_id": category_ids[category],
+                # 비정규화된 카테고리명 배열 (개인화 응답이 조인 없이 읽는다)
+                "category_names": [category],
+                "created_at": now,
+                "is_processed": False,
+                "view_count": 0
+            }
+            for title, content, summary, url, published_at, source,
+                category, thumbnail_url in zip(
+                    self.titles, self.contents, self.summaries, self.urls,
+                    self.published_at, self.sources, self.categories,
+                    self.thumbnail_urls
+                )
+        ]
+
+
 class NewsSource:
     """뉴스 소스 기본 클래스"""
-    
+
     def __init__(self, name: str, base_url: str):
         self.name = name
         self.base_url = base_url
-    
-    async def crawl(self, page: Page, category: str) -> List[NewsItem]:
+        # 카테고리별 RSS 피드 URL (있으면 브라우저 렌더링 없이 HTTP로 수집)
+        self.feed_urls: Dict[str, str] = {}
+
+    async def crawl(
+        self,
+        page: Page,
+        category: str,
+        seen: Optional[set] = None
+    ) -> List[NewsItem]:
         """뉴스 크롤링 추상 메서드"""
         raise NotImplementedError
 
+    async def crawl_feed(
+        self,
+        client: httpx.AsyncClient,
+        category: str,
+        limit: int = 10
+    ) -> List[NewsItem]:
+        """
+        RSS 피드 기반 크롤링 (빠른 경로)
+
+        목록 페이지는 서버 렌더링과 별개로 RSS로도 제공되는 경우가 많아
+        브라우저 구동/JS 실행/고정 대기 없이 HTTP 한 번으로 수집한다.
+        피드가 없거나 실패하면 빈 리스트를 반환해 Playwright 경로로 폴백한다.
+        """
+        feed_url = self.feed_urls.get(category)
+        if not feed_url:
+            return []
+
+        try:
+            response = await client.get(feed_url, timeout=10.0)
+            if response.status_code != 200:
+                logger.warning(f"{self.name} {category} 피드 응답 오류: {response.status_code}")
+                return []
+
+            root = ET.fromstring(response.content)
+
+            results = []
+            for item in root.iter("item"):
+                title = (item.findtext("title") or "").strip()
+                link = (item.findtext("link") or "").strip()
+                description = (item.findtext("description") or "").strip()
+
+                if not title or not link:
+                    continue
+
+                published_at = datetime.now()
+                pub_date = item.findtext("pubDate")
+                if pub_date:
+                    try:
+                        published_at = parsedate_to_datetime(pub_date)
+                    except (TypeError, ValueError):
+                        pass
+
+                results.append(NewsItem(
+                    title=title,
+                    content=description,
+                    summary=description[:200] + "..." if len(description) > 200 else description,
+                    url=link,
+                    published_at=published_at,
+                    source=self.name,
+                    category=category
+                ))
+
+                if len(results) >= limit:
+                    break
+
+            logger.info(f"{self.name} {category} 피드에서 {len(results)}개 기사 수집")
+            return results
+
+        except Exception as e:
+            logger.warning(f"{self.name} {category} 피드 크롤링 오류: {e}")
+            return []
+
 
 class NaverNewsSource(NewsSource):
     """네이버 뉴스 크롤러"""
     
     def __init__(self):
         super().__init__("네이버뉴스", "https://news.naver.com")
+        # 기사 본문 정적 수집용 속도 제한 (초당 5건, 예의 유지)
+        self._article_limiter = AsyncLimiter(5, 1.0)
         self.categories = {
             "정치": "politics",
             "경제": "economy", 
@@ -65,40 +466,86 @@ class NaverNewsSource(NewsSource):
             "IT/과학": "it"
         }
     
-    async def crawl(self, page: Page, category: str) -> List[NewsItem]:
+    async def crawl(
+        self,
+        page: Page,
+        category: str,
+        seen: Optional[set] = None
+    ) -> List[NewsItem]:
         """네이버 뉴스 크롤링"""
         try:
             category_code = self.categories.get(category, "politics")
             url = f"{self.base_url}/main/main.naver?mode=LSD&mid=shm&sid1=100"
             
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            # 뉴스 기사 목록 선택자
-            news_items = await page.query_selector_all(".cluster_body .cluster_text a")
-            
+            # 목록은 서버 렌더링이므로 networkidle 대신 domcontentloaded로 충분
+            # 고정 대기 대신 목록 선택자가 나타날 때까지만 대기
+            await page.goto(url, wait_until="domcontentloaded", timeout=10000)
+            await page.wait_for_selector(".cluster_body .cluster_text a", timeout=5000)
+
+            # 목록 전체를 한 번의 evaluate로 추출
+            # (아이템당 query_selector/inner_text 왕복 수십 회를 CDP 호출 1회로 축소)
+            items = await page.evaluate(
+                """
+                (args) => Array.from(document.querySelectorAll(args.listSel))
+                    .slice(0, args.limit)
+                    .map((node) => {
+                        const titleNode = node.querySelector(args.titleSel);
+                        return {
+                            title: titleNode ? titleNode.innerText : null,
+                            link: node.getAttribute("href")
+                        };
+                    })
+                """,
+                {
+                    "listSel": ".cluster_body .cluster_text a",
+                    "titleSel": ".cluster_text_headline",
+                    "limit": 10  # 상위 10개만 수집
+                }
+            )
+
+            # 목록에서 제목/정규화된 링크만 먼저 추려낸다
+            candidates = []
+            for item in items:
+                title = item.get("title")
+                link = item.get("link")
+
+                if not link or not title:
+                    continue
+
+                # 절대 URL로 변환
+                if link.startswith("//"):
+                    link = "https:" + link
+                elif link.startswith("/"):
+                    link = self.base_url + link
+
+                # 같은 기사가 클러스터/다른 카테고리로 중복 노출될 수 있어
+                # 기사 페이지 이동 전에 URL 키로 걸러낸다
+                if seen is not None:
+                    key = _url_key(link)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                candidates.append((title, link))
+
+            # 정적 본문 수집은 직렬 대기 대신 속도 제한 하에 동시 실행
+            # (기사당 왕복 지연이 겹쳐져 체감 시간이 limiter 용량에 비례)
+            async def fetch_static(link: str):
+                async with self._article_limiter:
+                    return await self._fetch_article_static(link)
+
+            static_results = await asyncio.gather(
+                *(fetch_static(link) for _, link in candidates),
+                return_exceptions=True
+            )
+
             results = []
-            for item in news_items[:10]:  # 상위 10개만 수집
+            for (title, link), article_content in zip(candidates, static_results):
                 try:
-                    # 제목 추출
-                    title_element = await item.query_selector(".cluster_text_headline")
-                    if not title_element:
-                        continue
-                        
-                    title = await title_element.inner_text()
-                    link = await item.get_attribute("href")
-                    
-                    if not link or not title:
-                        continue
-                    
-                    # 절대 URL로 변환
-                    if link.startswith("//"):
-                        link = "https:" + link
-                    elif link.startswith("/"):
-                        link = self.base_url + link
-                    
-                    # 개별 기사 페이지로 이동하여 내용 수집
-                    article_content = await self._get_article_content(page, link)
-                    
+                    if isinstance(article_content, Exception) or article_content is None:
+                        # 정적 수집 실패분만 공유 페이지로 순차 렌더링 폴백
+                        article_content = await self._fetch_article_rendered(page, link)
+
                     news_item = NewsItem(
                         title=title.strip(),
                         content=article_content.get("content", ""),
@@ -109,49 +556,61 @@ class NaverNewsSource(NewsSource):
                         category=category,
                         thumbnail_url=article_content.get("thumbnail")
                     )
-                    
+
                     results.append(news_item)
-                    
+
                 except Exception as e:
                     logger.warning(f"뉴스 아이템 처리 중 오류: {e}")
                     continue
-            
+
             logger.info(f"네이버 뉴스 {category} 카테고리에서 {len(results)}개 기사 수집")
             return results
-            
+
         except Exception as e:
             logger.error(f"네이버 뉴스 크롤링 오류: {e}")
             return []
-    
-    async def _get_article_content(self, page: Page, url: str) -> Dict:
-        """개별 기사 내용 추출"""
+
+    async def _fetch_article_rendered(self, page: Page, url: str) -> Dict:
+        """브라우저 렌더링으로 기사 내용 추출 (정적 수집 실패 시 폴백)"""
         try:
-            await page.goto(url, wait_until="networkidle", timeout=15000)
-            
-            # 기사 내용 추출
-            content_element = await page.query_selector(".newsct_article, #articleBodyContents, .article_body")
-            content = ""
-            if content_element:
-                content = await content_element.inner_text()
-                content = content.strip()[:2000]  # 2000자까지만
-            
-            # 썸네일 추출
-            thumbnail_element = await page.query_selector(".end_photo_org img, .article_img img")
-            thumbnail_url = None
-            if thumbnail_element:
-                thumbnail_url = await thumbnail_element.get_attribute("src")
-            
-            # 발행시간 추출 (간단한 처리)
-            time_element = await page.query_selector(".media_end_head_info_datestamp_time")
+            await page.goto(url, wait_until="domcontentloaded", timeout=10000)
+
+            # 본문 선택자가 나타날 때까지만 대기 (없으면 빈 내용으로 진행)
+            try:
+                await page.wait_for_selector(
+                    ".newsct_article, #articleBodyContents, .article_body",
+                    timeout=5000
+                )
+            except Exception:
+                pass
+
+            # 본문/썸네일/발행시간을 한 번의 evaluate로 일괄 추출
+            # (query_selector + inner_text 왕복 3회 → CDP 호출 1회)
+            data = await page.evaluate(
+                """
+                () => {
+                    const content = document.querySelector(
+                        ".newsct_article, #articleBodyContents, .article_body");
+                    const thumb = document.querySelector(
+                        ".end_photo_org img, .article_img img");
+                    const time = document.querySelector(
+                        ".media_end_head_info_datestamp_time");
+                    return {
+                        content: content ? content.innerText : "",
+                        thumb: thumb ? thumb.src : null,
+                        time: time ? time.innerText : null
+                    };
+                }
+                """
+            )
+
+            content = _RE_WS.sub(" ", data.get("content") or "").strip()[:2000]  # 2000자까지만
+            thumbnail_url = data.get("thumb")
+
             published_at = datetime.now()
-            if time_element:
-                try:
-                    time_text = await time_element.inner_text()
-                    # 시간 파싱 로직 (추후 개선 필요)
-                    published_at = datetime.now()
-                except:
-                    pass
-            
+            if data.get("time"):
+                published_at = _parse_time(data["time"])
+
             return {
                 "content": content,
                 "summary": content[:200] + "..." if len(content) > 200 else content,
@@ -163,6 +622,42 @@ class NaverNewsSource(NewsSource):
             logger.warning(f"기사 내용 추출 오류 {url}: {e}")
             return {"content": "", "summary": "", "thumbnail": None, "published_at": datetime.now()}
 
+    async def _fetch_article_static(self, url: str) -> Optional[Dict]:
+        """
+        브라우저 없이 httpx + lxml로 기사 내용 추출
+
+        본문이 비어 있으면(JS 렌더링이 필요한 페이지) None을 반환해
+        Playwright 경로로 넘긴다.
+        """
+        try:
+            response = await _get_article_client().get(url)
+            response.raise_for_status()
+
+            # 파싱은 CPU 바운드이므로 프로세스 풀에서 실행해
+            # 이벤트 루프(다른 크롤링/Playwright 제어)를 세우지 않는다
+            parsed = await asyncio.get_running_loop().run_in_executor(
+                _get_parse_pool(), _parse_article_html, response.text
+            )
+            if parsed is None:
+                return None
+
+            content = parsed["content"]
+            published_at = (
+                _parse_time(parsed["time_text"])
+                if parsed["time_text"] else datetime.now()
+            )
+
+            return {
+                "content": content,
+                "summary": content[:200] + "..." if len(content) > 200 else content,
+                "thumbnail": parsed["thumbnail"],
+                "published_at": published_at
+            }
+
+        except Exception as e:
+            logger.debug(f"정적 기사 수집 실패, 브라우저로 재시도 ({url}): {e}")
+            return None
+
 
 class YonhapNewsSource(NewsSource):
     """연합뉴스 크롤러"""
@@ -172,47 +667,76 @@ class YonhapNewsSource(NewsSource):
         self.categories = {
             "정치": "politics",
             "경제": "economy",
-            "사회": "society", 
+            "사회": "society",
             "국제": "international",
             "IT/과학": "technology"
         }
+        # 연합뉴스는 카테고리별 RSS 제공 - 브라우저 없이 수집 가능
+        self.feed_urls = {
+            category: f"{self.base_url}/rss/{path}.xml"
+            for category, path in self.categories.items()
+        }
     
-    async def crawl(self, page: Page, category: str) -> List[NewsItem]:
+    async def crawl(
+        self,
+        page: Page,
+        category: str,
+        seen: Optional[set] = None
+    ) -> List[NewsItem]:
         """연합뉴스 크롤링"""
         try:
             category_path = self.categories.get(category, "politics")
             url = f"{self.base_url}/view/AKR"
             
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            # 뉴스 기사 목록 선택자 (연합뉴스 구조에 맞게 조정)
-            news_items = await page.query_selector_all(".news-con .item-box01")
-            
+            # 목록은 서버 렌더링이므로 networkidle 대신 domcontentloaded로 충분
+            await page.goto(url, wait_until="domcontentloaded", timeout=10000)
+            await page.wait_for_selector(".news-con .item-box01", timeout=5000)
+
+            # 목록 전체를 한 번의 evaluate로 추출 (아이템당 CDP 왕복 제거)
+            items = await page.evaluate(
+                """
+                (args) => Array.from(document.querySelectorAll(args.listSel))
+                    .slice(0, args.limit)
+                    .map((node) => {
+                        const titleNode = node.querySelector(".news-tl");
+                        const linkNode = node.querySelector("a");
+                        const summaryNode = node.querySelector(".news-sm");
+                        return {
+                            title: titleNode ? titleNode.innerText : null,
+                            link: linkNode ? linkNode.getAttribute("href") : null,
+                            summary: summaryNode ? summaryNode.innerText : ""
+                        };
+                    })
+                """,
+                {
+                    "listSel": ".news-con .item-box01",
+                    "limit": 8  # 상위 8개만 수집
+                }
+            )
+
             results = []
-            for item in news_items[:8]:  # 상위 8개만 수집
+            for item in items:
                 try:
-                    title_element = await item.query_selector(".news-tl")
-                    link_element = await item.query_selector("a")
-                    
-                    if not title_element or not link_element:
-                        continue
-                    
-                    title = await title_element.inner_text()
-                    link = await link_element.get_attribute("href")
-                    
+                    title = item.get("title")
+                    link = item.get("link")
+
                     if not link or not title:
                         continue
-                    
+
                     # 절대 URL로 변환
                     if link.startswith("/"):
                         link = self.base_url + link
-                    
+
+                    # 이미 수집한 기사 URL은 건너뛴다
+                    if seen is not None:
+                        key = _url_key(link)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+
                     # 간단한 내용 추출 (연합뉴스는 목록에서 요약 제공)
-                    summary_element = await item.query_selector(".news-sm")
-                    summary = ""
-                    if summary_element:
-                        summary = await summary_element.inner_text()
-                    
+                    summary = item.get("summary") or ""
+
                     news_item = NewsItem(
                         title=title.strip(),
                         content=summary,  # 연합뉴스는 목록에서 요약만 가져옴
@@ -237,57 +761,295 @@ class YonhapNewsSource(NewsSource):
             return []
 
 
+class BrowserPool:
+    """
+    프로세스 수명 동안 Playwright 브라우저를 따뜻하게 유지하는 풀
+
+    매 크롤링마다 Chromium을 새로 띄우면 콜드스타트가 전체 시간을
+    지배하므로, 브라우저는 한 번만 띄워두고 호출자에게는 일회용
+    컨텍스트만 빌려준다. 앱 시작/종료(lifespan)에서 start/stop을
+    호출하고, 스케줄러 등에서 먼저 쓰이면 지연 시작한다.
+    """
+
+    _LAUNCH_ARGS = ['--no-sandbox', '--disable-dev-shm-usage', '--no-zygote']
+
+    # 디스크 캐시를 재기동 간에 유지되는 경로로 고정해
+    # 셰이더/HTTP 캐시가 브라우저 재활용 후에도 따뜻하게 남도록 한다
+    _DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), "newsbite_chromium_cache")
+
+    # 이 횟수만큼 컨텍스트를 빌려준 뒤 브라우저를 재기동한다
+    # (장수 브라우저의 Request/Response 채널 객체 누적으로 인한 메모리 증가 상한)
+    _RECYCLE_AFTER_CONTEXTS = 50
+
+    def __init__(self):
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+        self._contexts_served = 0
+        self._active_contexts = 0
+
+    async def start(self) -> None:
+        """브라우저 기동 (이미 떠 있으면 무시)"""
+        async with self._lock:
+            if self._browser is not None:
+                return
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            os.makedirs(self._DISK_CACHE_DIR, exist_ok=True)
+            self._browser = await self._playwright.chromium.launch(
+                headless=True,
+                args=self._LAUNCH_ARGS + [
+                    f"--disk-cache-dir={self._DISK_CACHE_DIR}"
+                ]
+            )
+            logger.info("브라우저 풀 시작됨")
+
+    async def stop(self) -> None:
+        """브라우저 종료"""
+        async with self._lock:
+            if self._browser is not None:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+            logger.info("브라우저 풀 종료됨")
+
+    @asynccontextmanager
+    async def context(self, **context_kwargs):
+        """새 브라우저 컨텍스트를 빌려주고 종료 시 닫는다"""
+        if self._browser is None:
+            await self.start()
+        ctx = await self._browser.new_context(**context_kwargs)
+        self._contexts_served += 1
+        self._active_contexts += 1
+        try:
+            yield ctx
+        finally:
+            await ctx.close()
+            self._active_contexts -= 1
+            if (
+                self._contexts_served >= self._RECYCLE_AFTER_CONTEXTS
+                and self._active_contexts == 0
+            ):
+                await self._recycle()
+
+    async def _recycle(self) -> None:
+        """누적된 브라우저 프로세스 메모리 해제를 위해 재기동 예약"""
+        async with self._lock:
+            if self._active_contexts > 0 or self._browser is None:
+                return
+            await self._browser.close()
+            self._browser = None
+            self._contexts_served = 0
+            logger.info("브라우저 풀 재활용: 다음 사용 시 새 브라우저 기동")
+
+
+# 전역 브라우저 풀 (앱 lifespan에서 start/stop)
+browser_pool = BrowserPool()
+
+
 class NewsCrawler:
     """뉴스 크롤러 메인 클래스"""
-    
-    def __init__(self):
+
+    USER_AGENT = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    )
+
+    # 동시에 열어두는 브라우저 컨텍스트 수 제한
+    MAX_CONCURRENT_CRAWLS = 4
+
+    # 텍스트 추출에 불필요한 리소스 유형 (로드 차단으로 대역폭/지연 절감)
+    _BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media"}
+
+    # 광고/추적 호스트 차단 목록
+    _BLOCKED_HOST_RE = re.compile(
+        r"google-analytics|googletagmanager|doubleclick|googlesyndication"
+        r"|facebook\.(net|com)|criteo|taboola|outbrain|adsystem"
+    )
+
+    def __init__(self, pool: Optional[BrowserPool] = None):
         self.sources = [
             NaverNewsSource(),
             YonhapNewsSource()
         ]
+        self._pool = pool or browser_pool
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENT_CRAWLS)
+        # 호스트별 토큰 버킷 - 같은 호스트 요청만 직렬화하고 서로 다른 호스트는 병렬 진행
+        self._host_limiters: Dict[str, AsyncLimiter] = {}
+
+    def _host_limiter(self, base_url: str) -> AsyncLimiter:
+        """호스트별 요청 제한기 반환 (초당 1회)"""
+        host = urlparse(base_url).netloc
+        limiter = self._host_limiters.get(host)
+        if limiter is None:
+            limiter = AsyncLimiter(1, 1)
+            self._host_limiters[host] = limiter
+        return limiter
+
+    async def _route_filter(self, route) -> None:
+        """이미지/폰트/광고 등 본문 추출과 무관한 요청 차단"""
+        request = route.request
+        if (
+            request.resource_type in self._BLOCKED_RESOURCE_TYPES
+            or self._BLOCKED_HOST_RE.search(request.url)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _crawl_one(
+        self,
+        page_pool: asyncio.Queue,
+        source: NewsSource,
+        category: str,
+        seen: set
+    ) -> List[NewsItem]:
+        """단일 소스/카테고리 크롤링 (세마포어 + 호스트별 속도 제한)"""
+        async with self._sem:
+            async with self._host_limiter(source.base_url):
+                # 컨텍스트/페이지 생성 비용을 아끼기 위해 미리 연 페이지를 풀에서 재사용
+                page = await page_pool.get()
+                try:
+                    logger.info(f"{source.name}에서 {category} 카테고리 크롤링 시작")
+                    return await source.crawl(page, category, seen)
+                finally:
+                    # close 대신 빈 페이지로 초기화 후 풀에 반환 (연결 워밍 상태 유지)
+                    try:
+                        await page.goto("about:blank")
+                    except Exception:
+                        pass
+                    await page_pool.put(page)
     
-    async def crawl_all_categories(self, categories: List[str] = None) -> List[NewsItem]:
-        """모든 카테고리의 뉴스 크롤링"""
+    # DB 등으로 넘기는 스트리밍 배치 크기
+    _STREAM_BATCH_SIZE = 50
+
+    async def crawl_all_categories(
+        self,
+        categories: List[str] = None,
+        on_batch=None
+    ) -> List[NewsItem]:
+        """
+        모든 카테고리의 뉴스 크롤링
+
+        on_batch 콜백이 주어지면 수집된 기사를 전부 메모리에 쌓지 않고
+        asyncio.Queue를 통해 50개 단위로 즉시 넘긴다(수집과 저장이
+        겹쳐 돌고 피크 메모리가 배치 크기로 제한됨). 이때 반환 리스트는
+        비어 있다. 콜백이 없으면 기존처럼 전체 리스트를 반환한다.
+        """
         if categories is None:
             categories = ["정치", "경제", "사회", "IT/과학", "세계"]
-        
-        all_news = []
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-dev-shm-usage']
-            )
-            
+
+        collected: List[NewsItem] = []
+        item_q: asyncio.Queue = asyncio.Queue(maxsize=500)
+
+        # 실행 단위로 이미 본 기사 URL 키 집합 (카테고리 간 중복 수집 방지)
+        seen_urls: set = set()
+        produced = 0
+
+        async def put_item(item: NewsItem) -> None:
+            nonlocal produced
+            produced += 1
+            await item_q.put(item)
+
+        async def produce() -> None:
+            """피드 → Playwright 폴백 순으로 수집해 큐에 밀어넣는다"""
             try:
-                for source in self.sources:
-                    page = await browser.new_page()
-                    
-                    # User-Agent 설정
-                    await page.set_extra_http_headers({
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                    })
-                    
-                    for category in categories:
-                        try:
-                            logger.info(f"{source.name}에서 {category} 카테고리 크롤링 시작")
-                            news_items = await source.crawl(page, category)
-                            all_news.extend(news_items)
-                            
-                            # 요청 간 간격
-                            await asyncio.sleep(1)
-                            
-                        except Exception as e:
-                            logger.error(f"{source.name} {category} 크롤링 오류: {e}")
-                            continue
-                    
-                    await page.close()
-                    
+                # 1차: RSS 피드가 있는 소스는 HTTP로 바로 수집 (브라우저 구동 생략)
+                # 피드 조회는 서로 독립적이므로 동시 실행
+                targets = [
+                    (source, category)
+                    for source in self.sources
+                    for category in categories
+                ]
+
+                fallback_targets = []
+                # 피드도 공유 클라이언트로 조회 (크롤링마다 풀을 새로 만들지 않는다)
+                client = _get_article_client()
+                feed_results = await asyncio.gather(
+                    *(source.crawl_feed(client, category) for source, category in targets),
+                    return_exceptions=True
+                )
+
+                for (source, category), feed_items in zip(targets, feed_results):
+                    if isinstance(feed_items, Exception):
+                        logger.error(f"{source.name} {category} 피드 크롤링 오류: {feed_items}")
+                        fallback_targets.append((source, category))
+                    elif feed_items:
+                        for feed_item in feed_items:
+                            key = _url_key(feed_item.url)
+                            if key in seen_urls:
+                                continue
+                            seen_urls.add(key)
+                            await put_item(feed_item)
+                    else:
+                        fallback_targets.append((source, category))
+
+                # 2차: 피드로 수집하지 못한 소스/카테고리만 Playwright로 폴백
+                # 세마포어로 동시성을 제한하고 호스트별 속도 제한으로 예의를 지킨다
+                if fallback_targets:
+                    # 브라우저는 풀에서 재사용하고(콜드스타트 제거) 컨텍스트만 일회용으로 빌린다
+                    async with self._pool.context(
+                        user_agent=self.USER_AGENT,
+                        viewport={"width": 1280, "height": 800}
+                    ) as context:
+                        await context.route("**/*", self._route_filter)
+
+                        # 태스크마다 페이지를 새로 만들지 않고 미리 연 페이지 풀을
+                        # 공유해 생성 비용을 상환하고 연결을 따뜻하게 유지
+                        page_pool: asyncio.Queue = asyncio.Queue()
+                        pool_size = min(self.MAX_CONCURRENT_CRAWLS, len(fallback_targets))
+                        for _ in range(pool_size):
+                            await page_pool.put(await context.new_page())
+
+                        crawl_results = await asyncio.gather(
+                            *(
+                                self._crawl_one(page_pool, source, category, seen_urls)
+                                for source, category in fallback_targets
+                            ),
+                            return_exceptions=True
+                        )
+
+                        for (source, category), news_items in zip(fallback_targets, crawl_results):
+                            if isinstance(news_items, Exception):
+                                logger.error(f"{source.name} {category} 크롤링 오류: {news_items}")
+                            else:
+                                for news_item in news_items:
+                                    await put_item(news_item)
+
+                        # 컨텍스트 해제에 맡기지 않고 페이지를 명시적으로 닫는다
+                        while not page_pool.empty():
+                            page = page_pool.get_nowait()
+                            try:
+                                await page.close()
+                            except Exception:
+                                pass
             finally:
-                await browser.close()
-        
-        logger.info(f"총 {len(all_news)}개의 뉴스 기사 수집 완료")
-        return all_news
+                # 종료 신호
+                await item_q.put(None)
+
+        async def consume() -> None:
+            """큐에서 기사를 꺼내 배치 단위로 콜백에 넘기거나 수집한다"""
+            batch: List[NewsItem] = []
+            while True:
+                item = await item_q.get()
+                if item is None:
+                    break
+                if on_batch is None:
+                    collected.append(item)
+                    continue
+                batch.append(item)
+                if len(batch) >= self._STREAM_BATCH_SIZE:
+                    await on_batch(batch)
+                    batch = []
+            if batch:
+                await on_batch(batch)
+
+        await asyncio.gather(produce(), consume())
+
+        logger.info(f"총 {produced}개의 뉴스 기사 수집 완료")
+        return collected
     
     async def crawl_category(self, category: str) -> List[NewsItem]:
         """특정 카테고리 뉴스 크롤링"""
@@ -298,6 +1060,27 @@ class NewsCrawler:
 news_crawler = NewsCrawler()
 
 
+async def crawl_and_store(categories: List[str] = None) -> int:
+    """
+    크롤링과 DB 저장을 큐로 연결해 실행
+
+    기사가 50개 모일 때마다 일괄 INSERT가 돌기 시작하므로
+    수집이 끝나기를 기다렸다가 저장하는 것보다 빠르고 가볍다.
+    """
+    # 순환 임포트 방지 (news_service가 이 모듈을 임포트함)
+    from app.services.news_service import news_service
+
+    saved_count = 0
+
+    async def persist(batch: List[NewsItem]) -> None:
+        nonlocal saved_count
+        created = await news_service.create_news_articles(batch)
+        saved_count += len(created)
+
+    await news_crawler.crawl_all_categories(categories, on_batch=persist)
+    return saved_count
+
+
 async def main():
     """테스트용 메인 함수"""
     logging.basicConfig(level=logging.INFO)
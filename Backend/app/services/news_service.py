@@ -15,256 +15,409 @@
 뉴스 서비스
 뉴스 데이터 관리 및 비즈니스 로직
 """
-from typing import List, Optional, Dict
+import time
+from typing import Any, List, Optional, Dict
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, func, literal_column, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.news import News
 from app.models.category import Category
 from app.models.company import Company
-from app.services.news_crawler import NewsItem
-from app.core.database import get_db_session
+from app.services.news_crawler import NewsItem, NewsItemBatch
+from app.core.database import async_session
+
+# 읽기 위주 엔드포인트용 인메모리 TTL 캐시
+# 목록류는 60초, 통계는 더 천천히 변하므로 5분간 재사용한다
+_NEWS_CACHE_TTL = 60.0
+_STATS_CACHE_TTL = 300.0
+_NEWS_CACHE_MAX = 256
+_news_cache: Dict[str, tuple] = {}
+
+
+def _cache_get(key: str) -> Optional[Any]:
+    """캐시 조회 (만료 시 제거 후 None)"""
+    entry = _news_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        _news_cache.pop(key, None)
+        return None
+    return value
+
+
+def _cache_set(key: str, value: Any, ttl: float) -> None:
+    """캐시 저장 (가득 차면 가장 오래된 항목부터 제거)"""
+    if len(_news_cache) >= _NEWS_CACHE_MAX:
+        _news_cache.pop(next(iter(_news_cache)), None)
+    _news_cache[key] = (time.monotonic() + ttl, value)
+
+
+def _cache_clear() -> None:
+    """뉴스 저장 후 목록/통계 캐시 무효화"""
+    _news_cache.clear()
 
 
 class NewsService:
     """뉴스 서비스 클래스"""
-    
+
     def __init__(self):
         pass
-    
+
     async def create_news_article(self, news_item: NewsItem) -> Optional[News]:
-        """뉴스 기사 생성"""
+        """
+        뉴스 기사 생성
+
+        중복 판별은 제목 SELECT 대신 news.url 유니크 인덱스에 맡긴다.
+        INSERT ... ON CONFLICT (url) DO NOTHING이라 사전 조회 없이
+        한 문장으로 끝나며, 이미 있는 URL이면 None을 반환한다.
+        """
         try:
-            async with get_db_session() as db:
-                # 중복 체크 (제목 기반)
-                existing = db.query(News).filter(
-                    News.title == news_item.title
-                ).first()
-                
-                if existing:
-                    return existing
-                
+            async with async_session() as db:
                 # 카테고리 찾기 또는 생성
-                category = db.query(Category).filter(
-                    Category.name == news_item.category
-                ).first()
-                
+                category = (
+                    await db.execute(
+                        select(Category).where(Category.name == news_item.category)
+                    )
+                ).scalar_one_or_none()
+
                 if not category:
                     category = Category(
                         name=news_item.category,
                         description=f"{news_item.category} 카테고리"
                     )
                     db.add(category)
-                    db.commit()
-                    db.refresh(category)
-                
-                # 뉴스 기사 생성
-                news_article = News(
-                    title=news_item.title,
-                    content=news_item.content,
-                    summary=news_item.summary,
-                    url=news_item.url,
-                    source=news_item.source,
-                    thumbnail_url=news_item.thumbnail_url,
-                    published_at=news_item.published_at,
-                    category_id=category.id,
-                    created_at=datetime.now(),
-                    is_processed=False,  # AI 처리 전
-                    view_count=0
+                    await db.flush()
+
+                # 뉴스 기사 생성 (URL·제목 해시 충돌 시 DB가 조용히 스킵)
+                stmt = (
+                    pg_insert(News)
+                    .values(
+                        title=news_item.title,
+                        content=news_item.content,
+                        summary=news_item.summary,
+                        url=news_item.url,
+                        source=news_item.source,
+                        thumbnail_url=news_item.thumbnail_url,
+                        published_at=news_item.published_at,
+                        category_id=category.id,
+                        created_at=datetime.now(),
+                        is_processed=False,  # AI 처리 전
+                        view_count=0
+                    )
+                    .on_conflict_do_nothing()
+                    .returning(News)
                 )
-                
-                db.add(news_article)
-                db.commit()
-                db.refresh(news_article)
-                
+                news_article = (await db.execute(stmt)).scalars().first()
+                await db.commit()
+
+                if news_article is not None:
+                    _cache_clear()
                 return news_article
-                
+
         except Exception as e:
             print(f"뉴스 기사 생성 오류: {e}")
             return None
-    
-    async def get_recent_news(self, 
+
+    async def create_news_articles(self, news_items: List[NewsItem]) -> List[News]:
+        """
+        뉴스 기사 일괄 생성
+
+        기사마다 세션/중복 SELECT/커밋을 반복하지 않고 한 세션에서
+        카테고리 일괄 해석 → 단일 INSERT ... ON CONFLICT DO NOTHING으로
+        저장한다. 이미 있는 URL은 DB가 걸러내므로 사전 조회가 없다.
+        """
+        if not news_items:
+            return []
+
+        try:
+            # 열 지향 배치로 변환해 중복 제거와 행 생성을 필드 단위 패스로 처리
+            # URL 중복 제거 후 제목 SimHash로 근접 중복(문장부호·꼬리표만
+            # 다른 같은 기사)까지 걸러 불필요한 AI 처리를 줄인다
+            batch = (
+                NewsItemBatch.from_items(news_items)
+                .dedup_by_url()
+                .dedup_near_titles()
+            )
+
+            async with async_session() as db:
+                # 카테고리를 단일 IN 쿼리로 해석하고 없는 것만 일괄 생성
+                category_names = set(batch.categories)
+                categories = {
+                    category.name: category
+                    for category in (
+                        await db.execute(
+                            select(Category).where(Category.name.in_(category_names))
+                        )
+                    ).scalars()
+                }
+
+                missing = category_names - categories.keys()
+                if missing:
+                    new_categories = [
+                        Category(name=name, description=f"{name} 카테고리")
+                        for name in missing
+                    ]
+                    db.add_all(new_categories)
+                    await db.flush()
+                    for category in new_categories:
+                        categories[category.name] = category
+
+                rows = batch.to_records(
+                    {name: category.id for name, category in categories.items()}
+                )
+
+                # 중복 확인 + 저장을 단일 문장으로
+                # (URL·제목 해시 어느 유니크 제약과 충돌해도 조용히 스킵)
+                # 아주 큰 배치는 파라미터 한도를 넘지 않게 500행씩 나눠 보낸다
+                created = []
+                for start in range(0, len(rows), 500):
+                    stmt = (
+                        pg_insert(News)
+                        .values(rows[start:start + 500])
+                        .on_conflict_do_nothing()
+                        .returning(News)
+                    )
+                    created.extend((await db.execute(stmt)).scalars().all())
+                await db.commit()
+
+                if created:
+                    _cache_clear()
+                return list(created)
+
+        except Exception as e:
+            print(f"뉴스 기사 일괄 생성 오류: {e}")
+            return []
+
+    async def get_recent_news(self,
                             category_id: Optional[int] = None,
                             limit: int = 20,
                             offset: int = 0) -> List[News]:
         """최근 뉴스 조회"""
         try:
-            async with get_db_session() as db:
-                query = db.query(News)
-                
+            cache_key = f"recent:{category_id}:{limit}:{offset}"
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            async with async_session() as db:
+                stmt = select(News)
+
                 if category_id:
-                    query = query.filter(News.category_id == category_id)
-                
-                news_list = query.order_by(desc(News.published_at))\
-                                .offset(offset)\
-                                .limit(limit)\
-                                .all()
-                
+                    stmt = stmt.where(News.category_id == category_id)
+
+                stmt = stmt.order_by(desc(News.published_at)) \
+                           .offset(offset) \
+                           .limit(limit)
+
+                news_list = list((await db.execute(stmt)).scalars())
+                _cache_set(cache_key, news_list, _NEWS_CACHE_TTL)
                 return news_list
-                
+
         except Exception as e:
             print(f"최근 뉴스 조회 오류: {e}")
             return []
-    
+
     async def get_news_by_category(self, category_name: str, limit: int = 10) -> List[News]:
         """카테고리별 뉴스 조회"""
         try:
-            async with get_db_session() as db:
-                news_list = db.query(News)\
-                             .join(Category)\
-                             .filter(Category.name == category_name)\
-                             .order_by(desc(News.published_at))\
-                             .limit(limit)\
-                             .all()
-                
+            cache_key = f"category:{category_name}:{limit}"
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            async with async_session() as db:
+                stmt = select(News) \
+                    .join(Category) \
+                    .where(Category.name == category_name) \
+                    .order_by(desc(News.published_at)) \
+                    .limit(limit)
+
+                news_list = list((await db.execute(stmt)).scalars())
+                _cache_set(cache_key, news_list, _NEWS_CACHE_TTL)
                 return news_list
-                
+
         except Exception as e:
             print(f"카테고리별 뉴스 조회 오류: {e}")
             return []
-    
+
     async def get_trending_news(self, hours: int = 24, limit: int = 10) -> List[News]:
         """트렌딩 뉴스 조회 (조회수 기준)"""
         try:
-            async with get_db_session() as db:
+            cache_key = f"trending:{hours}:{limit}"
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            async with async_session() as db:
                 since = datetime.now() - timedelta(hours=hours)
-                
-                news_list = db.query(News)\
-                             .filter(News.published_at >= since)\
-                             .order_by(desc(News.view_count), desc(News.published_at))\
-                             .limit(limit)\
-                             .all()
-                
+
+                stmt = select(News) \
+                    .where(News.published_at >= since) \
+                    .order_by(desc(News.view_count), desc(News.published_at)) \
+                    .limit(limit)
+
+                news_list = list((await db.execute(stmt)).scalars())
+                _cache_set(cache_key, news_list, _NEWS_CACHE_TTL)
                 return news_list
-                
+
         except Exception as e:
             print(f"트렌딩 뉴스 조회 오류: {e}")
             return []
-    
-    async def search_news(self, 
-                         keyword: str, 
+
+    async def search_news(self,
+                         keyword: str,
                          category_id: Optional[int] = None,
                          limit: int = 20) -> List[News]:
         """뉴스 검색"""
         try:
-            async with get_db_session() as db:
-                query = db.query(News)
-                
-                # 제목 또는 내용에서 키워드 검색
-                search_filter = or_(
-                    News.title.contains(keyword),
-                    News.content.contains(keyword),
-                    News.summary.contains(keyword)
-                )
-                query = query.filter(search_filter)
-                
+            async with async_session() as db:
+                stmt = select(News)
+
+                keyword = keyword.strip()
+                if len(keyword) >= 2:
+                    # tsvector 생성 컬럼 + GIN 인덱스로 전문 검색
+                    # (LIKE '%kw%' 3종 순차 스캔 대체)
+                    stmt = stmt.where(
+                        text("news.search @@ plainto_tsquery('simple', :kw)")
+                        .bindparams(kw=keyword)
+                    )
+                else:
+                    # 한 글자 검색어는 토큰화가 무의미하므로
+                    # 제목 트라이그램 인덱스를 타는 LIKE로 폴백
+                    stmt = stmt.where(News.title.contains(keyword))
+
                 if category_id:
-                    query = query.filter(News.category_id == category_id)
-                
-                news_list = query.order_by(desc(News.published_at))\
-                                .limit(limit)\
-                                .all()
-                
-                return news_list
-                
+                    stmt = stmt.where(News.category_id == category_id)
+
+                stmt = stmt.order_by(desc(News.published_at)).limit(limit)
+
+                return list((await db.execute(stmt)).scalars())
+
         except Exception as e:
             print(f"뉴스 검색 오류: {e}")
             return []
-    
+
     async def get_personalized_news(self, user_id: int) -> List[News]:
         """개인화된 뉴스 조회"""
         try:
             # TODO: 사용자 관심사 기반 개인화 로직 구현
             # 현재는 최근 뉴스 반환
             return await self.get_recent_news(limit=10)
-            
+
         except Exception as e:
             print(f"개인화된 뉴스 조회 오류: {e}")
             return []
-    
+
     async def increment_view_count(self, news_id: int) -> bool:
         """뉴스 조회수 증가"""
         try:
-            async with get_db_session() as db:
-                news = db.query(News).filter(News.id == news_id).first()
-                if news:
-                    news.view_count += 1
-                    db.commit()
-                    return True
-                return False
-                
+            async with async_session() as db:
+                # SELECT 후 파이썬 증가는 동시 요청에서 증가분을 잃는다
+                # DB에서 원자적으로 증가시켜 왕복 1회로 끝낸다
+                result = await db.execute(
+                    update(News)
+                    .where(News.id == news_id)
+                    .values(view_count=News.view_count + 1)
+                )
+                await db.commit()
+                return result.rowcount > 0
+
         except Exception as e:
             print(f"조회수 증가 오류: {e}")
             return False
-    
+
     async def get_news_statistics(self) -> Dict:
         """뉴스 통계 조회"""
         try:
-            async with get_db_session() as db:
-                # 총 뉴스 수
-                total_news = db.query(News).count()
-                
-                # 오늘 뉴스 수
+            cached = _cache_get("statistics")
+            if cached is not None:
+                return cached
+
+            async with async_session() as db:
+                # 총계/오늘/카테고리별/소스별 집계를 GROUPING SETS 한 문장으로
+                # 처리해 DB 왕복 4회와 테이블 스캔 반복을 1회로 줄인다
                 today = datetime.now().date()
-                today_news = db.query(News)\
-                               .filter(News.published_at >= today)\
-                               .count()
-                
-                # 카테고리별 뉴스 수
-                category_stats = db.query(Category.name, db.func.count(News.id))\
-                                  .join(News)\
-                                  .group_by(Category.name)\
-                                  .all()
-                
-                # 소스별 뉴스 수
-                source_stats = db.query(News.source, db.func.count(News.id))\
-                                .group_by(News.source)\
-                                .all()
-                
-                return {
+                stmt = (
+                    select(
+                        func.grouping(Category.name).label("cat_grp"),
+                        func.grouping(News.source).label("src_grp"),
+                        Category.name,
+                        News.source,
+                        func.count(),
+                        func.count().filter(News.published_at >= today),
+                    )
+                    .select_from(News)
+                    .outerjoin(Category, Category.id == News.category_id)
+                    .group_by(
+                        func.grouping_sets(
+                            literal_column("()"),
+                            tuple_(Category.name),
+                            tuple_(News.source),
+                        )
+                    )
+                )
+                rows = (await db.execute(stmt)).all()
+
+                total_news = 0
+                today_news = 0
+                by_category: Dict[str, int] = {}
+                by_source: Dict[str, int] = {}
+                for cat_grp, src_grp, category_name, source, count, today_count in rows:
+                    if cat_grp and src_grp:
+                        # 전체 집계 행 (둘 다 그룹핑에서 제외됨)
+                        total_news = count
+                        today_news = today_count
+                    elif not cat_grp and category_name is not None:
+                        by_category[category_name] = count
+                    elif not src_grp and source is not None:
+                        by_source[source] = count
+
+                statistics = {
                     "total_news": total_news,
                     "today_news": today_news,
-                    "by_category": dict(category_stats),
-                    "by_source": dict(source_stats)
+                    "by_category": by_category,
+                    "by_source": by_source
                 }
-                
+                _cache_set("statistics", statistics, _STATS_CACHE_TTL)
+                return statistics
+
         except Exception as e:
             print(f"뉴스 통계 조회 오류: {e}")
             return {}
-    
+
     async def mark_as_processed(self, news_id: int) -> bool:
         """AI 처리 완료 표시"""
         try:
-            async with get_db_session() as db:
-                news = db.query(News).filter(News.id == news_id).first()
-                if news:
-                    news.is_processed = True
-                    news.processed_at = datetime.now()
-                    db.commit()
-                    return True
-                return False
-                
+            async with async_session() as db:
+                result = await db.execute(
+                    update(News)
+                    .where(News.id == news_id)
+                    .values(is_processed=True, processed_at=datetime.now())
+                )
+                await db.commit()
+                return result.rowcount > 0
+
         except Exception as e:
             print(f"처리 완료 표시 오류: {e}")
             return False
-    
+
     async def get_unprocessed_news(self, limit: int = 50) -> List[News]:
         """미처리 뉴스 조회 (AI 처리 대기 중)"""
         try:
-            async with get_db_session() as db:
-                news_list = db.query(News)\
-                             .filter(News.is_processed == False)\
-                             .order_by(News.created_at)\
-                             .limit(limit)\
-                             .all()
-                
-                return news_list
-                
+            async with async_session() as db:
+                stmt = select(News) \
+                    .where(News.is_processed == False) \
+                    .order_by(News.created_at) \
+                    .limit(limit)
+
+                return list((await db.execute(stmt)).scalars())
+
         except Exception as e:
             print(f"미처리 뉴스 조회 오류: {e}")
             return []
 
 
 # 뉴스 서비스 인스턴스
-news_service = NewsService()
\ No newline at end of file
+news_service = NewsService()
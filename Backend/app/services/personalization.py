@@ -2,22 +2,152 @@
 개인화 뉴스 필터링 서비스
 사용자 관심사에 따른 맞춤형 뉴스 제공
 """
+import asyncio
 import logging
+import time
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, bindparam, desc, cast, exists, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, TEXT
 
-from app.core.database import get_db
+from app.core.database import async_session
 from app.models.user import User
 from app.models.news import News, NewsCategory
-from app.models.category import Category
 from app.models.company import Company
 from app.models.subscription import UserCategorySubscription, UserCompanySubscription
 from app.schemas.subscription import PersonalizedNewsItem
 
 logger = logging.getLogger(__name__)
 
+# 개인화 결과 캐시 (인메모리 TTL)
+# 같은 사용자·같은 구독 구성이면 일일 창 안에서 결과가 거의 변하지 않으므로
+# 최종 페이로드를 10분간 재사용한다. 크롤링으로 새 뉴스가 저장되면
+# clear_personalization_cache()로 전체 무효화한다.
+_PNEWS_CACHE_TTL = 600.0
+# 크롤링 직후 선계산한 피드는 다음 크롤링 때까지 유효하다 (캐시 무효화로 갱신)
+_PNEWS_PRECOMPUTE_TTL = 24 * 3600.0
+_PNEWS_CACHE_MAX = 512
+_pnews_cache: Dict[str, tuple] = {}
+
+
+def _pnews_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """캐시 조회 (TTL 만료 시 제거 후 None)"""
+    entry = _pnews_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if time.monotonic() >= expires_at:
+        _pnews_cache.pop(key, None)
+        return None
+    return value
+
+
+def _pnews_cache_set(
+    key: str,
+    value: Dict[str, Any],
+    ttl: Optional[float] = None
+) -> None:
+    """캐시 저장 (상한 초과 시 가장 오래된 항목부터 제거)"""
+    while len(_pnews_cache) >= _PNEWS_CACHE_MAX:
+        _pnews_cache.pop(next(iter(_pnews_cache)), None)
+    _pnews_cache[key] = (
+        time.monotonic() + (ttl if ttl is not None else _PNEWS_CACHE_TTL),
+        value,
+    )
+
+
+def clear_personalization_cache() -> None:
+    """개인화 캐시 전체 무효화 (새 뉴스 저장 직후 호출)"""
+    _pnews_cache.clear()
+
+
+# 필터 뉴스 조회의 정적 부분 - 호출마다 13컬럼 select 트리를 새로
+# 조립하지 않도록 모듈 로드 시 한 번만 만든다. 날짜/건수는 바인드
+# 파라미터라 구조가 같은 호출은 SQLAlchemy 컴파일 캐시를 그대로 탄다
+_FILTERED_NEWS_BASE = (
+    select(
+        News.id,
+        News.title,
+        News.summary,
+        News.source_name,
+        News.source_url,
+        News.published_at,
+        News.sentiment_score,
+        News.sentiment_label,
+        News.keywords,
+        News.mentioned_companies,
+        News.category_names,
+        News.is_controversial,
+        News.pros_summary,
+        News.cons_summary,
+    )
+    .where(
+        News.is_active == True,
+        News.is_processed == True,
+        News.published_at >= bindparam("start_date"),
+        News.published_at <= bindparam("end_date"),
+    )
+    .order_by(desc(News.published_at))
+    .limit(bindparam("lim"))
+)
+
+
+# 트렌딩 응답 키 (구체화 뷰/실시간 쿼리의 SELECT 컬럼 순서와 일치해야 한다)
+_TRENDING_KEYS = (
+    "id", "title", "summary", "source_name", "source_url",
+    "published_at", "sentiment_score", "sentiment_label",
+    "is_controversial", "mentioned_companies",
+)
+
+
+def _trending_rows_to_dicts(rows) -> List[Dict[str, Any]]:
+    """튜플 행을 키 상수와 zip으로 묶어 응답 딕셔너리 리스트로 변환"""
+    result = []
+    for row in rows:
+        item = dict(zip(_TRENDING_KEYS, row))
+        item["published_at"] = item["published_at"].isoformat()
+        result.append(item)
+    return result
+
+
+# 아래 두 조회는 서로 독립이라 asyncio.gather로 병렬 실행한다.
+# AsyncSession 하나로는 쿼리를 동시에 실행할 수 없으므로
+# 각각 풀에서 자기 세션을 짧게 빌려 쓴다.
+
+async def _fetch_category_sub_rows(user_ids: List[int]) -> List[tuple]:
+    """사용자들의 활성 카테고리 구독 (user_id, category_id) 조회"""
+    async with async_session() as session:
+        result = await session.execute(
+            select(
+                UserCategorySubscription.user_id,
+                UserCategorySubscription.category_id,
+            ).where(
+                UserCategorySubscription.user_id.in_(user_ids),
+                UserCategorySubscription.is_active == True
+            )
+        )
+        return result.all()
+
+
+async def _fetch_company_sub_rows(user_ids: List[int]) -> List[tuple]:
+    """사용자들의 활성 기업 구독 (user_id, 기업명) 조회"""
+    async with async_session() as session:
+        result = await session.execute(
+            select(
+                UserCompanySubscription.user_id,
+                Company.name,
+            ).join(
+                Company,
+                Company.id == UserCompanySubscription.company_id
+            ).where(
+                UserCompanySubscription.user_id.in_(user_ids),
+                UserCompanySubscription.is_active == True
+            )
+        )
+        return result.all()
+
 
 class PersonalizationService:
     """개인화 뉴스 서비스"""
@@ -26,59 +156,62 @@ class PersonalizationService:
         pass
     
     async def get_personalized_news_for_user(
-        self, 
-        user_id: int, 
-        limit: int = 20, 
+        self,
+        user_id: int,
+        limit: int = 20,
         days: int = 1,
-        db: Session = None
+        db: AsyncSession = None
     ) -> Dict[str, Any]:
         """
         사용자 맞춤형 뉴스 조회
-        
+
         Args:
             user_id: 사용자 ID
             limit: 최대 뉴스 수
             days: 조회 기간 (일)
             db: 데이터베이스 세션
-            
+
         Returns:
             개인화된 뉴스 데이터
         """
-        if not db:
-            db = next(get_db())
-        
+        owns_session = db is None
+        if owns_session:
+            db = async_session()
+
         try:
-            # 사용자 정보 조회
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user:
-                return {"error": "사용자를 찾을 수 없습니다"}
-            
             # 날짜 범위 설정
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
-            
-            # 사용자 구독 정보 조회
-            category_subscriptions = db.query(UserCategorySubscription).filter(
-                UserCategorySubscription.user_id == user_id,
-                UserCategorySubscription.is_active == True
-            ).all()
-            
-            company_subscriptions = db.query(UserCompanySubscription).filter(
-                UserCompanySubscription.user_id == user_id,
-                UserCompanySubscription.is_active == True
-            ).all()
-            
-            subscribed_category_ids = [sub.category_id for sub in category_subscriptions]
-            subscribed_company_ids = [sub.company_id for sub in company_subscriptions]
-            
-            # 구독한 기업명 조회
-            subscribed_company_names = []
-            if subscribed_company_ids:
-                companies = db.query(Company).filter(
-                    Company.id.in_(subscribed_company_ids)
-                ).all()
-                subscribed_company_names = [company.name for company in companies]
-            
+
+            # 사용자 구독 정보 조회 - 서로 독립인 두 쿼리를 병렬 실행
+            # (기업 구독은 Company를 조인해 이름까지 한 번에 가져온다)
+            category_rows, company_rows = await asyncio.gather(
+                _fetch_category_sub_rows([user_id]),
+                _fetch_company_sub_rows([user_id]),
+            )
+            subscribed_category_ids = [row[1] for row in category_rows]
+            subscribed_company_names = [row[1] for row in company_rows]
+
+            # 구독이 하나도 없을 때만 사용자 존재 여부를 별도로 확인
+            # (구독이 있으면 사용자는 반드시 존재하므로 조회를 생략한다)
+            if not subscribed_category_ids and not subscribed_company_names:
+                user = (
+                    await db.execute(select(User.id).where(User.id == user_id))
+                ).first()
+                if not user:
+                    return {"error": "사용자를 찾을 수 없습니다"}
+
+            # 구독 구성이 같으면 캐시된 페이로드 재사용
+            # (키에 구독 해시를 넣어 구독 변경 시 자연스럽게 미스가 난다)
+            subscription_hash = hash(
+                tuple(sorted(subscribed_category_ids))
+                + tuple(sorted(subscribed_company_names))
+            )
+            cache_key = f"pnews:{user_id}:{days}:{limit}:{subscription_hash}"
+            cached = _pnews_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
             # 개인화된 뉴스 조회
             personalized_news = await self._get_filtered_news(
                 db=db,
@@ -89,11 +222,8 @@ class PersonalizationService:
                 limit=limit
             )
             
-            # 카테고리별 분류
-            news_by_category = await self._group_news_by_category(
-                db=db, 
-                news_list=personalized_news
-            )
+            # 카테고리별 분류 (비정규화 배열로 추가 쿼리 없이 처리)
+            news_by_category = self._group_news_by_category(personalized_news)
             
             # 기업별 분류
             news_by_company = await self._group_news_by_company(
@@ -107,7 +237,7 @@ class PersonalizationService:
                 if news.get('is_controversial', False)
             ]
             
-            return {
+            result = {
                 "user_id": user_id,
                 "total_news": len(personalized_news),
                 "news_by_category": news_by_category,
@@ -115,14 +245,130 @@ class PersonalizationService:
                 "controversial_news": controversial_news[:5],  # 최대 5개
                 "generated_at": datetime.now().isoformat()
             }
-            
+            _pnews_cache_set(cache_key, result)
+            return result
+
         except Exception as e:
             logger.error(f"개인화 뉴스 조회 실패 (user_id: {user_id}): {e}")
             return {"error": str(e)}
-    
+
+        finally:
+            if owns_session:
+                await db.close()
+
+    async def get_personalized_news_for_users(
+        self,
+        user_ids: List[int],
+        limit: int = 20,
+        days: int = 1,
+        db: AsyncSession = None,
+        cache_ttl: Optional[float] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        여러 사용자의 맞춤형 뉴스 일괄 조회
+
+        사용자별로 반복되던 구독/기업 조회를 IN 쿼리로 묶어
+        해당 단계의 DB 왕복을 사용자 수와 무관하게 만든다.
+        계산한 페이로드는 사용자별 캐시에도 넣어 이후 단건 조회가
+        캐시 히트로 끝나게 한다.
+
+        Args:
+            user_ids: 사용자 ID 리스트
+            limit: 사용자당 최대 뉴스 수
+            days: 조회 기간 (일)
+            db: 데이터베이스 세션
+            cache_ttl: 캐시 유지 시간 (기본 _PNEWS_CACHE_TTL)
+
+        Returns:
+            user_id를 키로 하는 개인화 뉴스 데이터 딕셔너리
+        """
+        if not user_ids:
+            return {}
+
+        owns_session = db is None
+        if owns_session:
+            db = async_session()
+
+        try:
+            # 날짜 범위 설정
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days)
+
+            # 전체 사용자의 구독 정보를 독립 쿼리 2개로 병렬 일괄 조회
+            category_rows, company_rows = await asyncio.gather(
+                _fetch_category_sub_rows(user_ids),
+                _fetch_company_sub_rows(user_ids),
+            )
+
+            category_ids_by_user: Dict[int, List[int]] = {}
+            for sub_user_id, category_id in category_rows:
+                category_ids_by_user.setdefault(sub_user_id, []).append(category_id)
+
+            company_names_by_user: Dict[int, List[str]] = {}
+            for sub_user_id, company_name in company_rows:
+                company_names_by_user.setdefault(sub_user_id, []).append(company_name)
+
+            results: Dict[int, Dict[str, Any]] = {}
+
+            for user_id in user_ids:
+                subscribed_category_ids = category_ids_by_user.get(user_id, [])
+                subscribed_company_names = company_names_by_user.get(user_id, [])
+
+                personalized_news = await self._get_filtered_news(
+                    db=db,
+                    category_ids=subscribed_category_ids,
+                    company_names=subscribed_company_names,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=limit
+                )
+
+                news_by_category = self._group_news_by_category(personalized_news)
+
+                news_by_company = await self._group_news_by_company(
+                    news_list=personalized_news,
+                    company_names=subscribed_company_names
+                )
+
+                controversial_news = [
+                    news for news in personalized_news
+                    if news.get('is_controversial', False)
+                ]
+
+                result = {
+                    "user_id": user_id,
+                    "total_news": len(personalized_news),
+                    "news_by_category": news_by_category,
+                    "news_by_company": news_by_company,
+                    "controversial_news": controversial_news[:5],  # 최대 5개
+                    "generated_at": datetime.now().isoformat()
+                }
+                results[user_id] = result
+
+                # 단건 조회와 같은 키로 캐시에 적재
+                subscription_hash = hash(
+                    tuple(sorted(subscribed_category_ids))
+                    + tuple(sorted(subscribed_company_names))
+                )
+                _pnews_cache_set(
+                    f"pnews:{user_id}:{days}:{limit}:{subscription_hash}",
+                    result,
+                    ttl=cache_ttl,
+                )
+
+            return results
+
+        except Exception as e:
+            logger.error(f"일괄 개인화 뉴스 조회 실패: {e}")
+            return {user_id: {"error": str(e)} for user_id in user_ids}
+
+        finally:
+            if owns_session:
+                await db.close()
+
     async def _get_filtered_news(
         self,
-        db: Session,
+        db: AsyncSession,
         category_ids: List[int],
         company_names: List[str],
         start_date: datetime,
@@ -131,85 +377,75 @@ class PersonalizationService:
     ) -> List[Dict[str, Any]]:
         """
         필터링된 뉴스 조회
+
+        필요한 컬럼만 담긴 모듈 상수 문장(_FILTERED_NEWS_BASE)에
+        동적 필터만 덧붙인다. ORM 엔티티 하이드레이션 없이 매핑 행을
+        바로 딕셔너리로 쓴다 (content 등 미사용 컬럼 제외).
         """
-        # 기본 뉴스 쿼리
-        query = db.query(News).filter(
-            News.is_active == True,
-            News.is_processed == True,
-            News.published_at >= start_date,
-            News.published_at <= end_date
-        )
-        
+        query = _FILTERED_NEWS_BASE
+
+
         # 카테고리 또는 기업 필터
         filters = []
         
-        # 카테고리 필터
+        # 카테고리 필터 - 외부 쿼리와 독립적으로 만든 상관 EXISTS 서브쿼리.
+        # 기존처럼 조립 중인 쿼리에 join().exists()를 걸면 외부 필터가
+        # 서브쿼리에 중복 포함되어 플래너가 불필요한 조인을 다시 계획한다
         if category_ids:
-            category_filter = query.join(NewsCategory).filter(
-                NewsCategory.category_id.in_(category_ids)
-            ).exists()
+            category_filter = exists().where(
+                and_(
+                    NewsCategory.news_id == News.id,
+                    NewsCategory.category_id.in_(category_ids),
+                )
+            )
             filters.append(category_filter)
         
-        # 기업 필터
+        # 기업 필터 - 이름별 OR 체인 대신 배열 겹침(&&) 단일 조건
+        # GIN 인덱스(ix_news_mentioned_companies)가 한 번의 탐색으로 처리한다
         if company_names:
-            company_conditions = []
-            for company_name in company_names:
-                company_conditions.append(
-                    News.mentioned_companies.any(company_name)
+            filters.append(
+                News.mentioned_companies.op("&&")(
+                    cast(company_names, ARRAY(TEXT))
                 )
-            if company_conditions:
-                filters.append(or_(*company_conditions))
+            )
         
         # 필터 적용
         if filters:
-            query = query.filter(or_(*filters))
-        
-        # 정렬 및 제한
-        news_list = query.order_by(desc(News.published_at)).limit(limit).all()
-        
-        # 딕셔너리로 변환
+            query = query.where(or_(*filters))
+
+        rows = (
+            await db.execute(
+                query,
+                {"start_date": start_date, "end_date": end_date, "lim": limit},
+            )
+        ).mappings().all()
+
+        # 딕셔너리로 변환 (published_at만 ISO 문자열로 바꾼다)
         result = []
-        for news in news_list:
-            result.append({
-                "id": news.id,
-                "title": news.title,
-                "summary": news.summary,
-                "source_name": news.source_name,
-                "source_url": news.source_url,
-                "published_at": news.published_at.isoformat(),
-                "sentiment_score": news.sentiment_score,
-                "sentiment_label": news.sentiment_label,
-                "keywords": news.keywords,
-                "mentioned_companies": news.mentioned_companies,
-                "is_controversial": news.is_controversial,
-                "pros_summary": news.pros_summary,
-                "cons_summary": news.cons_summary
-            })
-        
+        for row in rows:
+            item = dict(row)
+            item["published_at"] = item["published_at"].isoformat()
+            result.append(item)
+
         return result
     
-    async def _group_news_by_category(
-        self, 
-        db: Session, 
+    def _group_news_by_category(
+        self,
         news_list: List[Dict[str, Any]]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         뉴스를 카테고리별로 그룹화
+
+        news.category_names 비정규화 배열이 조회 시 함께 실려 오므로
+        추가 쿼리 없이 파이썬 버킷 정렬로 끝난다.
         """
-        result = {}
-        
+        result = defaultdict(list)
+
         for news in news_list:
-            # 뉴스의 카테고리 조회
-            news_categories = db.query(Category).join(NewsCategory).filter(
-                NewsCategory.news_id == news["id"]
-            ).all()
-            
-            for category in news_categories:
-                if category.name not in result:
-                    result[category.name] = []
-                result[category.name].append(news)
-        
-        return result
+            for category_name in news.get("category_names") or ():
+                result[category_name].append(news)
+
+        return dict(result)
     
     async def _group_news_by_company(
         self,
@@ -218,63 +454,83 @@ class PersonalizationService:
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         뉴스를 기업별로 그룹화
+
+        리스트 멤버십 검사 대신 frozenset 조회를 쓴다. 구독 기업이
+        많아도 기사당 언급 기업 수에만 비례하는 시간으로 끝난다.
         """
-        result = {}
-        
-        for company_name in company_names:
-            result[company_name] = []
-        
+        company_set = frozenset(company_names)
+        result = {company_name: [] for company_name in company_names}
+
         for news in news_list:
-            mentioned_companies = news.get("mentioned_companies", [])
-            if mentioned_companies:
-                for company in mentioned_companies:
-                    if company in company_names:
-                        if company not in result:
-                            result[company] = []
-                        result[company].append(news)
-        
+            for company in news.get("mentioned_companies") or ():
+                if company in company_set:
+                    result[company].append(news)
+
         return result
     
     async def get_trending_news(
         self,
-        db: Session,
+        db: AsyncSession,
         hours: int = 24,
         limit: int = 10
     ) -> List[Dict[str, Any]]:
         """
         트렌딩 뉴스 조회 (조회수, 논쟁성 기준)
+
+        기본 24시간 창은 스케줄러가 10분마다 갱신하는 구체화 뷰
+        (mv_trending_news)에서 읽어 호출마다의 필터/정렬을 없앤다.
+        다른 시간 창이거나 뷰가 없으면 기존 실시간 쿼리로 폴백한다.
         """
+        if hours == 24:
+            try:
+                rows = (
+                    await db.execute(
+                        text(
+                            "SELECT id, title, summary, source_name, source_url, "
+                            "published_at, sentiment_score, sentiment_label, "
+                            "is_controversial, mentioned_companies "
+                            "FROM mv_trending_news LIMIT :limit"
+                        ).bindparams(limit=limit)
+                    )
+                ).all()
+
+                return _trending_rows_to_dicts(rows)
+            except Exception as e:
+                logger.warning(f"트렌딩 뷰 조회 실패, 실시간 쿼리로 폴백: {e}")
+                await db.rollback()
+
         try:
             # 시간 범위 설정
             end_date = datetime.now()
             start_date = end_date - timedelta(hours=hours)
-            
+
             # 트렌딩 뉴스 조회 (논쟁적 뉴스 우선, 최신순)
-            trending_news = db.query(News).filter(
-                News.is_active == True,
-                News.is_processed == True,
-                News.published_at >= start_date
-            ).order_by(
-                desc(News.is_controversial),
-                desc(News.published_at)
-            ).limit(limit).all()
-            
-            result = []
-            for news in trending_news:
-                result.append({
-                    "id": news.id,
-                    "title": news.title,
-                    "summary": news.summary,
-                    "source_name": news.source_name,
-                    "source_url": news.source_url,
-                    "published_at": news.published_at.isoformat(),
-                    "sentiment_score": news.sentiment_score,
-                    "sentiment_label": news.sentiment_label,
-                    "is_controversial": news.is_controversial,
-                    "mentioned_companies": news.mentioned_companies
-                })
-            
-            return result
+            # _TRENDING_KEYS 순서대로 컬럼만 골라 튜플 행으로 받는다
+            rows = (
+                await db.execute(
+                    select(
+                        News.id,
+                        News.title,
+                        News.summary,
+                        News.source_name,
+                        News.source_url,
+                        News.published_at,
+                        News.sentiment_score,
+                        News.sentiment_label,
+                        News.is_controversial,
+                        News.mentioned_companies,
+                    ).where(
+                        News.is_active == True,
+                        News.is_processed == True,
+                        News.published_at >= start_date
+                    ).order_by(
+                        desc(News.is_controversial),
+                        desc(News.published_at)
+                    ).limit(limit)
+                )
+            ).all()
+
+            return _trending_rows_to_dicts(rows)
             
         except Exception as e:
             logger.error(f"트렌딩 뉴스 조회 실패: {e}")
@@ -287,10 +543,10 @@ personalization_service = PersonalizationService()
 
 # 편의 함수
 async def get_personalized_news_for_user(
-    user_id: int, 
-    limit: int = 20, 
+    user_id: int,
+    limit: int = 20,
     days: int = 1,
-    db: Session = None
+    db: AsyncSession = None
 ) -> Dict[str, Any]:
     """사용자 개인화 뉴스 조회 편의 함수"""
     return await personalization_service.get_personalized_news_for_user(
@@ -301,17 +557,80 @@ async def get_personalized_news_for_user(
     )
 
 
+async def get_personalized_news_for_users(
+    user_ids: List[int],
+    limit: int = 20,
+    days: int = 1,
+    db: AsyncSession = None
+) -> Dict[int, Dict[str, Any]]:
+    """여러 사용자 개인화 뉴스 일괄 조회 편의 함수"""
+    return await personalization_service.get_personalized_news_for_users(
+        user_ids=user_ids,
+        limit=limit,
+        days=days,
+        db=db
+    )
+
+
+async def precompute_personalized_feeds(
+    limit: int = 20,
+    days: int = 1,
+    batch_size: int = 200
+) -> int:
+    """
+    활성 사용자 개인화 피드 선계산 편의 함수
+
+    크롤링·AI 처리가 끝난 직후 호출해 활성 사용자의 페이로드를 미리
+    계산해 캐시에 올린다. 피드는 다음 크롤링까지 변하지 않으므로
+    이후의 요청과 이메일 발송은 캐시 조회로 끝난다.
+
+    Returns:
+        선계산된 사용자 수
+    """
+    async with async_session() as db:
+        user_ids = [
+            row[0]
+            for row in (
+                await db.execute(
+                    select(User.id).where(
+                        User.is_active == True,
+                        User.email_notifications_enabled == True
+                    )
+                )
+            ).all()
+        ]
+
+    precomputed = 0
+    for start in range(0, len(user_ids), batch_size):
+        chunk = user_ids[start:start + batch_size]
+        results = await personalization_service.get_personalized_news_for_users(
+            user_ids=chunk,
+            limit=limit,
+            days=days,
+            cache_ttl=_PNEWS_PRECOMPUTE_TTL,
+        )
+        precomputed += sum(
+            1 for payload in results.values() if "error" not in payload
+        )
+    return precomputed
+
+
 async def get_trending_news(
     hours: int = 24,
     limit: int = 10,
-    db: Session = None
+    db: AsyncSession = None
 ) -> List[Dict[str, Any]]:
     """트렌딩 뉴스 조회 편의 함수"""
-    if not db:
-        db = next(get_db())
-    
-    return await personalization_service.get_trending_news(
-        db=db,
-        hours=hours,
-        limit=limit
-    )
\ No newline at end of file
+    if db is not None:
+        return await personalization_service.get_trending_news(
+            db=db,
+            hours=hours,
+            limit=limit
+        )
+
+    async with async_session() as session:
+        return await personalization_service.get_trending_news(
+            db=session,
+            hours=hours,
+            limit=limit
+        )
\ No newline at end of file
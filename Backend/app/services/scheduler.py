@@ -21,6 +21,7 @@ from datetime import datetime, time
 from typing import List
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from app.services.crawler import run_news_crawling
 from app.services.ai_processor import process_unprocessed_news
@@ -34,7 +35,15 @@ class NewsScheduler:
     """뉴스 수집 스케줄러"""
     
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
+        # 크롤링/발송이 길어져도 다음 발화와 겹쳐 실행되지 않도록
+        # 기본값으로 단일 인스턴스 + 미실행분 병합을 강제한다
+        self.scheduler = AsyncIOScheduler(
+            job_defaults={
+                'coalesce': True,
+                'max_instances': 1,
+                'misfire_grace_time': 300,
+            }
+        )
         self.is_running = False
     
     def start(self):
@@ -61,14 +70,26 @@ class NewsScheduler:
             replace_existing=True
         )
         
+        # 매 10분마다 트렌딩 구체화 뷰 갱신
+        self.scheduler.add_job(
+            self.refresh_trending_view,
+            CronTrigger(minute='*/10'),  # 매 10분
+            id='trending_refresh',
+            name='트렌딩 뉴스 뷰 갱신',
+            replace_existing=True
+        )
+
         # 테스트용: 매 10분마다 실행 (개발 중에만 사용)
+        # 지터를 줘서 여러 개발 서버 인스턴스가 동시에 쏟아지지 않게 한다
         if settings.ENVIRONMENT == "development":
             self.scheduler.add_job(
                 self.test_crawl,
-                CronTrigger(minute='*/10'),  # 매 10분
+                IntervalTrigger(minutes=10, jitter=60),
                 id='test_crawling',
                 name='테스트 크롤링',
-                replace_existing=True
+                replace_existing=True,
+                coalesce=True,
+                max_instances=1
             )
         
         self.scheduler.start()
@@ -103,11 +124,16 @@ class NewsScheduler:
                 return
             
             logger.info(f"뉴스 크롤링 완료: {crawl_result['saved_count']}개 저장")
-            
+
+            # 새 뉴스가 저장되었으므로 개인화 캐시 무효화
+            if crawl_result['saved_count']:
+                from app.services.personalization import clear_personalization_cache
+                clear_personalization_cache()
+
             # 2. AI 처리 (요약, 감정분석) - 백그라운드에서 진행
             asyncio.create_task(self._process_ai_analysis())
             
-            logger.info(f"=== 뉴스 크롤링 완료 (소요시간: {crawl_result['duration_seconds']:.1f}초) ===")
+            logger.info(f"=== 뉴스 크롤링 완료 (소요시간: {crawl_result['duration_us'] / 1_000_000:.1f}초) ===")
             
         except Exception as e:
             logger.error(f"뉴스 크롤링 중 오류 발생: {e}")
@@ -122,6 +148,12 @@ class NewsScheduler:
             
             if result["success"]:
                 logger.info(f"=== AI 분석 완료 (처리: {result['processed_count']}개) ===")
+
+                # 분석까지 끝난 시점에 활성 사용자의 개인화 피드를 선계산
+                # (19:00 이메일 발송과 이후 요청이 캐시 조회로 끝난다)
+                from app.services.personalization import precompute_personalized_feeds
+                precomputed = await precompute_personalized_feeds()
+                logger.info(f"개인화 피드 선계산 완료: {precomputed}명")
             else:
                 logger.error(f"AI 분석 실패: {result.get('error')}")
             
@@ -154,6 +186,22 @@ class NewsScheduler:
         except Exception as e:
             logger.error(f"이메일 발송 중 오류: {e}")
     
+    async def refresh_trending_view(self):
+        """트렌딩 구체화 뷰 갱신 (CONCURRENTLY - 조회를 막지 않음)"""
+        try:
+            from sqlalchemy import text
+            from app.core.database import async_session
+
+            async with async_session() as db:
+                await db.execute(
+                    text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_trending_news")
+                )
+                await db.commit()
+            logger.info("트렌딩 뉴스 뷰가 갱신되었습니다.")
+
+        except Exception as e:
+            logger.error(f"트렌딩 뉴스 뷰 갱신 실패: {e}")
+
     async def test_crawl(self):
         """테스트용 크롤링 (개발 환경에서만 실행)"""
         try:
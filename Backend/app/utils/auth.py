@@ -11,12 +11,21 @@
 """
 JWT 토큰 검증을 위한 인증 유틸리티
 """
+import base64
+import hashlib
 import jwt
-from datetime import datetime, timezone
+import threading
+import time
+import httpx
 from typing import Optional, Dict, Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - requirements.txt에 포함돼 있음
+    orjson = None
 from fastapi import HTTPException, status
 from app.core.config import settings
-from app.utils.supabase_client import supabase_admin_client
+from app.utils.supabase_client import get_supabase_admin_client
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,34 +34,231 @@ class AuthError(Exception):
     """인증 관련 예외"""
     pass
 
+# user_metadata 부재 시 기본값 (호출마다 빈 dict를 새로 만들지 않음)
+_EMPTY_METADATA: Dict[str, Any] = {}
+
+# 검증 결과 캐시 - 같은 베어러 토큰은 수명(보통 5~60분) 동안 매 요청
+# 재사용되므로, 서명 검증과 클레임 파싱을 토큰당 한 번으로 줄인다.
+# 키는 원문 토큰 대신 SHA-256 다이제스트를 써서 힙에 비밀이 평문으로
+# 남지 않게 하고, 항목은 토큰 만료 시각까지만 유지한다. 실패는 캐시하지 않는다.
+_TOKEN_CACHE_MAX = 4096
+_TOKEN_CACHE_MAX_TTL = 3600.0  # 초
+_token_cache: Dict[bytes, tuple] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    """캐시 조회 (만료된 항목은 제거 후 None)"""
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.time() >= expires_at:
+            _token_cache.pop(key, None)
+            return None
+        return value
+
+
+def _token_cache_set(key: bytes, value: Dict[str, Any], exp: float) -> None:
+    """캐시 저장 (만료 시각 상한 적용, 상한 초과 시 오래된 항목 제거)"""
+    expires_at = min(exp, time.time() + _TOKEN_CACHE_MAX_TTL)
+    if expires_at <= time.time():
+        return
+    with _token_cache_lock:
+        while len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.pop(next(iter(_token_cache)), None)
+        _token_cache[key] = (expires_at, value)
+
+
+# 이메일 사용자 조회 캐시 - 같은 세션에서 반복되는 관리자 REST 호출을
+# 합친다. 결과에 last_sign_in이 포함되므로 TTL은 짧게 유지한다.
+# 미존재(None)는 직후 가입 시 낡은 결과가 남지 않도록 캐시하지 않는다.
+_USER_EMAIL_CACHE_TTL = 60.0  # 초
+_USER_EMAIL_CACHE_MAX = 2048
+_user_email_cache: Dict[str, tuple] = {}
+_user_email_cache_lock = threading.Lock()
+
+
+def _user_email_cache_get(email: str) -> Optional[Dict[str, Any]]:
+    """캐시 조회 (만료된 항목은 제거 후 None)"""
+    with _user_email_cache_lock:
+        entry = _user_email_cache.get(email)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.time() >= expires_at:
+            _user_email_cache.pop(email, None)
+            return None
+        return value
+
+
+def _user_email_cache_set(email: str, value: Dict[str, Any]) -> None:
+    """캐시 저장 (상한 초과 시 오래된 항목부터 제거)"""
+    with _user_email_cache_lock:
+        while len(_user_email_cache) >= _USER_EMAIL_CACHE_MAX:
+            _user_email_cache.pop(next(iter(_user_email_cache)), None)
+        _user_email_cache[email] = (time.time() + _USER_EMAIL_CACHE_TTL, value)
+
+
+# JWKS 공개키 캐시 (요청마다 원격 조회하지 않고 로컬 서명 검증에 사용)
+_JWKS_TTL = 3600.0  # 초
+_jwks_cache: Dict[str, Any] = {}
+_jwks_fetched_at = 0.0
+
+
+def _get_jwks_key(kid: Optional[str]):
+    """kid에 해당하는 JWKS 공개키 조회 (TTL 경과 또는 미지의 kid면 갱신)"""
+    global _jwks_fetched_at
+
+    if not kid or not settings.SUPABASE_URL:
+        return None
+
+    now = time.time()
+    if kid in _jwks_cache and now - _jwks_fetched_at < _JWKS_TTL:
+        return _jwks_cache[kid]
+
+    try:
+        response = httpx.get(
+            f"{settings.SUPABASE_URL}/auth/v1/.well-known/jwks.json",
+            timeout=5.0
+        )
+        response.raise_for_status()
+
+        for jwk_data in response.json().get("keys", []):
+            _jwks_cache[jwk_data["kid"]] = jwt.PyJWK(jwk_data).key
+        _jwks_fetched_at = now
+    except Exception as e:
+        logger.warning(f"JWKS 갱신 실패: {e}")
+
+    return _jwks_cache.get(kid)
+
+
+def _unverified_claims(token: str) -> Dict[str, Any]:
+    """
+    서명 검증 없이 페이로드 클레임만 파싱 (사전 만료 검사용)
+
+    orjson이 있으면 페이로드 세그먼트를 직접 base64 디코드해 stdlib json보다
+    수 배 빠르게 파싱하고, 없으면 PyJWT의 무검증 decode로 폴백한다.
+    user_metadata가 큰 Supabase 토큰에서 차이가 크다.
+
+    Raises:
+        AuthError: 토큰 형식이 잘못된 경우
+    """
+    if orjson is not None:
+        try:
+            payload_b64 = token.split(".", 2)[1]
+            padded = payload_b64 + "=" * (-len(payload_b64) % 4)
+            return orjson.loads(base64.urlsafe_b64decode(padded))
+        except (IndexError, ValueError):
+            raise AuthError("유효하지 않은 토큰입니다")
+
+    try:
+        return jwt.decode(token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        raise AuthError("유효하지 않은 토큰입니다")
+
+
+def _verify_token_offline(token: str) -> Optional[Dict[str, Any]]:
+    """
+    네트워크 왕복 없이 로컬에서 토큰 서명 검증
+
+    HS256은 설정된 JWT 시크릿으로, RS256은 캐시된 JWKS 공개키로 검증한다.
+    로컬 검증이 불가능한 경우(키 없음 등) None을 반환해
+    기존 원격 검증 경로로 폴백한다.
+
+    Raises:
+        AuthError: 서명이 틀리거나 만료된 토큰인 경우
+    """
+    try:
+        header = jwt.get_unverified_header(token)
+    except jwt.InvalidTokenError:
+        raise AuthError("유효하지 않은 토큰입니다")
+
+    algorithm = header.get("alg")
+
+    try:
+        if algorithm == "HS256" and settings.SUPABASE_JWT_SECRET:
+            return jwt.decode(
+                token,
+                settings.SUPABASE_JWT_SECRET,
+                algorithms=["HS256"],
+                audience="authenticated",
+                options={"require": ["exp", "sub"]}
+            )
+
+        if algorithm == "RS256":
+            key = _get_jwks_key(header.get("kid"))
+            if key is not None:
+                return jwt.decode(
+                    token,
+                    key,
+                    algorithms=["RS256"],
+                    audience="authenticated",
+                    options={"require": ["exp", "sub"]}
+                )
+    except jwt.ExpiredSignatureError:
+        raise AuthError("만료된 토큰입니다")
+    except jwt.InvalidTokenError:
+        raise AuthError("유효하지 않은 토큰입니다")
+
+    return None
+
+
 def verify_supabase_token(token: str) -> Dict[str, Any]:
     """
     Supabase JWT 토큰 검증
-    
+
     Args:
         token: JWT 토큰 문자열
-        
+
     Returns:
         토큰 페이로드 (사용자 정보 포함)
-        
+
     Raises:
         AuthError: 토큰이 유효하지 않은 경우
     """
+    # 같은 토큰을 이미 검증했다면 서명 검증 없이 결과 재사용
+    cache_key = hashlib.sha256(token.encode()).digest()
+    cached = _token_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # 서명 검증 전에 형식과 만료만 싸게 선별한다 - 깨졌거나 이미 만료된
+    # 토큰에 HMAC/RSA 연산을 쓰지 않기 위한 사전 필터
+    unverified = _unverified_claims(token)
+    if float(unverified.get("exp", 0)) < time.time():
+        raise AuthError("만료된 토큰입니다")
+
+    # 로컬 서명 검증 우선 (요청마다 Supabase 왕복 제거)
+    claims = _verify_token_offline(token)
+    if claims is not None:
+        user_metadata = claims.get("user_metadata") or {}
+        result = {
+            "user_id": claims.get("sub"),
+            "email": claims.get("email"),
+            "email_confirmed": bool(user_metadata.get("email_verified", False)),
+            "user_metadata": user_metadata,
+            "app_metadata": claims.get("app_metadata") or {},
+            # 액세스 토큰 클레임에는 없는 필드 (필요 시 별도 조회)
+            "created_at": None,
+            "last_sign_in": None
+        }
+        _token_cache_set(cache_key, result, float(claims.get("exp", 0)))
+        return result
+
     try:
         # Supabase에서 토큰 검증
-        response = supabase_admin_client.auth.get_user(token)
+        response = get_supabase_admin_client().auth.get_user(token)
         
         if not response.user:
             raise AuthError("유효하지 않은 토큰입니다")
             
         user = response.user
-        
-        # 토큰 만료 확인
-        if user.expires_at:
-            expires_at = datetime.fromisoformat(user.expires_at.replace('Z', '+00:00'))
-            if expires_at < datetime.now(timezone.utc):
-                raise AuthError("만료된 토큰입니다")
-        
+
+        # 만료는 위에서 JWT exp 클레임(Unix 초)과 time.time() 비교로 이미
+        # 확인했다 - expires_at 문자열을 datetime으로 파싱할 필요가 없다
+
         return {
             "user_id": user.id,
             "email": user.email,
@@ -84,14 +290,20 @@ def extract_token_from_header(authorization: Optional[str]) -> str:
     """
     if not authorization:
         raise AuthError("Authorization 헤더가 없습니다")
-    
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise AuthError("Bearer 토큰이 아닙니다")
-        return token
-    except ValueError:
+
+    # 압도적 다수인 "Bearer " 접두사를 먼저 검사한다
+    # (split() 리스트 할당과 전체 문자열 소문자 변환 없이 분기 한 번)
+    if authorization.startswith("Bearer "):
+        token = authorization[7:].strip()
+    elif authorization[:7].lower() == "bearer ":
+        # 대소문자가 다른 드문 경우 폴백
+        token = authorization[7:].strip()
+    else:
+        raise AuthError("Bearer 토큰이 아닙니다")
+
+    if not token or " " in token:
         raise AuthError("잘못된 Authorization 헤더 형식입니다")
+    return token
 
 def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
     """
@@ -103,23 +315,50 @@ def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
     Returns:
         사용자 정보 또는 None
     """
+    cached = _user_email_cache_get(email)
+    if cached is not None:
+        return cached
+
+    def _to_dict(user) -> Dict[str, Any]:
+        result = {
+            "user_id": user.id,
+            "email": user.email,
+            "email_confirmed": user.email_confirmed_at is not None,
+            "created_at": user.created_at,
+            "last_sign_in": user.last_sign_in_at,
+            "user_metadata": user.user_metadata
+        }
+        _user_email_cache_set(email, result)
+        return result
+
     try:
-        response = supabase_admin_client.auth.admin.list_users()
-        
-        if response.users:
-            for user in response.users:
+        admin = get_supabase_admin_client().auth.admin
+
+        # 서버 측 이메일 필터 지원 버전이면 단건 조회로 끝낸다
+        try:
+            response = admin.list_users(
+                page=1, per_page=1, filter=f"email.eq.{email}"
+            )
+            users = getattr(response, "users", response) or []
+            return _to_dict(users[0]) if users else None
+        except TypeError:
+            # 구버전 gotrue에는 filter 파라미터가 없다 - 아래 페이지 스캔으로 폴백
+            pass
+
+        # 전체를 한 번에 받아 선형 탐색하는 대신 페이지 단위로 받아
+        # 찾는 즉시 반환한다 (최악의 경우에도 메모리는 페이지 크기로 제한)
+        page = 1
+        per_page = 200
+        while True:
+            response = admin.list_users(page=page, per_page=per_page)
+            users = getattr(response, "users", response) or []
+            for user in users:
                 if user.email == email:
-                    return {
-                        "user_id": user.id,
-                        "email": user.email,
-                        "email_confirmed": user.email_confirmed_at is not None,
-                        "created_at": user.created_at,
-                        "last_sign_in": user.last_sign_in_at,
-                        "user_metadata": user.user_metadata
-                    }
-        
-        return None
-        
+                    return _to_dict(user)
+            if len(users) < per_page:
+                return None
+            page += 1
+
     except Exception as e:
         logger.error(f"사용자 조회 중 오류 발생: {e}")
         return None
@@ -136,12 +375,13 @@ def create_or_update_local_user(supabase_user: Dict[str, Any]) -> Dict[str, Any]
     """
     # TODO: 실제 데이터베이스 연동 시 구현
     # 현재는 Supabase 사용자 정보를 그대로 반환
+    metadata = supabase_user.get("user_metadata") or _EMPTY_METADATA
     return {
         "id": supabase_user["user_id"],
         "supabase_id": supabase_user["user_id"],
         "email": supabase_user["email"],
-        "display_name": supabase_user.get("user_metadata", {}).get("full_name", ""),
-        "avatar_url": supabase_user.get("user_metadata", {}).get("avatar_url", ""),
+        "display_name": metadata.get("full_name", ""),
+        "avatar_url": metadata.get("avatar_url", ""),
         "is_active": True,
         "email_notifications_enabled": True
     }
\ No newline at end of file
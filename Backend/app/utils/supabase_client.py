@@ -7,46 +7,76 @@
 # - `get_supabase_admin_client`: 'service_role' 키를 사용하여 모든 권한을 가진 관리자용
 #                                클라이언트를 생성합니다. 사용자의 권한을 넘어서는
 #                                백엔드 내부 작업(예: 사용자 정보 조회)에 사용됩니다.
-# - 생성된 클라이언트는 전역 변수 `supabase_client`와 `supabase_admin_client`에 할당되어
-#   다른 모듈에서 쉽게 가져와 사용할 수 있습니다.
+# - 두 팩토리는 lru_cache 싱글턴이라 몇 번을 호출해도 클라이언트는
+#   프로세스당 한 번만 생성되며, 첫 호출 시점까지 생성이 지연됩니다.
 
 """
 Supabase 클라이언트 구성 및 유틸리티
 """
+from functools import lru_cache
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _client_options() -> ClientOptions:
+    """
+    공용 클라이언트 옵션
+
+    기본값(무기한에 가까운 대기) 대신 명시적 타임아웃을 줘서 Supabase
+    응답 지연 시 소켓과 워커가 매달려 커넥션이 고갈되지 않게 한다.
+    """
+    return ClientOptions(
+        postgrest_client_timeout=30,
+        storage_client_timeout=30,
+    )
+
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """
-    Supabase 클라이언트 인스턴스 생성
+    Supabase 클라이언트 싱글턴 반환 (첫 호출 시 생성)
     """
     try:
         supabase: Client = create_client(
             supabase_url=settings.SUPABASE_URL,
-            supabase_key=settings.SUPABASE_KEY
+            supabase_key=settings.SUPABASE_KEY,
+            options=_client_options()
         )
         return supabase
     except Exception as e:
         logger.error(f"Supabase 클라이언트 생성 실패: {e}")
         raise
 
+@lru_cache(maxsize=1)
 def get_supabase_admin_client() -> Client:
     """
-    Supabase 관리자 클라이언트 인스턴스 생성 (service_role 키 사용)
+    Supabase 관리자 클라이언트 싱글턴 반환 (service_role 키 사용)
     """
     try:
         supabase: Client = create_client(
             supabase_url=settings.SUPABASE_URL,
-            supabase_key=settings.SUPABASE_SERVICE_KEY
+            supabase_key=settings.SUPABASE_SERVICE_KEY,
+            options=_client_options()
         )
         return supabase
     except Exception as e:
         logger.error(f"Supabase 관리자 클라이언트 생성 실패: {e}")
         raise
 
-# 글로벌 클라이언트 인스턴스
-supabase_client = get_supabase_client()
-supabase_admin_client = get_supabase_admin_client()
\ No newline at end of file
+
+def __getattr__(name):
+    """
+    구 전역 이름에 대한 지연 접근 (PEP 562)
+
+    `from app.utils.supabase_client import supabase_client` 형태의 기존
+    임포트를 깨지 않으면서, 클라이언트 생성(소켓/키 검증)은 임포트 시점이
+    아니라 실제 첫 사용 시점으로 미룬다.
+    """
+    if name == "supabase_client":
+        return get_supabase_client()
+    if name == "supabase_admin_client":
+        return get_supabase_admin_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -49,27 +49,38 @@ async def test_ai_service(news_items):
         return
     
     print("\n=== AI 서비스 테스트 시작 ===")
-    
-    for i, item in enumerate(news_items):
-        print(f"\n[{i+1}] 뉴스 AI 처리 중: {item.title[:50]}...")
-        
-        try:
-            result = await ai_service.process_news_article(
+
+    # 독립적인 Gemini 호출이므로 순차 대기 대신 동시 5건으로 팬아웃
+    # (전체 소요가 latency 합계에서 배치 최대값으로 줄어든다)
+    sem = asyncio.Semaphore(5)
+
+    async def process_one(item):
+        async with sem:
+            return await ai_service.process_news_article(
                 title=item.title,
                 content=item.content,
                 category=item.category
             )
-            
-            print(f"    AI 요약: {result.ai_summary}")
-            print(f"    감정 분석: {result.sentiment_label} (점수: {result.sentiment_score})")
-            print(f"    찬반 정리: {result.pros_and_cons or '없음'}")
-            print(f"    처리 시간: {result.processing_time:.2f}초")
-            
-            if result.error:
-                print(f"    오류: {result.error}")
-                
-        except Exception as e:
-            print(f"    AI 처리 오류: {e}")
+
+    results = await asyncio.gather(
+        *(process_one(item) for item in news_items),
+        return_exceptions=True
+    )
+
+    for i, (item, result) in enumerate(zip(news_items, results)):
+        print(f"\n[{i+1}] 뉴스 AI 처리: {item.title[:50]}...")
+
+        if isinstance(result, Exception):
+            print(f"    AI 처리 오류: {result}")
+            continue
+
+        print(f"    AI 요약: {result.ai_summary}")
+        print(f"    감정 분석: {result.sentiment_label} (점수: {result.sentiment_score})")
+        print(f"    찬반 정리: {result.pros_and_cons or '없음'}")
+        print(f"    처리 시간: {result.processing_time:.2f}초")
+
+        if result.error:
+            print(f"    오류: {result.error}")
 
 
 async def test_scheduler():